@@ -1,9 +1,15 @@
 import requests
 import allure
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urljoin
 from typing import Dict, List, Optional
 from configuration.ConfigProvider import ConfigProvider
 from testdata.DataProvider import DataProvider
 
+session = requests.Session()
+session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+"""Общая HTTP-сессия с пулом соединений; cookies не сохраняются, чтобы запросы оставались независимыми."""
+
 
 class CartApi:
     """
@@ -15,10 +21,21 @@ class CartApi:
         """Инициализация: Устанавливается URL корзины и заголовки для авторизации."""
         self.cart_url = ConfigProvider().get("api", "cart_url")
         self.headers = {
-            "Authorization": DataProvider().get("token"),
+            "Authorization": DataProvider().get_token(),
             "User-Agent": ""
         }
 
+    def warm_up(self) -> None:
+        """
+        Заранее устанавливает соединение с API (DNS, TCP, TLS), чтобы первый запрос теста не тратил на это время.
+
+        Ошибки соединения игнорируются: при недоступности API их покажут сами тесты.
+        """
+        try:
+            session.head(self.cart_url, headers=self.headers, timeout=10)
+        except requests.RequestException:
+            pass
+
     @allure.step("Просмотр содержимого корзины")
     def view_cart_contents(self) -> requests.Response:
         """
@@ -26,7 +43,7 @@ class CartApi:
 
         :return: Response – объект ответа с текущим состоянием корзины.
         """
-        response = requests.get(self.cart_url, headers=self.headers)
+        response = session.get(self.cart_url, headers=self.headers)
 
         allure.attach(
             response.text,
@@ -46,7 +63,7 @@ class CartApi:
         payload = {
             "id": product_id
         }
-        response = requests.post(
+        response = session.post(
             self.cart_url + "/product", json=payload, headers=self.headers)
 
         allure.attach(
@@ -69,7 +86,7 @@ class CartApi:
         :param cart_product_id: int – id товара в корзине.
         :return: Response – объект ответа.
         """
-        response = requests.delete(
+        response = session.delete(
             self.cart_url +
             "/product/" +
             f"{cart_product_id}",
@@ -89,7 +106,7 @@ class CartApi:
 
         :return: Response – объект ответа.
         """
-        response = requests.delete(self.cart_url, headers=self.headers)
+        response = session.delete(self.cart_url, headers=self.headers)
 
         allure.attach(
             response.text,
@@ -140,7 +157,7 @@ class CartApi:
                 "quantity": quantity
             }
         ]
-        response = requests.put(
+        response = session.put(
             self.cart_url, json=payload, headers=self.headers)
 
         allure.attach(
@@ -178,7 +195,7 @@ class CartApi:
         payload = {
             "id": product_id
         }
-        response = requests.post(
+        response = session.post(
             self.cart_url + "/product", json=payload, headers=headers)
 
         allure.attach(
@@ -205,7 +222,7 @@ class CartApi:
             "Authorization": "",
             "User-Agent": ""
         }
-        response = requests.delete(
+        response = session.delete(
             self.cart_url +
             "/product/" +
             f"{cart_product_id}",
@@ -225,13 +242,13 @@ class CartApi:
 
         :return: int – id товара.
         """
-        url = "https://web-gate.chitai-gorod.ru/api/v2/products-top"
+        url = urljoin(self.cart_url, "/api/v2/products-top")
         my_params = {
             "topCount": 200,
             "resultCount": 1,
             "include": "productTexts,publisher,publisherBrand,publisherSeries,dates,literatureWorkCycle,rating"
         }
-        response = requests.get(url, params=my_params, headers=self.headers)
+        response = session.get(url, params=my_params, headers=self.headers)
 
         allure.attach(
             response.text,
@@ -239,3 +256,41 @@ class CartApi:
             attachment_type=allure.attachment_type.JSON)
 
         return response.json()["data"][0]["attributes"]["id"]
+
+    @allure.step("Получение {count} случайных id товаров из топ-200")
+    def get_random_ids(self, count: int, max_attempts: int = 5) -> List[int]:
+        """
+        Метод получает несколько неповторяющихся случайных id товаров из топ-200.
+
+        Сервис может вернуть один и тот же товар несколько раз, поэтому недостающие id запрашиваются повторно,
+        пока не наберётся нужное количество.
+
+        :param count: int – количество id товаров.
+        :param max_attempts: int – максимальное количество запросов.
+        :return: List[int] – список из count неповторяющихся id товаров.
+
+        raise RuntimeError: Если за max_attempts запросов не удалось набрать count неповторяющихся id.
+        """
+        url = urljoin(self.cart_url, "/api/v2/products-top")
+        product_ids = {}
+        for _ in range(max_attempts):
+            my_params = {
+                "topCount": 200,
+                "resultCount": count - len(product_ids),
+                "include": "productTexts,publisher,publisherBrand,publisherSeries,dates,literatureWorkCycle,rating"
+            }
+            response = session.get(url, params=my_params, headers=self.headers)
+
+            allure.attach(
+                response.text,
+                name="Response",
+                attachment_type=allure.attachment_type.JSON)
+
+            product_ids.update(dict.fromkeys(
+                product["attributes"]["id"] for product in response.json()["data"]))
+            if len(product_ids) >= count:
+                return list(product_ids)[:count]
+
+        raise RuntimeError(
+            f"Не удалось получить {count} неповторяющихся id товаров за {max_attempts} запросов "
+            f"(получено {len(product_ids)})")
@@ -0,0 +1,97 @@
+import json
+import requests
+import allure
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from configuration.ConfigProvider import ConfigProvider
+
+
+class ProductTitleParser(HTMLParser):
+    """Парсер HTML, извлекающий текст заголовка h1[itemprop='name'] со страницы товара."""
+
+    def __init__(self) -> None:
+        """Инициализация парсера с пустым названием товара."""
+        super().__init__()
+        self.title = None
+        self._inside_title = False
+        self._chunks = []
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag == "h1" and ("itemprop", "name") in attrs and self.title is None:
+            self._inside_title = True
+
+    def handle_data(self, data) -> None:
+        if self._inside_title:
+            self._chunks.append(data)
+
+    def handle_endtag(self, tag) -> None:
+        if tag == "h1" and self._inside_title:
+            self._inside_title = False
+            self.title = " ".join("".join(self._chunks).split())
+
+
+class ProductPageApi:
+    """
+    Класс предоставляет методы для получения страниц товаров по HTTP без участия браузера.
+
+    Страницы загружаются параллельно через общий пул соединений, название товара извлекается из HTML-разметки.
+    """
+
+    def __init__(self, user_agent: str = "") -> None:
+        """
+        Инициализация: Создаётся HTTP-сессия с пулом соединений по числу потоков загрузки.
+
+        :param user_agent: str: Заголовок User-Agent, с которым выполняются запросы.
+        """
+        self.max_workers = ConfigProvider().get_int("ui", "product_fetch_workers")
+        self.timeout = ConfigProvider().get_int("ui", "product_fetch_timeout")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent})
+
+    def get_product_title(self, product_link: str) -> Optional[str]:
+        """
+        Загружает страницу товара и извлекает его название.
+
+        :param product_link: str: Ссылка на страницу товара.
+        :return: str/None: Название товара либо None, если страницу не удалось загрузить
+                 или название формируется только JavaScript-кодом на стороне браузера.
+        """
+        try:
+            response = self.session.get(product_link, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+
+        if response.status_code != 200:
+            return None
+
+        parser = ProductTitleParser()
+        parser.feed(response.text)
+        return parser.title
+
+    @allure.step("Параллельное получение названий товаров с их страниц по HTTP")
+    def get_product_titles(
+            self, product_links: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Параллельно загружает страницы товаров и извлекает их названия.
+
+        :param product_links: List[str]: Список ссылок на страницы товаров.
+        :return: Dict[str, Optional[str]]: Словарь "ссылка – название товара" (None, если название не получено).
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            titles = list(executor.map(self.get_product_title, product_links))
+
+        product_titles = dict(zip(product_links, titles))
+
+        allure.attach(
+            json.dumps(product_titles, ensure_ascii=False, indent=2),
+            name="Product Titles",
+            attachment_type=allure.attachment_type.JSON)
+
+        return product_titles
@@ -0,0 +1,144 @@
+import json
+import requests
+import allure
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, List, Optional
+from configuration.ConfigProvider import ConfigProvider
+from testdata.DataProvider import DataProvider
+from testdata.SearchCorpus import SearchCase
+from API.text_matching import MATCH_EXACT, classify_match
+
+MAX_FAILURES = 100
+"""Максимальное количество неуспешных запросов, сохраняемых в сводке прогона корпуса."""
+
+
+class SearchApi:
+    """
+    Класс предоставляет методы для выполнения поисковых запросов по HTTP без участия браузера
+    и для проверки качества поиска на корпусе запросов (см. SearchCorpus).
+    """
+
+    def __init__(self) -> None:
+        """Инициализация: Создаётся HTTP-сессия с пулом соединений по числу потоков поиска."""
+        self.search_url = ConfigProvider().get("search", "search_url")
+        self.page_size = ConfigProvider().get_int("search", "search_page_size")
+        self.max_workers = ConfigProvider().get_int("search", "search_workers")
+        self.match_threshold = ConfigProvider().get_float("search", "match_threshold") or None
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": DataProvider().get_token(),
+            "User-Agent": ""
+        })
+
+    def search_titles(self, query: str) -> Optional[List[str]]:
+        """
+        Выполняет поисковый запрос и возвращает названия товаров первой страницы результатов.
+
+        :param query: str: Поисковый запрос.
+        :return: List[str]/None: Названия товаров либо None, если запрос завершился ошибкой.
+        """
+        params = {
+            "phrase": query,
+            "products[page]": 1,
+            "products[per-page]": self.page_size
+        }
+        try:
+            response = self.session.get(self.search_url, params=params, timeout=10)
+            response.raise_for_status()
+            body = response.json()
+        except (requests.RequestException, ValueError):
+            return None
+        return self.extract_titles(body)
+
+    def extract_titles(self, body: Dict) -> List[str]:
+        """
+        Извлекает названия товаров из ответа в формате JSON:API (разделы data и included).
+
+        :param body: Dict: Тело ответа.
+        :return: List[str]: Названия товаров.
+        """
+        data = body.get("data")
+        records = data if isinstance(data, list) else []
+        records = records + [
+            item for item in body.get("included", []) if item.get("type") == "product"]
+        return [
+            record["attributes"]["title"] for record in records
+            if record.get("attributes", {}).get("title")]
+
+    def check_case(self, case: SearchCase) -> Dict:
+        """
+        Проверяет один поисковый запрос корпуса.
+
+        :param case: SearchCase: Поисковый запрос и ожидаемые варианты названия.
+        Запрос успешен только при строгом совпадении; фонетическое и нечёткое совпадения возвращаются в поле "match"
+        и учитываются в сводке отдельно.
+
+        :return: Dict: Запрос, результат проверки, вид совпадения и количество найденных товаров
+                 (None при ошибке запроса).
+        """
+        titles = self.search_titles(case.query)
+        match = None if titles is None else classify_match(titles, case.variants, self.match_threshold)
+        return {
+            "query": case.query,
+            "passed": match == MATCH_EXACT,
+            "match": match,
+            "found": None if titles is None else len(titles)
+        }
+
+    @allure.step("Проверка качества поиска на корпусе запросов")
+    def run_corpus(self, cases: Iterable[SearchCase]) -> Dict:
+        """
+        Параллельно проверяет запросы корпуса и вычисляет общую долю успешных запросов.
+
+        Запросы читаются из корпуса пачками, поэтому одновременно в памяти находится не больше
+        нескольких пачек, а не весь корпус.
+
+        :param cases: Iterable[SearchCase]: Поток поисковых запросов.
+        :return: Dict: Сводка: всего запросов, успешных, ошибок запроса, неуспешных с фонетическим или нечётким
+                 совпадением, доля успешных и список неуспешных запросов.
+        """
+        summary = {"total": 0, "passed": 0, "errors": 0, "near_matches": 0, "pass_rate": 0.0, "failures": []}
+        batch = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for case in cases:
+                batch.append(case)
+                if len(batch) >= self.max_workers * 4:
+                    self.add_results(summary, executor.map(self.check_case, batch))
+                    batch = []
+            self.add_results(summary, executor.map(self.check_case, batch))
+
+        if summary["total"]:
+            summary["pass_rate"] = summary["passed"] / summary["total"]
+
+        allure.attach(
+            json.dumps(summary, ensure_ascii=False, indent=2),
+            name="Search Corpus Summary",
+            attachment_type=allure.attachment_type.JSON)
+
+        return summary
+
+    def add_results(self, summary: Dict, results: Iterable[Dict]) -> None:
+        """
+        Добавляет результаты пачки запросов в сводку.
+
+        :param summary: Dict: Сводка прогона корпуса.
+        :param results: Iterable[Dict]: Результаты проверки запросов.
+        """
+        for result in results:
+            summary["total"] += 1
+            if result["passed"]:
+                summary["passed"] += 1
+                continue
+            if result["found"] is None:
+                summary["errors"] += 1
+            elif result["match"] is not None:
+                summary["near_matches"] += 1
+            if len(summary["failures"]) < MAX_FAILURES:
+                summary["failures"].append(result)
@@ -0,0 +1,279 @@
+"""
+Общие функции сопоставления названий товаров для UI- и API-проверок поиска.
+
+Таблицы и регулярные выражения компилируются один раз при импорте модуля. Проверка поиска выполняется строго:
+нормализованный вариант названия должен входить в нормализованное название товара. Для сравнения названий
+на разных алфавитах ("Гарри Поттер" и "Harry Potter") названия дополнительно приводятся к ключу сопоставления:
+кириллица транслитерируется, а латиница упрощается до общего «фонетического» написания. Такие совпадения
+(и нечёткие совпадения по индексу n-грамм) не засчитываются проверкой, а сообщаются отдельно (см. classify_match).
+
+Микро-бенчмарк: python -m API.text_matching
+"""
+import re
+import string
+import time
+import random
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PUNCTUATION_TABLE = str.maketrans("-", " ", string.punctuation.replace("-", "") + "«»—–…")
+TITLE_PATTERN = re.compile(r"\s*\(.*?\)|\s*\d+\+")
+SPACES_PATTERN = re.compile(r"\s+")
+
+TRANSLIT_TABLE = str.maketrans({
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e", "ж": "zh",
+    "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o",
+    "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "kh", "ц": "ts",
+    "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya"
+})
+
+PHONETIC_RULES = [(re.compile(pattern), replacement) for pattern, replacement in (
+    (r"ck", "k"),
+    (r"ph", "f"),
+    (r"th", "t"),
+    (r"tch", "ch"),
+    (r"kh", "h"),
+    (r"x", "ks"),
+    (r"q", "k"),
+    (r"w", "v"),
+    (r"[yj]", "i"),
+    (r"c(?!h)", "k"),
+    (r"(?<![sczt])h", "g"),
+    (r"([a-z])\1+", r"\1"),
+)]
+"""Правила упрощения латиницы: английское и транслитерированное русское написание сводятся к одному ключу."""
+
+NGRAM_SIZE = 3
+
+MATCH_EXACT = "exact"
+MATCH_PHONETIC = "phonetic"
+MATCH_FUZZY = "fuzzy"
+"""Виды совпадений: строгое вхождение, вхождение по ключу сопоставления и нечёткое совпадение по n-граммам."""
+
+
+@lru_cache(maxsize=65536)
+def normalize_title(title: str) -> str:
+    """
+    Приводит название товара к унифицированному виду: нижний регистр, дефисы заменены пробелами,
+    пунктуация удалена, пробелы схлопнуты.
+
+    :param title: str: Название товара.
+    :return: str: Нормализованное название.
+    """
+    return SPACES_PATTERN.sub(" ", title.lower().translate(PUNCTUATION_TABLE)).strip()
+
+
+def clean_title(title: str) -> str:
+    """
+    Удаляет из названия товара текст в скобках, пробелы перед скобками и числа с плюсом (возрастные ограничения).
+
+    :param title: str: Название товара.
+    :return: str: Название товара без лишних символов.
+    """
+    return TITLE_PATTERN.sub("", title).strip()
+
+
+def transliterate(text: str) -> str:
+    """
+    Транслитерирует кириллицу в латиницу (текст должен быть в нижнем регистре).
+
+    :param text: str: Исходный текст.
+    :return: str: Текст латиницей.
+    """
+    return text.translate(TRANSLIT_TABLE)
+
+
+@lru_cache(maxsize=65536)
+def match_key(title: str) -> str:
+    """
+    Формирует ключ сопоставления названия: нормализация, транслитерация и фонетическое упрощение.
+
+    Например, и "Гарри Поттер", и "Harry Potter" дают ключ "gari poter".
+
+    :param title: str: Название товара.
+    :return: str: Ключ сопоставления.
+    """
+    key = transliterate(normalize_title(title))
+    for pattern, replacement in PHONETIC_RULES:
+        key = pattern.sub(replacement, key)
+    return key
+
+
+def get_ngrams(key: str) -> set:
+    """
+    Разбивает ключ сопоставления на n-граммы (по умолчанию триграммы) с учётом границ слов.
+
+    :param key: str: Ключ сопоставления.
+    :return: set: Множество n-грамм.
+    """
+    padded = f" {key} "
+    return {padded[index:index + NGRAM_SIZE] for index in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class NgramIndex:
+    """
+    Инвертированный индекс n-грамм для нечёткого поиска названий.
+
+    Для каждой n-граммы хранится список названий, в которых она встречается, поэтому запрос просматривает
+    только названия с общими n-граммами, а не сравнивается с каждым названием попарно.
+    """
+
+    def __init__(self, titles: Iterable[str] = ()) -> None:
+        """
+        :param titles: Iterable[str]: Названия, добавляемые в индекс.
+        """
+        self.titles: List[str] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for title in titles:
+            self.add(title)
+
+    def add(self, title: str) -> None:
+        """
+        Добавляет название в индекс.
+
+        :param title: str: Название товара.
+        """
+        position = len(self.titles)
+        self.titles.append(title)
+        for ngram in get_ngrams(match_key(title)):
+            self.postings[ngram].append(position)
+
+    def search(self, query: str, threshold: float = 0.8,
+               limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Находит названия, в которых содержится большая часть n-грамм запроса.
+
+        Оценка — доля n-грамм запроса, найденных в названии, поэтому короткий запрос ("Гарри Поттер")
+        получает высокую оценку и для длинного названия ("Harry Potter and the Philosopher's Stone").
+
+        :param query: str: Искомое название.
+        :param threshold: float: Минимальная оценка от 0 до 1.
+        :param limit: int/None: Максимальное количество результатов.
+        :return: List[Tuple[str, float]]: Пары "название – оценка" по убыванию оценки.
+        """
+        ngrams = get_ngrams(match_key(query))
+        if not ngrams:
+            return []
+
+        counts: Dict[int, int] = defaultdict(int)
+        for ngram in ngrams:
+            for position in self.postings.get(ngram, ()):
+                counts[position] += 1
+
+        results = sorted(
+            ((self.titles[position], count / len(ngrams)) for position, count in counts.items()
+             if count / len(ngrams) >= threshold),
+            key=lambda item: item[1], reverse=True)
+        return results[:limit]
+
+    def best_match(self, query: str, threshold: float = 0.8) -> Optional[str]:
+        """
+        Возвращает наиболее похожее название из индекса.
+
+        :param query: str: Искомое название.
+        :param threshold: float: Минимальная оценка от 0 до 1.
+        :return: str/None: Название либо None, если похожих названий нет.
+        """
+        results = self.search(query, threshold, limit=1)
+        return results[0][0] if results else None
+
+
+def match_variants(titles: Iterable[str], variants: List[str]) -> bool:
+    """
+    Проверяет, содержится ли хотя бы один из ожидаемых вариантов названия хотя бы в одном из найденных названий.
+
+    Проверка строгая: сравниваются нормализованные названия (см. normalize_title).
+
+    :param titles: Iterable[str]: Названия товаров из результатов поиска.
+    :param variants: List[str]: Ожидаемые варианты названия.
+    :return: bool: True если совпадение найдено, иначе False.
+    """
+    normalized_variants = [normalize_title(variant) for variant in variants]
+    return any(
+        normalized_variant in normalize_title(title)
+        for title in titles
+        for normalized_variant in normalized_variants)
+
+
+def classify_match(titles: Iterable[str], variants: List[str],
+                   threshold: Optional[float] = None) -> Optional[str]:
+    """
+    Определяет вид совпадения ожидаемых вариантов названия с найденными названиями.
+
+    Сначала выполняется строгая проверка (см. match_variants), затем сравнение по ключу сопоставления
+    (совпадают написания на кириллице и латинице), а если указан порог — нечёткий поиск по индексу n-грамм.
+
+    :param titles: Iterable[str]: Названия товаров из результатов поиска.
+    :param variants: List[str]: Ожидаемые варианты названия.
+    :param threshold: float/None: Порог нечёткого совпадения от 0 до 1 (None — без нечёткого поиска).
+    :return: str/None: MATCH_EXACT, MATCH_PHONETIC, MATCH_FUZZY либо None, если совпадений нет.
+    """
+    titles = list(titles)
+    if match_variants(titles, variants):
+        return MATCH_EXACT
+
+    variant_keys = [match_key(variant) for variant in variants]
+    if any(variant_key in match_key(title) for title in titles for variant_key in variant_keys):
+        return MATCH_PHONETIC
+
+    if threshold is not None:
+        index = NgramIndex(titles)
+        if any(index.best_match(variant, threshold) for variant in variants):
+            return MATCH_FUZZY
+    return None
+
+
+def match_titles(expected_titles: Iterable[str], found_titles: Iterable[str],
+                 threshold: float = 0.8) -> Dict[str, Optional[str]]:
+    """
+    Сопоставляет множество ожидаемых названий с множеством найденных за время, близкое к линейному.
+
+    :param expected_titles: Iterable[str]: Ожидаемые названия.
+    :param found_titles: Iterable[str]: Найденные названия.
+    :param threshold: float: Порог нечёткого совпадения от 0 до 1.
+    :return: Dict[str, Optional[str]]: Словарь "ожидаемое название – наиболее похожее найденное (или None)".
+    """
+    index = NgramIndex(found_titles)
+    return {title: index.best_match(title, threshold) for title in expected_titles}
+
+
+def benchmark(count: int = 2000) -> Dict[str, float]:
+    """
+    Микро-бенчмарк: сравнивает прежнее попарное сопоставление (нормализация внутри вложенного цикла)
+    с ключами сопоставления и индексом n-грамм.
+
+    :param count: int: Количество ожидаемых и найденных названий.
+    :return: Dict[str, float]: Время каждого способа в секундах.
+    """
+    rng = random.Random(0)
+    syllables = ["ка", "ро", "ми", "ла", "ту", "ве", "гар", "пот", "ter", "ry", "win", "dor", "ал", "ек", "сан", "др"]
+    words = ["".join(rng.choice(syllables) for _ in range(3)) for _ in range(count)]
+    found = [" ".join(rng.choice(words) for _ in range(5)) for _ in range(count)]
+    expected = [" ".join(title.split()[1:3]) for title in rng.sample(found, count // 10)]
+
+    def legacy_normalize(text: str) -> str:
+        return text.lower().replace("-", " ").translate(str.maketrans("", "", string.punctuation))
+
+    timings = {}
+    start = time.perf_counter()
+    for variant in expected:
+        any(legacy_normalize(variant) in legacy_normalize(title) for title in found)
+    timings["legacy_pairwise"] = time.perf_counter() - start
+
+    normalize_title.cache_clear()
+    match_key.cache_clear()
+    start = time.perf_counter()
+    for variant in expected:
+        classify_match(found, [variant])
+    timings["classify_match"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    match_titles(expected, found)
+    timings["ngram_index"] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    for name, seconds in benchmark().items():
+        print(f"{name:>16}: {seconds * 1000:.1f} мс")
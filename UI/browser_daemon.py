@@ -0,0 +1,256 @@
+"""
+Демон, поддерживающий запущенными веб-драйвер и «тёплый» браузер между запусками pytest.
+
+Запуск вручную: python -m UI.browser_daemon
+Обычно демон запускается автоматически фикстурой browser, если в секции "ui" включён параметр "use_browser_daemon",
+и останавливается сам после "daemon_idle_timeout" секунд простоя.
+"""
+import os
+import sys
+import json
+import time
+import subprocess
+import psutil
+from typing import Dict, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from configuration.ConfigProvider import ConfigProvider, ROOT_DIR
+from testdata.WorkerResources import worker_path
+from UI.driver_resolver import DriverResolver
+
+
+def get_options(browser_name: str, headless: bool = False):
+    """
+    Возвращает объект настроек браузера для указанного названия.
+
+    :param browser_name: str: Название браузера ("Chrome" или "Firefox").
+    :param headless: bool: Запускать браузер без окна (размер окна задаётся явно, так как maximize_window
+                           в этом режиме не действует).
+    """
+    if browser_name == "Chrome":
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        return options
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("-headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+    return options
+
+
+class AttachedWebDriver(WebDriver):
+    """
+    Веб-драйвер, подключающийся к уже запущенной сессии браузера демона вместо создания новой.
+
+    Вызов quit не закрывает браузер: состояние очищается, и сессия возвращается демону для следующего запуска.
+    """
+
+    def __init__(self, daemon: "BrowserDaemon", state: Dict) -> None:
+        """
+        :param daemon: BrowserDaemon: Демон, которому принадлежит сессия.
+        :param state: Dict: Сведения о запущенной сессии (адрес драйвера, id сессии, capabilities).
+        """
+        self._daemon = daemon
+        self._state = state
+        super().__init__(
+            command_executor=state["url"],
+            options=get_options(state["browser_name"]))
+
+    def start_session(self, capabilities: dict) -> None:
+        self.session_id = self._state["session_id"]
+        self.caps = self._state["capabilities"]
+
+    def quit(self) -> None:
+        """Очищает cookies и хранилища, открывает пустую страницу и возвращает сессию демону."""
+        try:
+            self.delete_all_cookies()
+            self.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();")
+            self.get("about:blank")
+        except WebDriverException:
+            pass
+        self._daemon.release()
+
+    def stop_daemon(self) -> None:
+        """Закрывает браузер демона и останавливает демон (используется при перезапуске браузера)."""
+        try:
+            super().quit()
+        except WebDriverException:
+            pass
+        self._daemon.update(stop=True, in_use=False)
+
+
+class BrowserDaemon:
+    """
+    Класс для запуска демона браузера и подключения к нему.
+
+    Сведения о демоне (pid, адрес драйвера, id сессии, время последнего использования) хранятся
+    в JSON-файле, путь к которому задаётся параметром "daemon_state_path" в секции "ui".
+    У каждого воркера pytest-xdist свой демон и свой файл сведений (см. worker_path).
+    """
+
+    def __init__(self) -> None:
+        """Инициализация: загрузка параметров демона из конфигурации."""
+        self.state_path = worker_path(ConfigProvider().get("ui", "daemon_state_path"))
+        self.idle_timeout = ConfigProvider().get_int("ui", "daemon_idle_timeout")
+        self.browser_name = ConfigProvider().get("ui", "browser_name")
+
+    def load(self) -> Optional[Dict]:
+        """
+        Загружает сведения о демоне.
+
+        :return: Dict/None: Сведения о демоне либо None, если демон не запущен.
+        """
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def write(self, state: Dict) -> None:
+        """
+        Атомарно записывает сведения о демоне.
+
+        :param state: Dict: Сведения о демоне.
+        """
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temp_path, self.state_path)
+
+    def update(self, **changes) -> None:
+        """
+        Обновляет отдельные поля в сведениях о демоне.
+
+        :param changes: Изменяемые поля.
+        """
+        state = self.load()
+        if state is not None:
+            state.update(changes)
+            self.write(state)
+
+    def is_alive(self, state: Optional[Dict]) -> bool:
+        """
+        Проверяет, что демон запущен и подходит для текущей конфигурации.
+
+        :param state: Dict/None: Сведения о демоне.
+        :return: bool: True если к демону можно подключиться, иначе False.
+        """
+        return (state is not None and not state.get("stop")
+                and state.get("browser_name") == self.browser_name
+                and psutil.pid_exists(state["pid"]))
+
+    def is_in_use(self, state: Dict) -> bool:
+        """
+        Проверяет, используется ли браузер демона другим запуском pytest.
+
+        :param state: Dict: Сведения о демоне.
+        :return: bool: True если браузер занят живым процессом, иначе False.
+        """
+        return bool(state.get("in_use")) and psutil.pid_exists(
+            state.get("owner_pid", 0))
+
+    def start(self, timeout: int = 60) -> Optional[Dict]:
+        """
+        Запускает демон отдельным фоновым процессом и ожидает готовности браузера.
+
+        :param timeout: int: Максимальное время ожидания запуска в секундах.
+        :return: Dict/None: Сведения о запущенном демоне либо None, если демон не запустился.
+        """
+        kwargs = {"start_new_session": True}
+        if sys.platform == "win32":
+            kwargs = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        subprocess.Popen(
+            [sys.executable, "-m", "UI.browser_daemon"],
+            cwd=ROOT_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **kwargs)
+
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            state = self.load()
+            if self.is_alive(state):
+                return state
+            time.sleep(0.2)
+        return None
+
+    def attach(self) -> Optional[AttachedWebDriver]:
+        """
+        Подключается к браузеру демона, при необходимости запуская демон.
+
+        :return: AttachedWebDriver/None: Веб-драйвер, подключённый к браузеру демона, либо None,
+                 если демон недоступен или его браузер уже используется другим запуском.
+        """
+        state = self.load()
+        if not self.is_alive(state):
+            state = self.start()
+        if state is None or self.is_in_use(state):
+            return None
+
+        self.update(in_use=True, owner_pid=os.getpid(), last_used=time.time())
+        try:
+            driver = AttachedWebDriver(self, state)
+            driver.execute_script("return 1;")
+        except WebDriverException:
+            self.update(stop=True, in_use=False)
+            return None
+        return driver
+
+    def release(self) -> None:
+        """Отмечает браузер демона свободным и обновляет время последнего использования."""
+        self.update(in_use=False, last_used=time.time())
+
+    def serve(self) -> None:
+        """
+        Запускает веб-драйвер и браузер и поддерживает их до простоя дольше "daemon_idle_timeout" секунд
+        или до запроса остановки.
+        """
+        driver_path = DriverResolver(self.browser_name).resolve()
+        service = Service(driver_path) if self.browser_name == "Chrome" else FirefoxService(driver_path)
+        service.start()
+        driver = webdriver.Remote(
+            command_executor=service.service_url,
+            options=get_options(self.browser_name))
+
+        self.write({
+            "pid": os.getpid(),
+            "browser_name": self.browser_name,
+            "url": service.service_url,
+            "session_id": driver.session_id,
+            "capabilities": driver.caps,
+            "in_use": False,
+            "stop": False,
+            "last_used": time.time()
+        })
+
+        try:
+            while True:
+                time.sleep(5)
+                state = self.load()
+                if state is None or state.get("stop") or state.get("pid") != os.getpid():
+                    break
+                if not self.is_in_use(state) and time.time() - state["last_used"] > self.idle_timeout:
+                    break
+        finally:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+            service.stop()
+            state = self.load()
+            if state is not None and state.get("pid") == os.getpid():
+                os.remove(self.state_path)
+
+
+if __name__ == "__main__":
+    BrowserDaemon().serve()
@@ -0,0 +1,91 @@
+"""
+Параллельный прогон тестов в нескольких браузерах.
+
+Для каждого браузера из параметра "browsers" секции "ui" запускается отдельный процесс pytest со своим пулом воркеров,
+и все процессы работают одновременно: общее время прогона определяется самым медленным браузером,
+а не суммой прогонов. Каждый процесс получает переменную окружения CG_UI_BROWSERS с одним браузером,
+поэтому тесты параметризуются только им (см. pytest_generate_tests в conftest.py). Результаты всех процессов
+записываются в общий каталог Allure и отличаются тегом и меткой "browser".
+
+Запуск:
+    CG_PROFILE=cross-browser python -m UI.browser_matrix
+    python -m UI.browser_matrix --browsers Chrome,Firefox -- tests_/tests_ui.py -n 2
+Аргументы после "--" передаются каждому процессу pytest без изменений.
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+import threading
+from typing import Dict, List
+from configuration.ConfigProvider import ConfigProvider, ROOT_DIR
+
+
+def stream_output(browser_name: str, run: Dict, lock: threading.Lock) -> None:
+    """
+    Выводит строки процесса pytest с префиксом браузера и фиксирует время его завершения.
+
+    :param browser_name: str: Название браузера.
+    :param run: Dict: Сведения о запуске (процесс и время старта).
+    :param lock: threading.Lock: Блокировка, не дающая строкам разных процессов перемешиваться.
+    """
+    for line in run["process"].stdout:
+        with lock:
+            sys.stdout.write(f"[{browser_name}] {line}")
+            sys.stdout.flush()
+    run["process"].wait()
+    run["seconds"] = time.perf_counter() - run["started"]
+
+
+def run_matrix(browsers: List[str], pytest_args: List[str]) -> Dict[str, Dict]:
+    """
+    Запускает процессы pytest для всех браузеров одновременно и ожидает их завершения.
+
+    :param browsers: List[str]: Названия браузеров.
+    :param pytest_args: List[str]: Аргументы pytest.
+    :return: Dict[str, Dict]: Код завершения и длительность прогона по браузерам.
+    """
+    lock = threading.Lock()
+    runs = {}
+    for browser_name in browsers:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "pytest", *pytest_args],
+            cwd=ROOT_DIR,
+            env=dict(os.environ, CG_UI_BROWSERS=browser_name),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace")
+        run = runs[browser_name] = {"process": process, "started": time.perf_counter()}
+        run["thread"] = threading.Thread(target=stream_output, args=(browser_name, run, lock), daemon=True)
+        run["thread"].start()
+
+    results = {}
+    for browser_name, run in runs.items():
+        run["thread"].join()
+        results[browser_name] = {"code": run["process"].returncode, "seconds": run["seconds"]}
+    return results
+
+
+def main() -> None:
+    """Запуск матрицы браузеров из командной строки."""
+    parser = argparse.ArgumentParser(description="Параллельный прогон тестов в нескольких браузерах")
+    parser.add_argument("--browsers", help="Браузеры через запятую (по умолчанию — параметр \"browsers\")")
+    parser.add_argument("pytest_args", nargs="*", help="Аргументы pytest (после \"--\")")
+    args = parser.parse_args()
+
+    browsers = [name.strip() for name in args.browsers.split(",")] if args.browsers \
+        else ConfigProvider().get_browsers()
+    results = run_matrix(browsers, args.pytest_args)
+
+    print()
+    for browser_name, result in results.items():
+        status = "успешно" if result["code"] == 0 else f"код {result['code']}"
+        print(f"{browser_name:10} {status:10} {result['seconds']:8.1f} с")
+    sys.exit(max(result["code"] for result in results.values()))
+
+
+if __name__ == "__main__":
+    main()
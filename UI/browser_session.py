@@ -0,0 +1,157 @@
+import allure
+import psutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from configuration.ConfigProvider import ConfigProvider
+from UI.storage_state import StorageState
+from UI.element_cache import ElementCache
+
+HEAP_SCRIPT = "return window.performance.memory ? window.performance.memory.usedJSHeapSize : null;"
+
+
+class BrowserSession:
+    """
+    Обёртка над WebDriver, позволяющая прозрачно перезапускать браузер между тестами.
+
+    Page-объекты получают ссылку на эту обёртку, поэтому продолжают работать после перезапуска:
+    все обращения перенаправляются к текущему экземпляру веб-драйвера.
+    Пороги перезапуска задаются параметрами "recycle_after_tests", "recycle_max_rss_mb"
+    и "recycle_max_heap_mb" в секции "ui" (значение 0 отключает соответствующую проверку).
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver],
+                 background: bool = False) -> None:
+        """
+        Запускает браузер с помощью переданной фабрики.
+
+        :param factory: Callable[[], WebDriver]: Функция, запускающая и настраивающая новый браузер.
+        :param background: bool: Запускать ли браузер в фоновом потоке. В этом случае конструктор не блокируется,
+                           а ожидание запуска происходит при первом обращении к браузеру.
+        """
+        self._factory = factory
+        self._launch = None
+        self._current_driver = None
+        if background:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._launch = executor.submit(factory)
+            executor.shutdown(wait=False)
+        else:
+            self._current_driver = factory()
+        self.tests_since_start = 0
+        self.max_tests = ConfigProvider().get_int("ui", "recycle_after_tests")
+        self.max_rss_mb = ConfigProvider().get_int("ui", "recycle_max_rss_mb")
+        self.max_heap_mb = ConfigProvider().get_int("ui", "recycle_max_heap_mb")
+
+    @property
+    def _driver(self) -> WebDriver:
+        """Текущий экземпляр веб-драйвера; при фоновом запуске ожидает его завершения."""
+        if self._current_driver is None:
+            self._current_driver = self._launch.result()
+        return self._current_driver
+
+    @_driver.setter
+    def _driver(self, driver: WebDriver) -> None:
+        self._current_driver = driver
+
+    @property
+    def is_started(self) -> bool:
+        """True, если браузер уже запущен или его запуск завершён в фоне."""
+        return self._current_driver is not None or self._launch.done()
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get_rss_mb(self) -> Optional[float]:
+        """
+        Получает суммарный объём резидентной памяти процессов браузера (драйвер и все дочерние процессы).
+
+        :return: float/None: Объём памяти в мегабайтах либо None, если процесс драйвера недоступен.
+        """
+        try:
+            process = psutil.Process(self._driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+        except (AttributeError, psutil.Error):
+            return None
+
+        rss = 0
+        for item in processes:
+            try:
+                rss += item.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss / 1024 / 1024
+
+    def get_heap_mb(self) -> Optional[float]:
+        """
+        Получает объём используемой памяти JavaScript текущей страницы (доступно в Chrome).
+
+        :return: float/None: Объём памяти в мегабайтах либо None, если браузер не предоставляет эту метрику.
+        """
+        try:
+            heap = self._driver.execute_script(HEAP_SCRIPT)
+        except WebDriverException:
+            return None
+        return heap / 1024 / 1024 if heap else None
+
+    def get_memory_usage(self) -> Dict:
+        """
+        Собирает показатели, по которым принимается решение о перезапуске браузера.
+
+        :return: Dict: Количество тестов с момента запуска, объём памяти процессов и памяти JavaScript.
+        """
+        return {
+            "tests": self.tests_since_start,
+            "rss_mb": self.get_rss_mb(),
+            "heap_mb": self.get_heap_mb()
+        }
+
+    def needs_recycling(self) -> Optional[str]:
+        """
+        Проверяет, превышен ли хотя бы один из порогов перезапуска.
+
+        :return: str/None: Причина перезапуска либо None, если перезапуск не требуется.
+        """
+        usage = self.get_memory_usage()
+        if self.max_tests and usage["tests"] >= self.max_tests:
+            return f"выполнено тестов: {usage['tests']}"
+        if self.max_rss_mb and usage["rss_mb"] and usage["rss_mb"] >= self.max_rss_mb:
+            return f"память процессов браузера: {usage['rss_mb']:.0f} МБ"
+        if self.max_heap_mb and usage["heap_mb"] and usage["heap_mb"] >= self.max_heap_mb:
+            return f"память JavaScript: {usage['heap_mb']:.0f} МБ"
+        return None
+
+    @allure.step("Перезапуск браузера: {reason}")
+    def recycle(self, reason: str = "") -> None:
+        """
+        Перезапускает браузер, сохраняя cookies, localStorage и открытую страницу.
+
+        Браузер, подключённый к демону (см. BrowserDaemon), закрывается вместе с демоном, чтобы память действительно освободилась.
+
+        :param reason: str: Причина перезапуска для отчёта.
+        """
+        state = StorageState(self._driver).capture()
+        current_url = self._driver.current_url
+        if hasattr(self._driver, "stop_daemon"):
+            self._driver.stop_daemon()
+        else:
+            self._driver.quit()
+
+        self._driver = self._factory()
+        ElementCache.for_driver(self).invalidate()
+        StorageState(self._driver).restore(state)
+        self._driver.get(current_url)
+        self.tests_since_start = 0
+
+    def recycle_if_needed(self) -> bool:
+        """
+        Перезапускает браузер, если превышен один из порогов.
+
+        :return: bool: True если браузер был перезапущен, иначе False.
+        """
+        reason = self.needs_recycling()
+        if reason is None:
+            return False
+        self.recycle(reason)
+        return True
@@ -3,7 +3,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from UI.element_cache import ElementCache
+
+CART_INDICATOR = (
+    By.XPATH,
+    "//div[contains(@class, 'chg-indicator') and contains(@class, 'chg-indicator--bg-cherry') and contains(@class, 'chg-indicator--mod-m-l') and contains(@class, 'header-controls__indicator')]")
+"""Локатор индикатора количества товаров в корзине (в шапке сайта)."""
 
 
 class CartPage:
@@ -15,6 +21,7 @@ class CartPage:
         :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
         """
         self.__driver = driver
+        self.elements = ElementCache.for_driver(driver)
 
     @allure.step("Добавление товаров в корзину")
     def add_products_to_cart(self, count: int) -> None:
@@ -54,14 +61,17 @@ class CartPage:
         """
         Функция получает значение индикатора корзины.
 
+        Элемент индикатора кэшируется (см. ElementCache), поэтому при опросе внутри ожиданий
+        каждая проверка требует одного обращения к WebDriver вместо двух.
+
         :return: int: Значение индикатора корзины или 0, если элемент не найден.
         """
-        indicator_element = self.__driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class, 'chg-indicator') and contains(@class, 'chg-indicator--bg-cherry') and contains(@class, 'chg-indicator--mod-m-l') and contains(@class, 'header-controls__indicator')]")
-        if indicator_element:
-            return int(indicator_element[0].text)
-        else:
+        indicator_element = self.elements.find_optional(CART_INDICATOR)
+        if indicator_element is None:
+            return 0
+        try:
+            return int(indicator_element.text)
+        except NoSuchElementException:
             return 0
 
     @allure.step("Очистка корзины")
@@ -0,0 +1,68 @@
+import allure
+from typing import List
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from API.cart_api import CartApi
+from UI.navigation import Navigation
+
+
+class CartState:
+    """
+    Класс для подготовки состояния корзины через API с последующей синхронизацией отображения в браузере.
+
+    Позволяет начинать UI-тест сразу на странице корзины с нужным количеством товаров,
+    не выполняя поиск и добавление товаров через интерфейс.
+    """
+
+    def __init__(self, driver: WebDriver, cart_api: CartApi) -> None:
+        """
+        Инициализирует объект с предоставленным веб-драйвером и API-клиентом корзины.
+
+        :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
+        :param cart_api: CartApi: Объект для взаимодействия с API корзины того же аккаунта.
+        """
+        self.__driver = driver
+        self.cart_api = cart_api
+
+    @allure.step("Наполнение корзины {count} товарами через API")
+    def seed(self, count: int) -> List[int]:
+        """
+        Очищает корзину и добавляет в неё указанное количество случайных товаров через API.
+
+        :param count: int: Количество товаров.
+
+        :return: List[int]: Список id добавленных товаров.
+        """
+        self.cart_api.clear_cart()
+        product_ids = self.cart_api.get_random_ids(count)
+        for product_id in product_ids:
+            self.cart_api.add_product_to_cart(product_id)
+        return product_ids
+
+    @allure.step("Открытие корзины с {count} товарами, добавленными через API")
+    def open_cart_with_products(self, count: int) -> List[int]:
+        """
+        Подготавливает корзину через API и открывает её в браузере.
+
+        Состояние авторизации аккаунта, от имени которого работает API-клиент, должно быть уже установлено
+        в браузер (фикстура add_cookies).
+
+        Процесс:
+            1. Наполнение корзины через API.
+            2. Переход на страницу корзины и ожидание отображения всех добавленных товаров.
+
+        :param count: int: Количество товаров.
+
+        :return: List[int]: Список id добавленных товаров.
+        """
+        product_ids = self.seed(count)
+
+        Navigation(self.__driver).open_section("cart")
+
+        with allure.step("Ожидание отображения добавленных товаров"):
+            WebDriverWait(self.__driver, 10).until(
+                lambda driver: len(driver.find_elements(
+                    By.XPATH, "//div[@class='cart-item']")) == len(product_ids))
+
+        return product_ids
@@ -0,0 +1,165 @@
+import os
+import json
+import stat
+import shutil
+import hashlib
+from typing import Dict, Optional
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from configuration.ConfigProvider import ConfigProvider
+from testdata.WorkerResources import CrossProcessLock
+
+
+class DriverResolver:
+    """
+    Класс определяет путь к исполняемому файлу веб-драйвера без обращения к сети.
+
+    Порядок поиска:
+        1. Путь, закреплённый параметром "<браузер>_driver_path" в секции "ui" (chrome_driver_path, firefox_driver_path).
+        2. Локальный кэш в каталоге "driver_cache_dir", где драйверы хранятся по SHA-256 содержимого,
+           а индекс сопоставляет их с браузером, его мажорной версией и операционной системой.
+           Хеш файла проверяется при каждом обращении; повреждённый драйвер загружается заново.
+        3. При промахе кэша — загрузка через webdriver-manager (версия закрепляется параметром "<браузер>_driver_version")
+           и добавление драйвера в кэш.
+    """
+
+    def __init__(self, browser_name: str) -> None:
+        """
+        :param browser_name: str: Название браузера ("Chrome" или "Firefox").
+        """
+        self.browser_name = browser_name
+        prefix = browser_name.lower()
+        self.driver_path = ConfigProvider().get("ui", f"{prefix}_driver_path")
+        self.driver_version = ConfigProvider().get("ui", f"{prefix}_driver_version") or None
+        self.cache_dir = ConfigProvider().get("ui", "driver_cache_dir")
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.os_manager = OperationSystemManager()
+
+    def resolve(self) -> str:
+        """
+        Возвращает путь к исполняемому файлу веб-драйвера.
+
+        :return: str: Путь к драйверу.
+        """
+        if self.driver_path:
+            return self.driver_path
+
+        key = self.get_cache_key()
+        cached_path = self.find_in_cache(key)
+        if cached_path:
+            return cached_path
+
+        return self.add_to_cache(key, self.download())
+
+    def get_browser_version(self) -> Optional[str]:
+        """
+        Определяет версию установленного браузера локальными средствами ОС.
+
+        :return: str/None: Версия браузера либо None, если её не удалось определить.
+        """
+        browser_type = ChromeType.GOOGLE if self.browser_name == "Chrome" else "firefox"
+        return self.os_manager.get_browser_version_from_os(browser_type)
+
+    def get_cache_key(self) -> str:
+        """
+        Формирует ключ кэша: браузер, мажорная версия браузера (или закреплённая версия драйвера) и тип ОС.
+
+        :return: str: Ключ записи в индексе кэша.
+        """
+        if self.driver_version:
+            version = f"driver-{self.driver_version}"
+        else:
+            browser_version = self.get_browser_version() or "unknown"
+            version = browser_version.split(".")[0]
+        return f"{self.browser_name.lower()}-{version}-{self.os_manager.get_os_type()}"
+
+    def load_index(self) -> Dict:
+        """
+        Загружает индекс кэша драйверов.
+
+        :return: Dict: Индекс "ключ – сведения о драйвере" (пустой, если кэш ещё не создан).
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def get_digest(path: str) -> str:
+        """
+        Вычисляет SHA-256 содержимого файла.
+
+        :param path: str: Путь к файлу.
+        :return: str: Хеш в шестнадцатеричном виде.
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def find_in_cache(self, key: str) -> Optional[str]:
+        """
+        Ищет драйвер в локальном кэше.
+
+        :param key: str: Ключ записи в индексе кэша.
+        :return: str/None: Путь к драйверу либо None, если драйвер отсутствует или его хеш не совпадает с индексом.
+        """
+        entry = self.load_index().get(key)
+        if entry is None:
+            return None
+
+        path = os.path.join(self.cache_dir, "objects", entry["sha256"], entry["file_name"])
+        if os.path.isfile(path) and os.path.getsize(path) == entry["size"] \
+                and self.get_digest(path) == entry["sha256"]:
+            return path
+        return None
+
+    def download(self) -> str:
+        """
+        Загружает драйвер через webdriver-manager (требуется доступ к сети).
+
+        :return: str: Путь к загруженному драйверу.
+        """
+        if self.browser_name == "Chrome":
+            return ChromeDriverManager(driver_version=self.driver_version).install()
+        return GeckoDriverManager(version=self.driver_version).install()
+
+    def add_to_cache(self, key: str, source_path: str) -> str:
+        """
+        Копирует драйвер в кэш по хешу содержимого и добавляет запись в индекс.
+
+        Файл и индекс записываются атомарно под межпроцессной блокировкой, так как драйвер могут одновременно
+        добавлять несколько воркеров pytest-xdist.
+
+        :param key: str: Ключ записи в индексе кэша.
+        :param source_path: str: Путь к загруженному драйверу.
+        :return: str: Путь к драйверу в кэше.
+        """
+        digest = self.get_digest(source_path)
+        file_name = os.path.basename(source_path)
+        object_dir = os.path.join(self.cache_dir, "objects", digest)
+        path = os.path.join(object_dir, file_name)
+
+        with CrossProcessLock("drivers"):
+            if not os.path.isfile(path) or self.get_digest(path) != digest:
+                os.makedirs(object_dir, exist_ok=True)
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                shutil.copy2(source_path, temp_path)
+                os.chmod(temp_path, os.stat(temp_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+                os.replace(temp_path, path)
+
+            index = self.load_index()
+            index[key] = {
+                "sha256": digest,
+                "file_name": file_name,
+                "size": os.path.getsize(path)
+            }
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(index, file, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.index_path)
+
+        return path
@@ -0,0 +1,185 @@
+import weakref
+from typing import Dict, List, Optional, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.remote.command import Command
+from selenium.common.exceptions import StaleElementReferenceException
+
+Locator = Tuple[str, str]
+
+NAVIGATING_COMMANDS = {Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT}
+"""Команды элемента, после которых страница может смениться (переход по ссылке, отправка формы клавишей Enter)."""
+
+DOCUMENT_SCRIPT = "return [location.href, performance.timeOrigin];"
+"""Признаки текущего документа: адрес и время его загрузки (меняется при каждой загрузке страницы)."""
+
+stats: Dict[Locator, Dict[str, int]] = {}
+"""Счётчики попаданий, промахов и устаревших элементов по локаторам, общие для всех кэшей сессии."""
+
+
+class CachedElement(WebElement):
+    """
+    Элемент, найденный через ElementCache.
+
+    Если элемент устарел (StaleElementReferenceException), он автоматически ищется заново по своему локатору,
+    и команда повторяется, поэтому page-объекты могут хранить и переиспользовать такие элементы.
+    После клика и ввода текста кэш проверяет, не сменилась ли страница (см. ElementCache.check_document).
+    """
+
+    def __init__(self, cache: "ElementCache", locator: Locator, element: WebElement) -> None:
+        """
+        :param cache: ElementCache: Кэш, которому принадлежит элемент.
+        :param locator: Locator: Локатор элемента.
+        :param element: WebElement: Найденный элемент.
+        """
+        super().__init__(cache.driver, element.id)
+        self._cache = cache
+        self._locator = locator
+
+    def _execute(self, command, params=None):
+        try:
+            result = super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._cache.refind(self._locator).id
+            result = super()._execute(command, params)
+        if command in NAVIGATING_COMMANDS:
+            self._cache.changed = True
+        return result
+
+
+class ElementCache:
+    """
+    Кэш найденных элементов для одного экземпляра веб-драйвера.
+
+    Повторный поиск элемента по тому же локатору не выполняет обращения к WebDriver, пока элемент существует.
+    Кэш очищается целиком при смене документа или адреса страницы и при устаревании любого элемента, а элемент
+    ищется заново. Смена страницы проверяется одним запросом только после команд, которые могут к ней привести
+    (клик и ввод текста в элементе из кэша, вызов invalidate page-объектом после driver.get). Счётчики попаданий, промахов и устаревших элементов доступны через get_stats().
+    Кэш общий для всех page-объектов, работающих с одним веб-драйвером (см. for_driver).
+    """
+
+    instances = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver: WebDriver) -> None:
+        """
+        :param driver: WebDriver: Экземпляр веб-драйвера.
+        """
+        self.driver = driver
+        self.elements: Dict[Locator, CachedElement] = {}
+        self.document = None
+        self.changed = True
+
+    @classmethod
+    def for_driver(cls, driver: WebDriver) -> "ElementCache":
+        """
+        Возвращает кэш, общий для всех page-объектов указанного веб-драйвера.
+
+        :param driver: WebDriver: Экземпляр веб-драйвера.
+        :return: ElementCache: Кэш элементов.
+        """
+        cache = cls.instances.get(driver)
+        if cache is None:
+            cache = cls.instances[driver] = cls(driver)
+        return cache
+
+    def count(self, locator: Locator, event: str) -> None:
+        """
+        Увеличивает счётчик события для локатора.
+
+        :param locator: Locator: Локатор.
+        :param event: str: Событие ("hits", "misses" или "stale").
+        """
+        counters = stats.setdefault(locator, {"hits": 0, "misses": 0, "stale": 0})
+        counters[event] += 1
+
+    def check_document(self) -> None:
+        """Очищает кэш, если после последней проверки сменился документ или адрес страницы."""
+        if not self.changed:
+            return
+        document = self.driver.execute_script(DOCUMENT_SCRIPT)
+        if document != self.document:
+            self.elements.clear()
+            self.document = document
+        self.changed = False
+
+    def find(self, locator: Locator) -> CachedElement:
+        """
+        Возвращает элемент из кэша либо находит его и сохраняет в кэш.
+
+        :param locator: Locator: Локатор элемента.
+        :return: CachedElement: Элемент.
+
+        raise NoSuchElementException: Если элемент не найден.
+        """
+        self.check_document()
+        element = self.elements.get(locator)
+        if element is not None:
+            self.count(locator, "hits")
+            return element
+
+        self.count(locator, "misses")
+        element = CachedElement(self, locator, self.driver.find_element(*locator))
+        self.elements[locator] = element
+        return element
+
+    def find_optional(self, locator: Locator) -> Optional[CachedElement]:
+        """
+        Возвращает элемент из кэша либо находит его без ожидания; отсутствие элемента не кэшируется.
+
+        :param locator: Locator: Локатор элемента.
+        :return: CachedElement/None: Элемент либо None, если элемента нет на странице.
+        """
+        self.check_document()
+        if locator in self.elements:
+            return self.find(locator)
+
+        self.count(locator, "misses")
+        found = self.driver.find_elements(*locator)
+        if not found:
+            return None
+        element = CachedElement(self, locator, found[0])
+        self.elements[locator] = element
+        return element
+
+    def refind(self, locator: Locator) -> WebElement:
+        """
+        Очищает кэш после устаревания элемента и находит элемент заново.
+
+        :param locator: Locator: Локатор устаревшего элемента.
+        :return: WebElement: Найденный элемент.
+        """
+        self.count(locator, "stale")
+        self.invalidate()
+        return self.find(locator)
+
+    def invalidate(self) -> None:
+        """Очищает кэш (вызывается при переходе на другую страницу или перезапуске браузера)."""
+        self.elements.clear()
+        self.document = None
+        self.changed = True
+
+
+def get_stats() -> List[Dict]:
+    """
+    Возвращает статистику кэша элементов по локаторам.
+
+    :return: List[Dict]: Локатор и количество попаданий, промахов и устаревших элементов.
+    """
+    return sorted(
+        ({"locator": f"{by}={value}", **counters} for (by, value), counters in stats.items()),
+        key=lambda item: item["hits"] + item["misses"], reverse=True)
+
+
+def report() -> str:
+    """
+    Формирует текстовый отчёт о работе кэша элементов.
+
+    :return: str: Текст отчёта.
+    """
+    items = get_stats()
+    lines = [f"Попаданий: {sum(item['hits'] for item in items)}, "
+             f"промахов: {sum(item['misses'] for item in items)}, "
+             f"устаревших элементов: {sum(item['stale'] for item in items)}"]
+    for item in items:
+        lines.append(f"  {item['hits']:6d} / {item['misses']:6d} / {item['stale']:4d}  {item['locator']}")
+    return "\n".join(lines)
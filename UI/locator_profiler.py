@@ -0,0 +1,342 @@
+"""
+Профилировщик стоимости локаторов page-объектов.
+
+Извлекает все статические локаторы вида (By.<СТРАТЕГИЯ>, "<значение>") из модулей UI/*.py, многократно вычисляет
+каждый из них в браузере — на сохранённых снимках страниц или на живой странице — и формирует отчёт о времени
+вычисления и количестве найденных элементов. Для медленных XPath-локаторов предлагаются более быстрые эквиваленты,
+время и число совпадений которых измеряются тем же способом.
+
+Запуск:
+    python -m UI.locator_profiler                          # снимки из каталога "snapshot_dir"
+    python -m UI.locator_profiler --url https://www.chitai-gorod.ru/
+    python -m UI.locator_profiler --url <URL> --save-snapshot main   # сохранить снимок страницы
+"""
+import os
+import re
+import ast
+import glob
+import json
+import time
+import argparse
+from typing import Dict, List, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from configuration.ConfigProvider import ConfigProvider, ROOT_DIR
+
+EVALUATE_SCRIPT = """
+const [by, value, repeats] = arguments;
+const finders = {
+    "xpath": () => document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength,
+    "css selector": () => document.querySelectorAll(value).length,
+    "id": () => document.querySelectorAll("#" + CSS.escape(value)).length,
+    "name": () => document.getElementsByName(value).length,
+    "class name": () => document.getElementsByClassName(value).length,
+    "tag name": () => document.getElementsByTagName(value).length,
+    "link text": () => Array.from(document.links).filter(link => link.innerText.trim() === value).length,
+    "partial link text": () => Array.from(document.links).filter(link => link.innerText.includes(value)).length
+};
+const find = finders[by];
+let matches;
+try {
+    matches = find();
+} catch (error) {
+    return {error: String(error)};
+}
+const start = performance.now();
+for (let index = 0; index < repeats; index++) {
+    find();
+}
+return {matches: matches, total_ms: performance.now() - start};
+"""
+"""Скрипт, вычисляющий локатор заданное число раз внутри страницы (без сетевых обращений к драйверу)."""
+
+SIMPLE_XPATH_PATTERN = re.compile(r"^//(\*|[\w-]+)((?:\[[^\[\]]+\])+)$")
+ATTRIBUTE_PATTERN = re.compile(r"^@([\w-]+)\s*=\s*'([^']*)'$")
+CLASS_CONTAINS_PATTERN = re.compile(r"^//(\*|[\w-]+)\[contains\(@class,\s*'([\w\s-]+)'\)\]$")
+TEXT_SCAN_PATTERN = re.compile(r"^//\*\[(?:text\(\)|normalize-space\(\)|\.)\s*=")
+
+
+def extract_locators(paths: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Извлекает статические локаторы из исходного кода page-объектов.
+
+    Локатором считается пара (By.<СТРАТЕГИЯ>, "<значение>") в кортеже или в аргументах вызова
+    (find_element, find_elements, ожидания EC). Локаторы, формируемые динамически (f-строки), пропускаются.
+
+    :param paths: List[str]/None: Пути к файлам; по умолчанию все модули UI/*.py.
+    :return: List[Dict]: Локаторы с указанием файла, строки и функции, в которой они используются.
+    """
+    paths = paths or sorted(glob.glob(os.path.join(ROOT_DIR, "UI", "*.py")))
+    locators = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            tree = ast.parse(file.read(), filename=path)
+
+        functions = {}
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                for child in ast.walk(node):
+                    functions.setdefault(id(child), node.name)
+
+        for node in ast.walk(tree):
+            items = node.elts if isinstance(node, ast.Tuple) else node.args if isinstance(node, ast.Call) else None
+            if not items or len(items) < 2:
+                continue
+            strategy, value = items[0], items[1]
+            if (isinstance(strategy, ast.Attribute) and isinstance(strategy.value, ast.Name)
+                    and strategy.value.id == "By" and isinstance(value, ast.Constant)
+                    and isinstance(value.value, str)):
+                locators.append({
+                    "file": os.path.relpath(path, ROOT_DIR),
+                    "line": node.lineno,
+                    "function": functions.get(id(node), "<module>"),
+                    "by": getattr(By, strategy.attr),
+                    "value": value.value
+                })
+
+    unique = {}
+    for locator in locators:
+        unique.setdefault((locator["file"], locator["line"], locator["by"], locator["value"]), locator)
+    return list(unique.values())
+
+
+def xpath_to_css(tag: str, attributes: List[tuple]) -> Dict:
+    """
+    Преобразует XPath вида //tag[@attr='v' and ...] в CSS-селектор (или поиск по id).
+
+    Равенство @class заменяется селектором по классам: он не зависит от порядка классов,
+    поэтому число совпадений стоит сверить в отчёте.
+
+    :param tag: str: Тег или "*".
+    :param attributes: List[tuple]: Пары "атрибут – значение".
+    :return: Dict: Локатор ("by", "value").
+    """
+    if tag == "*" and len(attributes) == 1 and attributes[0][0] == "id":
+        return {"by": By.ID, "value": attributes[0][1]}
+    selector = "" if tag == "*" else tag
+    for name, attribute_value in attributes:
+        if name == "class" and attribute_value.strip():
+            selector += "".join(f".{item}" for item in attribute_value.split())
+        else:
+            selector += f"[{name}='{attribute_value}']"
+    return {"by": By.CSS_SELECTOR, "value": selector}
+
+
+def suggest_alternative(by: str, value: str) -> Optional[Dict]:
+    """
+    Предлагает более быстрый эквивалент локатора.
+
+    Правила:
+        - XPath с проверкой только атрибутов (//tag[@attr='v']) заменяется CSS-селектором,
+          а равенство @class — селектором по классам (без зависимости от порядка классов);
+        - //*[@id='x'] заменяется поиском по id;
+        - contains(@class, 'x') заменяется CSS-селектором по классу;
+        - для сканирования всего документа по тексту (//*[text()=...]) рекомендуется указать тег и контейнер.
+
+    :param by: str: Стратегия поиска.
+    :param value: str: Значение локатора.
+    :return: Dict/None: Предлагаемый локатор ("by", "value", "note") либо None.
+    """
+    if by != By.XPATH:
+        return None
+
+    match = SIMPLE_XPATH_PATTERN.match(value)
+    if match:
+        tag = match.group(1)
+        conditions = [
+            condition.strip() for predicate in re.findall(r"\[([^\[\]]+)\]", match.group(2))
+            for condition in predicate.split(" and ")]
+        attributes = [ATTRIBUTE_PATTERN.match(condition) for condition in conditions]
+        if all(attributes):
+            return {**xpath_to_css(tag, [attribute.groups() for attribute in attributes]),
+                    "note": "CSS-селектор вместо XPath"}
+
+    match = CLASS_CONTAINS_PATTERN.match(value)
+    if match:
+        tag = "" if match.group(1) == "*" else match.group(1)
+        classes = "".join(f".{item}" for item in match.group(2).split())
+        return {"by": By.CSS_SELECTOR, "value": tag + classes, "note": "CSS-селектор по классам"}
+
+    if TEXT_SCAN_PATTERN.match(value):
+        return {"by": None, "value": None,
+                "note": "сканирование всего документа по тексту: укажите тег вместо * и ограничьте поиск контейнером"}
+    if "text()" in value and value.startswith("//"):
+        return {"by": None, "value": None,
+                "note": "условие по тексту не выражается CSS: найдите элемент по атрибутам и проверьте текст в коде"}
+    return None
+
+
+class LocatorProfiler:
+    """
+    Класс измеряет стоимость вычисления локаторов в браузере.
+
+    Каждый локатор вычисляется внутри страницы "locator_profile_repeats" раз (время без учёта сетевых обращений
+    к драйверу); дополнительно измеряется полный цикл find_elements через WebDriver.
+    """
+
+    def __init__(self, driver: WebDriver, repeats: Optional[int] = None) -> None:
+        """
+        :param driver: WebDriver: Экземпляр веб-драйвера.
+        :param repeats: int/None: Количество вычислений каждого локатора.
+        """
+        self.driver = driver
+        self.repeats = repeats or ConfigProvider().get_int("ui", "locator_profile_repeats")
+
+    def evaluate(self, by: str, value: str) -> Dict:
+        """
+        Измеряет стоимость вычисления одного локатора на текущей странице.
+
+        :param by: str: Стратегия поиска.
+        :param value: str: Значение локатора.
+        :return: Dict: Количество совпадений, среднее время вычисления в странице и полного цикла find_elements (мс).
+        """
+        result = self.driver.execute_script(EVALUATE_SCRIPT, by, value, self.repeats)
+        if "error" in result:
+            return {"error": result["error"]}
+
+        start = time.perf_counter()
+        for _ in range(5):
+            self.driver.find_elements(by, value)
+        roundtrip_ms = (time.perf_counter() - start) * 1000 / 5
+
+        return {
+            "matches": result["matches"],
+            "eval_ms": result["total_ms"] / self.repeats,
+            "roundtrip_ms": roundtrip_ms
+        }
+
+    def profile_page(self, locators: List[Dict], page: str) -> List[Dict]:
+        """
+        Измеряет все локаторы и предложенные эквиваленты на текущей странице.
+
+        :param locators: List[Dict]: Локаторы (см. extract_locators).
+        :param page: str: Название страницы или снимка для отчёта.
+        :return: List[Dict]: Результаты измерений.
+        """
+        self.driver.implicitly_wait(0)
+        results = []
+        for locator in locators:
+            result = dict(locator, page=page, **self.evaluate(locator["by"], locator["value"]))
+            suggestion = suggest_alternative(locator["by"], locator["value"])
+            if suggestion:
+                result["suggestion"] = dict(suggestion)
+                if suggestion["by"]:
+                    result["suggestion"].update(self.evaluate(suggestion["by"], suggestion["value"]))
+            results.append(result)
+        return results
+
+    def profile_snapshots(self, locators: List[Dict], snapshot_dir: str) -> List[Dict]:
+        """
+        Измеряет локаторы на всех сохранённых снимках страниц (*.html) в каталоге.
+
+        :param locators: List[Dict]: Локаторы (см. extract_locators).
+        :param snapshot_dir: str: Каталог со снимками.
+        :return: List[Dict]: Результаты измерений.
+        """
+        results = []
+        for path in sorted(glob.glob(os.path.join(snapshot_dir, "*.html"))):
+            self.driver.get("file://" + os.path.abspath(path))
+            results.extend(self.profile_page(locators, os.path.basename(path)))
+        return results
+
+
+def save_snapshot(driver: WebDriver, snapshot_dir: str, name: str) -> str:
+    """
+    Сохраняет DOM текущей страницы как снимок для последующего профилирования.
+
+    :param driver: WebDriver: Экземпляр веб-драйвера.
+    :param snapshot_dir: str: Каталог со снимками.
+    :param name: str: Название снимка.
+    :return: str: Путь к файлу снимка.
+    """
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = os.path.join(snapshot_dir, f"{name}.html")
+    html = driver.execute_script("return document.documentElement.outerHTML;")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("<!DOCTYPE html>\n" + html)
+    return path
+
+
+def format_report(results: List[Dict], limit: int = 20) -> str:
+    """
+    Формирует текстовый отчёт о самых дорогих локаторах.
+
+    :param results: List[Dict]: Результаты измерений.
+    :param limit: int: Количество локаторов в отчёте.
+    :return: str: Текст отчёта.
+    """
+    aggregated = {}
+    for result in results:
+        if "error" in result:
+            continue
+        key = (result["file"], result["line"], result["value"])
+        item = aggregated.setdefault(key, dict(result, eval_ms=0.0, matches_by_page={}))
+        item["eval_ms"] = max(item["eval_ms"], result["eval_ms"])
+        item["matches_by_page"][result["page"]] = result["matches"]
+
+    lines = [f"{'мкс/выч.':>9} {'совп.':>6}  локатор"]
+    for item in sorted(aggregated.values(), key=lambda entry: entry["eval_ms"], reverse=True)[:limit]:
+        matches = max(item["matches_by_page"].values())
+        lines.append(f"{item['eval_ms'] * 1000:9.1f} {matches:6d}  {item['file']}:{item['line']} "
+                     f"{item['function']}  {item['by']}={item['value']!r}")
+        suggestion = item.get("suggestion")
+        if suggestion:
+            measured = f" ({suggestion['eval_ms'] * 1000:.1f} мкс, совп. {suggestion['matches']})" \
+                if "eval_ms" in suggestion else ""
+            target = f"{suggestion['by']}={suggestion['value']!r}" if suggestion["by"] else ""
+            lines.append(f"{'':17}-> {suggestion['note']} {target}{measured}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Запуск профилировщика из командной строки."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from UI.driver_resolver import DriverResolver
+
+    parser = argparse.ArgumentParser(description="Профилирование стоимости локаторов page-объектов")
+    parser.add_argument("--url", help="Профилировать живую страницу по URL вместо снимков")
+    parser.add_argument("--save-snapshot", metavar="NAME", help="Сохранить снимок страницы --url и выйти")
+    parser.add_argument("--repeats", type=int, help="Количество вычислений каждого локатора")
+    parser.add_argument("--limit", type=int, default=20, help="Количество локаторов в отчёте")
+    args = parser.parse_args()
+    if args.save_snapshot and not args.url:
+        parser.error("--save-snapshot требует --url")
+
+    snapshot_dir = ConfigProvider().get("ui", "snapshot_dir")
+    browser_name = ConfigProvider().get("ui", "browser_name")
+    driver_path = DriverResolver(browser_name).resolve()
+    if browser_name == "Chrome":
+        driver = webdriver.Chrome(service=Service(driver_path))
+    else:
+        driver = webdriver.Firefox(service=FirefoxService(driver_path))
+
+    try:
+        if args.save_snapshot:
+            driver.get(args.url)
+            print(save_snapshot(driver, snapshot_dir, args.save_snapshot))
+            return
+
+        locators = extract_locators()
+        profiler = LocatorProfiler(driver, args.repeats)
+        if args.url:
+            driver.get(args.url)
+            results = profiler.profile_page(locators, args.url)
+        else:
+            results = profiler.profile_snapshots(locators, snapshot_dir)
+
+        report_path = ConfigProvider().get("ui", "locator_profile_path")
+        with open(report_path, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+        print(format_report(results, args.limit))
+        print(f"Полный отчёт: {report_path}")
+    except WebDriverException as error:
+        print(f"Ошибка браузера: {error.msg}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
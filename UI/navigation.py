@@ -1,9 +1,49 @@
 import allure
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from configuration.ConfigProvider import ConfigProvider
+from UI.performance import measure_performance
+from UI.element_cache import ElementCache
+
+ROUTES = {
+    "main": {
+        "path": "",
+        "link": (By.XPATH, "//span[@class='header__logo-wrapper']"),
+        "ready": (By.XPATH, "//div[@class='main-page__banners']")
+    },
+    "profile": {
+        "path": "profile",
+        "link": (By.CSS_SELECTOR, "button.header-controls__btn[aria-label='Меню профиля']"),
+        "ready": (By.XPATH, "//h2[@class='profile-page__title']")
+    },
+    "orders": {
+        "path": "profile/orders",
+        "link": (By.CSS_SELECTOR, "button.header-controls__btn.header-controls__btn--mh[aria-label='Заказы']"),
+        "ready": (By.XPATH, "//h2[@class='profile-orders-page__title']")
+    },
+    "bookmarks": {
+        "path": "profile/bookmarks",
+        "link": (By.CSS_SELECTOR, "button.header-controls__btn[aria-label='Закладки']"),
+        "ready": (By.XPATH, "//h1[@class='bookmarks-page__title']")
+    },
+    "cart": {
+        "path": "cart",
+        "link": (By.CSS_SELECTOR, "button.header-controls__btn[aria-label='Корзина']"),
+        "ready": (By.XPATH, "//h1[@class='cart-page__title']")
+    }
+}
+"""
+Таблица маршрутов: раздел магазина – путь, локатор ссылки в шапке и локатор элемента готовности страницы.
+
+Ссылки в шапке находятся через ElementCache: повторные обращения к ссылке на одной странице
+не требуют повторного поиска элемента; после перехода в другой раздел кэш очищается.
+"""
+
+AUTH_MODAL = (By.XPATH, "//p[@class='auth-modal-content__text']")
 
 
 class Navigation:
@@ -15,109 +55,102 @@ class Navigation:
         :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
         """
         self.__driver = driver
+        self.elements = ElementCache.for_driver(driver)
 
-    @allure.step("Переход на главную страницу магазина")
-    def go_main(self) -> None:
+    @measure_performance("go_section:{section}")
+    @allure.step("Переход в раздел {section} по ссылке в шапке")
+    def go_section(self, section: str) -> str:
         """
-        Перенаправляет пользователя на главную страницу магазина.
+        Перенаправляет пользователя в раздел магазина кликом по ссылке в шапке сайта.
 
-        Примечание: Не работает, если использовать на главной странице.
+        :param section: str: Название раздела из таблицы ROUTES.
+
+        :returns: str: URL открывшейся страницы.
         """
-        with allure.step("Клик на логотип для перехода на главную страницу"):
-            self.__driver.find_element(
-                By.XPATH, "//span[@class='header__logo-wrapper']").click()
+        route = ROUTES[section]
+        with allure.step(f"Клик на ссылку раздела {section}"):
+            self.elements.find(route["link"]).click()
 
-        with allure.step("Ожидание отображения баннера с акциями"):
+        with allure.step(f"Ожидание готовности страницы раздела {section}"):
             WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//div[@class='main-page__banners']"))
+                EC.visibility_of_element_located(route["ready"])
             )
         return self.__driver.current_url
 
-    @allure.step("Переход в личный профиль")
-    def go_profile(self) -> None:
+    @measure_performance("open_section:{section}")
+    @allure.step("Переход в раздел {section} по прямой ссылке")
+    def open_section(self, section: str) -> str:
         """
-        Перенаправляет пользователя в личный профиль для доступа к личным данным и настройкам.
+        Открывает раздел магазина напрямую по URL, минуя клик по ссылке в шапке.
 
-        Примечание: Требуется авторизация.
+        Используется в тестах, которые проверяют не сам переход, а работу с нужной страницей.
+
+        :param section: str: Название раздела из таблицы ROUTES.
+
+        :returns: str: URL открывшейся страницы.
         """
-        with allure.step("Клик на иконку профиля для перехода в личный профиль"):
-            self.__driver.find_element(
-                By.CSS_SELECTOR,
-                "button.header-controls__btn[aria-label='Меню профиля']").click()
+        route = ROUTES[section]
+        self.__driver.get(self.get_section_url(section))
+        self.elements.invalidate()
 
-        with allure.step("Ожидание отображения заголовка профиля"):
+        with allure.step(f"Ожидание готовности страницы раздела {section}"):
             WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//h2[@class='profile-page__title']"))
+                EC.visibility_of_element_located(route["ready"])
             )
         return self.__driver.current_url
 
+    def get_section_url(self, section: str) -> str:
+        """
+        Формирует URL раздела магазина.
+
+        :param section: str: Название раздела из таблицы ROUTES.
+
+        :returns: str: URL раздела.
+        """
+        return urljoin(
+            ConfigProvider().get("ui", "base_url"),
+            ROUTES[section]["path"])
+
+    @allure.step("Переход на главную страницу магазина")
+    def go_main(self) -> str:
+        """
+        Перенаправляет пользователя на главную страницу магазина.
+
+        Примечание: Не работает, если использовать на главной странице.
+        """
+        return self.go_section("main")
+
+    @allure.step("Переход в личный профиль")
+    def go_profile(self) -> str:
+        """
+        Перенаправляет пользователя в личный профиль для доступа к личным данным и настройкам.
+
+        Примечание: Требуется авторизация.
+        """
+        return self.go_section("profile")
+
     @allure.step("Переход в заказы")
-    def go_orders(self) -> None:
+    def go_orders(self) -> str:
         """
         Перенаправляет пользователя в раздел заказов для просмотра истории покупок и статусов текущих заказов.
 
         Примечание: Требуется авторизация.
         """
-        with allure.step("Клик на иконку заказов для перехода в раздел заказов"):
-            self.__driver.find_element(
-                By.CSS_SELECTOR,
-                "button.header-controls__btn.header-controls__btn--mh[aria-label='Заказы']").click()
-
-        with allure.step("Ожидание отображения заголовка заказов"):
-            WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//h2[@class='profile-orders-page__title']"))
-            )
-        return self.__driver.current_url
+        return self.go_section("orders")
 
     @allure.step("Переход в закладки")
-    def go_bookmarks(self) -> None:
+    def go_bookmarks(self) -> str:
         """
         Перенаправляет пользователя в раздел закладок для просмотра добавленных товаров и отслеживания подписок.
 
         Примечание: Требуется авторизация.
         """
-        with allure.step("Клик на иконку закладок для перехода в закладки"):
-            self.__driver.find_element(
-                By.CSS_SELECTOR,
-                "button.header-controls__btn[aria-label='Закладки']").click()
-
-        with allure.step("Ожидание отображения заголовка закладок"):
-            WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//h1[@class='bookmarks-page__title']"))
-            )
-        return self.__driver.current_url
+        return self.go_section("bookmarks")
 
     @allure.step("Переход в корзину")
-    def go_cart(self) -> None:
+    def go_cart(self) -> str:
         """Перенаправляет пользователя в корзину для просмотра добавленных товаров и оформления заказов."""
-        with allure.step("Клик на иконку корзины для перехода в корзину"):
-            self.__driver.find_element(
-                By.CSS_SELECTOR,
-                "button.header-controls__btn[aria-label='Корзина']").click()
-
-        with allure.step("Ожидание отображения заголовка корзины"):
-            WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//h1[@class='cart-page__title']"))
-            )
-        return self.__driver.current_url
-
-    def go_main(self) -> None:
-        """Перенаправляет пользователя на главную страницу магазина."""
-        with allure.step("Клик на логотип для перехода на главную страницу"):
-            self.__driver.find_element(
-                By.XPATH, "//span[@class='header__logo-wrapper']").click()
-
-        with allure.step("Ожидание отображения баннера с акциями"):
-            WebDriverWait(self.__driver, 10).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//div[@class='main-page__banners']"))
-            )
-        return self.__driver.current_url
+        return self.go_section("cart")
 
     @allure.step("Попытка перехода в {section} без авторизации")
     def go_section_unauth(self, section: str) -> bool:
@@ -128,23 +161,12 @@ class Navigation:
         """
         with allure.step(f"Клик на иконку {section} для проверки отображения модального окна аутентификации"):
             try:
-                if section == "profile":
-                    self.__driver.find_element(
-                        By.CSS_SELECTOR,
-                        "button.header-controls__btn[aria-label='Меню профиля']").click()
-                elif section == "orders":
-                    self.__driver.find_element(
-                        By.CSS_SELECTOR,
-                        "button.header-controls__btn.header-controls__btn--mh[aria-label='Заказы']").click()
-                elif section == "bookmarks":
-                    self.__driver.find_element(
-                        By.CSS_SELECTOR, "button.header-controls__btn[aria-label='Закладки']").click()
+                self.elements.find(ROUTES[section]["link"]).click()
 
                 with allure.step("Ожидание отображения модального окна аутентификации"):
                     modal_element = WebDriverWait(
                         self.__driver, 10).until(
-                        EC.visibility_of_element_located(
-                            (By.XPATH, "//p[@class='auth-modal-content__text']")))
+                        EC.visibility_of_element_located(AUTH_MODAL))
                 return True if modal_element.is_displayed() else False
 
             except TimeoutException:
@@ -0,0 +1,143 @@
+import os
+import re
+import json
+import allure
+import inspect
+from functools import wraps
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+PERFORMANCE_SCRIPT = """
+const timeOrigin = performance.timeOrigin;
+const since = arguments[0] === timeOrigin ? arguments[1] : 0;
+const navigation = performance.getEntriesByType('navigation')[0];
+const paint = {};
+performance.getEntriesByType('paint').forEach(entry => paint[entry.name] = entry.startTime);
+const resources = performance.getEntriesByType('resource').filter(entry => entry.startTime >= since);
+const byType = {};
+resources.forEach(entry => {
+    const item = byType[entry.initiatorType] = byType[entry.initiatorType] || {count: 0, transfer_size: 0};
+    item.count += 1;
+    item.transfer_size += entry.transferSize || 0;
+});
+return {
+    url: location.href,
+    time_origin: timeOrigin,
+    now: performance.now(),
+    full_load: since === 0,
+    navigation: navigation ? {
+        dns: navigation.domainLookupEnd - navigation.domainLookupStart,
+        connect: navigation.connectEnd - navigation.connectStart,
+        ttfb: navigation.responseStart - navigation.requestStart,
+        response: navigation.responseEnd - navigation.responseStart,
+        dom_interactive: navigation.domInteractive,
+        dom_content_loaded: navigation.domContentLoadedEventEnd,
+        load: navigation.loadEventEnd,
+        transfer_size: navigation.transferSize
+    } : null,
+    paint: paint,
+    resource_count: resources.length,
+    transfer_size: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+    encoded_body_size: resources.reduce((total, entry) => total + (entry.encodedBodySize || 0), 0),
+    resources_by_type: byType
+};
+"""
+
+
+class PerformanceRecorder:
+    """
+    Класс собирает метрики производительности страниц из браузера после навигации и шагов теста.
+
+    Используются Navigation Timing, Paint Timing и Resource Timing API браузера. Для переходов внутри
+    одностраничного приложения учитываются только ресурсы, загруженные после предыдущего замера.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация без привязки к браузеру: до вызова start замеры не выполняются."""
+        self.__driver = None
+        self.test_name = None
+        self.records = []
+        self.time_origin = None
+        self.last_mark = 0
+
+    def start(self, driver: WebDriver, test_name: str) -> None:
+        """
+        Начинает сбор метрик для теста.
+
+        :param driver: WebDriver: Экземпляр веб-драйвера, из которого собираются метрики.
+        :param test_name: str: Идентификатор теста.
+        """
+        self.__driver = driver
+        self.test_name = test_name
+        self.records = []
+
+    def collect(self, label: str) -> Optional[Dict]:
+        """
+        Собирает метрики текущей страницы и добавляет их в запись теста.
+
+        :param label: str: Название шага или перехода, после которого выполнен замер.
+        :return: Dict/None: Собранные метрики либо None, если сбор не активен или не удался.
+        """
+        if self.__driver is None:
+            return None
+        try:
+            metrics = self.__driver.execute_script(
+                PERFORMANCE_SCRIPT, self.time_origin, self.last_mark)
+        except WebDriverException:
+            return None
+
+        self.time_origin = metrics["time_origin"]
+        self.last_mark = metrics["now"]
+        metrics["label"] = label
+        self.records.append(metrics)
+        return metrics
+
+    def finish(self, output_dir: str) -> List[Dict]:
+        """
+        Завершает сбор метрик для теста: сохраняет JSON-запись и прикладывает её к отчёту Allure.
+
+        :param output_dir: str: Каталог для JSON-записей.
+        :return: List[Dict]: Метрики, собранные за время теста.
+        """
+        records = self.records
+        if records:
+            body = json.dumps({"test": self.test_name, "records": records},
+                              ensure_ascii=False, indent=2)
+            os.makedirs(output_dir, exist_ok=True)
+            file_name = re.sub(r"[^\w.-]+", "_", self.test_name) + ".json"
+            with open(os.path.join(output_dir, file_name), "w", encoding="utf-8") as file:
+                file.write(body)
+
+            allure.attach(
+                body,
+                name="Performance Metrics",
+                attachment_type=allure.attachment_type.JSON)
+
+        self.__driver = None
+        self.test_name = None
+        self.records = []
+        return records
+
+
+recorder = PerformanceRecorder()
+
+
+def measure_performance(label: str):
+    """
+    Декоратор для методов page-объектов: после выполнения метода собирает метрики производительности страницы.
+
+    :param label: str: Название перехода или шага в записи метрик; может содержать
+                       подстановки аргументов метода, например "open_section:{section}".
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            recorder.collect(label.format(
+                **signature.bind(*args, **kwargs).arguments))
+            return result
+        return wrapper
+    return decorator
@@ -4,9 +4,43 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from typing import List
-import string
-import re
+from selenium.common.exceptions import TimeoutException
+from itertools import islice
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+from API.product_page_api import ProductPageApi
+from API.text_matching import MATCH_EXACT, classify_match, clean_title
+from configuration.ConfigProvider import ConfigProvider
+from UI.performance import measure_performance
+from UI.element_cache import ElementCache
+
+RESULTS_SCRIPT = """
+const articles = document.querySelectorAll("div.app-products-list.app-catalog__list article");
+return Array.from(articles).slice(arguments[0]).map(article => {
+    const link = article.querySelector(".product-card__caption .product-card__title");
+    return {
+        name: article.getAttribute("data-chg-product-name") || "",
+        link: link ? link.href : null,
+        title: link ? (link.getAttribute("title") || "").trim() : ""
+    };
+});
+"""
+"""Скрипт, возвращающий записи о товарах на странице результатов поиска, начиная с указанной позиции."""
+
+COUNT_SCRIPT = "return document.querySelectorAll('div.app-products-list.app-catalog__list article').length;"
+
+
+SEARCH_INPUT = (
+    By.XPATH,
+    "//input[@name='search' and @class='search-form__input search-form__input--search']")
+"""Локатор поля поиска в шапке сайта."""
+
+
+class SearchResult(NamedTuple):
+    """Товар из результатов поиска."""
+    name: str
+    link: Optional[str]
+    title: str
 
 
 class SearchPage:
@@ -18,7 +52,10 @@ class SearchPage:
         :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
         """
         self.__driver = driver
+        self.elements = ElementCache.for_driver(driver)
+        self.timeout = ConfigProvider().get_int("ui", "product_fetch_timeout")
 
+    @measure_performance("search_products")
     @allure.step("Поиск товаров по названию")
     def search_products(self, product_name: str) -> None:
         """
@@ -34,15 +71,11 @@ class SearchPage:
             5. Отправка формы поиска.
             6. Ожидание отображения результатов поиска.
         """
-        search_input_locator = (
-            By.XPATH,
-            "//input[@name='search' and @class='search-form__input search-form__input--search']")
-
         attempts = 0
         max_attempts = 3
 
         while attempts < max_attempts:
-            search_input = self.__driver.find_element(*search_input_locator)
+            search_input = self.elements.find(SEARCH_INPUT)
 
             with allure.step(f"Попытка {attempts + 1} ввода текста '{product_name}'"):
                 self.__driver.execute_script(
@@ -63,11 +96,46 @@ class SearchPage:
             search_input.send_keys(Keys.RETURN)
 
         with allure.step("Ожидание отображения результатов поиска"):
-            WebDriverWait(self.__driver, 10).until(
+            WebDriverWait(self.__driver, self.timeout).until(
                 EC.visibility_of_element_located(
                     (By.XPATH, "//div[@class='app-catalog__content']"))
             )
         self.__driver.refresh()
+        self.elements.invalidate()
+
+    @measure_performance("open_search_results")
+    @allure.step("Переход к результатам поиска товаров по прямой ссылке")
+    def open_search_results(self, product_name: str) -> None:
+        """
+        Метод открывает страницу результатов поиска напрямую по URL, минуя ввод текста в поле поиска.
+
+        Используется в тестах, которые проверяют не сам ввод запроса, а работу с результатами поиска.
+
+        :param product_name: str: Название товара для поиска.
+        """
+        with allure.step("Переход по ссылке на результаты поиска"):
+            self.__driver.get(self.get_search_url(product_name))
+            self.elements.invalidate()
+
+        with allure.step("Ожидание отображения результатов поиска"):
+            WebDriverWait(self.__driver, self.timeout).until(
+                EC.visibility_of_element_located(
+                    (By.XPATH, "//div[@class='app-catalog__content']"))
+            )
+
+    def get_search_url(self, product_name: str) -> str:
+        """
+        Формирует URL страницы результатов поиска.
+
+        Поисковая фраза кодируется в UTF-8 с процентным экранированием, поэтому запросы
+        на кириллице и с пробелами передаются корректно.
+
+        :param product_name: str: Название товара для поиска.
+
+        :return: str: URL страницы результатов поиска.
+        """
+        query = urlencode({"phrase": product_name}, quote_via=quote)
+        return urljoin(ConfigProvider().get("ui", "base_url"), "search") + "?" + query
 
     @allure.step("Проверка результатов поиска")
     def validate_search_results(
@@ -75,39 +143,32 @@ class SearchPage:
         """
         Проверяет, присутствуют ли ожидаемые названия товаров среди результатов поиска на веб-странице.
 
-        Данный метод ищет элементы, представляющие товары на странице, и проверяет, содержится ли хотя бы
-        одно из переданных названий в атрибутах этих элементов. Названия приводятся к унифицированному виду, чтобы избежать
-        ошибок, связанных с различиями в регистре или пунктуации.
+        Данный метод просматривает результаты поиска пачками (см. iter_search_results) и проверяет, содержится ли хотя бы
+        одно из переданных названий в атрибутах товаров. Просмотр прекращается при первом совпадении или после
+        "max_result_pages" страниц. Названия приводятся к унифицированному виду, чтобы избежать
+        ошибок, связанных с различиями в регистре или пунктуации. Совпадение по транслитерации
+        ("Harry Potter" вместо "Гарри Поттер") проверку не проходит и сообщается отдельно во вложении отчёта.
 
         :param product_name_variants: List[str]: Список ожидаемых названий товаров в результатах поиска.
 
         raise AssertionError: Если ни одно из заданных названий товаров не найдено в результатах поиска.
         """
-        with allure.step("Получение списка элементов, представляющих товары"):
-            product_elements = self.__driver.find_elements(
-                By.XPATH, "//div[contains(@class, 'app-products-list app-catalog__list')]//article")
-
-            normalized_variants = [
-                variant.lower().replace(
-                    '-',
-                    ' ').translate(
-                    str.maketrans(
-                        '',
-                        '',
-                        string.punctuation)) for variant in product_name_variants]
-
-        with allure.step("Поиск совпадений среди всех найденных элементов"):
-            product_found = any(
-                any(
-                    normalized_variant in product_element.get_attribute('data-chg-product-name').lower(
-                    ).replace('-', ' ').translate(str.maketrans('', '', string.punctuation))
-                    for normalized_variant in normalized_variants)
-                for product_element in product_elements
-            )
-
-        if not product_found:
-            raise AssertionError(
-                "Не найдено ни одного из названий в результатах поиска")
+        near_match = None
+        with allure.step("Поиск совпадений среди результатов поиска, страница за страницей"):
+            for batch in self.iter_search_results():
+                match = classify_match((result.name for result in batch), product_name_variants)
+                if match == MATCH_EXACT:
+                    return
+                near_match = near_match or match
+
+        if near_match is not None:
+            allure.attach(
+                f"Варианты: {product_name_variants}\nВид совпадения: {near_match}",
+                name="Нестрогое совпадение в результатах поиска",
+                attachment_type=allure.attachment_type.TEXT)
+        raise AssertionError(
+            "Не найдено ни одного из названий в результатах поиска"
+            + (f" (есть только нестрогое совпадение: {near_match})" if near_match else ""))
 
     @allure.step("Сравнение названий товаров в поиске с названиями на их страницах")
     def compare_search_and_product_titles(self, count: int) -> bool:
@@ -127,40 +188,236 @@ class SearchPage:
         Исключение:
             Если названия не совпадают, выводится сообщение об ошибке с указанием несоответствующих названий и ссылкой на страницу товара.
         """
-        product_links = []
-
-        captions = self.__driver.find_elements(
-            By.CLASS_NAME, "product-card__caption")
-        for caption in captions[:count]:
-            product_link_element = caption.find_element(
-                By.CLASS_NAME, "product-card__title")
-            product_link = product_link_element.get_attribute("href")
-            product_title = product_link_element.get_attribute("title").strip()
-            product_links.append((product_link, product_title))
+        product_links = self.get_search_product_links(count)
 
         for product_link, product_title in product_links:
             with allure.step(f"Переход на страницу товара {product_link}"):
                 self.__driver.get(product_link)
+                self.elements.invalidate()
 
                 product_page_title = self.__driver.find_element(
                     By.CSS_SELECTOR, "h1[itemprop='name']").text.strip()
 
-            try:
-                with allure.step("Сравнение названия товара из результатов поиска с названием на его странице"):
-                    assert self.clean_title(product_page_title.lower()) == self.clean_title(product_title.lower(
-                    )), f"Ошибка: '{product_page_title}' не совпадает с '{product_title}'. Ссылка на страницу товара: {product_link}"
+            self.check_product_title(
+                product_link, product_title, product_page_title)
+
+    @allure.step("Параллельное сравнение названий товаров в поиске с названиями на их страницах")
+    def compare_search_and_product_titles_concurrently(
+            self, count: int) -> None:
+        """
+        Метод сравнивает названия товаров из результатов поиска с названиями на страницах товаров,
+        не переходя на эти страницы в текущей вкладке браузера.
+
+        :param count: int: Количество товаров, для которых необходимо провести сравнение.
+
+        Процесс:
+            1. Извлекает названия и ссылки на товары из результатов поиска, ограничиваясь заданным количеством.
+            2. Параллельно загружает страницы товаров по HTTP и извлекает названия из HTML-разметки.
+            3. Для страниц, название на которых формируется только в браузере, открывает их параллельно в новых вкладках.
+            4. Сравнивает название товара на странице с названием из результатов поиска.
+        """
+        product_links = self.get_search_product_links(count)
+        user_agent = self.__driver.execute_script("return navigator.userAgent;")
+
+        product_page_titles = ProductPageApi(user_agent).get_product_titles(
+            [product_link for product_link, _ in product_links])
+
+        missing_links = [
+            product_link for product_link,
+            product_page_title in product_page_titles.items() if product_page_title is None]
+        if missing_links:
+            product_page_titles.update(
+                self.get_product_titles_in_tabs(missing_links))
+
+        for product_link, product_title in product_links:
+            self.check_product_title(
+                product_link, product_title, product_page_titles[product_link])
+
+    @allure.step("Получение ссылок и названий товаров из результатов поиска")
+    def get_search_product_links(self, count: int) -> List[Tuple[str, str]]:
+        """
+        Извлекает ссылки и названия товаров из результатов поиска.
+
+        При необходимости обходит следующие страницы результатов, пока не наберётся нужное количество товаров.
+
+        :param count: int: Максимальное количество товаров.
+
+        :return: List[Tuple[str, str]]: Список пар "ссылка на страницу товара – название товара".
+        """
+        results = (
+            result for batch in self.iter_search_results()
+            for result in batch if result.link)
+        return [(result.link, result.title) for result in islice(results, count)]
+
+    def iter_search_results(
+            self,
+            batch_size: Optional[int] = None,
+            max_pages: Optional[int] = None) -> Iterator[List[SearchResult]]:
+        """
+        Лениво обходит результаты поиска, начиная с открытой страницы, и возвращает товары пачками.
+
+        Сначала считываются товары текущей страницы; если страница подгружает товары при прокрутке, она прокручивается
+        до конца, пока появляются новые товары. Затем открывается следующая страница результатов (параметр page в URL).
+        Следующая страница загружается только тогда, когда вызывающий код запросил очередную пачку, поэтому
+        проверка, остановившаяся на первом совпадении, не загружает лишних страниц, а в памяти находится одна пачка.
+
+        :param batch_size: int/None: Размер пачки; по умолчанию "result_batch_size" из секции "search".
+        :param max_pages: int/None: Максимальное количество страниц; по умолчанию "max_result_pages" из секции "search".
+
+        :return: Iterator[List[SearchResult]]: Генератор пачек товаров.
+        """
+        batch_size = batch_size or ConfigProvider().get_int("search", "result_batch_size")
+        max_pages = max_pages or ConfigProvider().get_int("search", "max_result_pages")
+        first_page_url = self.__driver.current_url
+        seen_links = set()
+
+        for page in range(1, max_pages + 1):
+            if page > 1 and not self.open_results_page(first_page_url, page):
+                return
+
+            offset = 0
+            new_results = 0
+            while True:
+                records = self.__driver.execute_script(RESULTS_SCRIPT, offset)
+                offset += len(records)
+                results = [
+                    SearchResult(**record) for record in records
+                    if record["link"] not in seen_links]
+                seen_links.update(result.link for result in results)
+                new_results += len(results)
+
+                for start in range(0, len(results), batch_size):
+                    yield results[start:start + batch_size]
+
+                if not records or not self.scroll_for_more_results(offset):
+                    break
+
+            if new_results == 0:
+                return
+
+    def open_results_page(self, first_page_url: str, page: int) -> bool:
+        """
+        Открывает указанную страницу результатов поиска.
+
+        :param first_page_url: str: URL первой страницы результатов.
+        :param page: int: Номер страницы.
+
+        :return: bool: True если на странице отобразились товары, иначе False.
+        """
+        scheme, netloc, path, query, fragment = urlsplit(first_page_url)
+        params = [(key, value) for key, value in parse_qsl(query) if key != "page"]
+        params.append(("page", str(page)))
+        self.__driver.get(urlunsplit(
+            (scheme, netloc, path, urlencode(params, quote_via=quote), fragment)))
+        self.elements.invalidate()
+
+        try:
+            WebDriverWait(self.__driver, self.timeout).until(
+                lambda driver: driver.execute_script(COUNT_SCRIPT) > 0)
+        except TimeoutException:
+            return False
+        return True
+
+    def scroll_for_more_results(self, count: int) -> bool:
+        """
+        Прокручивает страницу до конца и ожидает подгрузки товаров (для страниц с бесконечной прокруткой).
 
-            except AssertionError as e:
-                print(e)
+        Время ожидания задаётся параметром "result_scroll_timeout" в секции "search" (0 отключает прокрутку).
+
+        :param count: int: Количество уже загруженных товаров.
+
+        :return: bool: True если подгрузились новые товары, иначе False.
+        """
+        timeout = ConfigProvider().get_int("search", "result_scroll_timeout")
+        if not timeout:
+            return False
+
+        self.__driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(self.__driver, timeout).until(
+                lambda driver: driver.execute_script(COUNT_SCRIPT) > count)
+        except TimeoutException:
+            return False
+        return True
+
+    @allure.step("Получение названий товаров в параллельно открытых вкладках браузера")
+    def get_product_titles_in_tabs(
+            self, product_links: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Открывает страницы товаров одновременно в новых вкладках и считывает отображаемые названия.
+
+        Вкладки загружаются браузером параллельно, после чего поочерёдно опрашиваются.
+        Порядок window_handles WebDriver не гарантирует, поэтому вкладка каждой ссылки запоминается сразу после открытия.
+        Повторяющиеся ссылки открываются один раз; все открытые методом вкладки закрываются, даже если опрос прервался ошибкой.
+
+        :param product_links: List[str]: Список ссылок на страницы товаров.
+
+        :return: Dict[str, Optional[str]]: Словарь "ссылка – название товара" (None, если название не отобразилось).
+        """
+        original_handle = self.__driver.current_window_handle
+        initial_handles = set(self.__driver.window_handles)
+        known_handles = set(initial_handles)
+
+        product_page_titles = {}
+        try:
+            tab_handles = {}
+            for product_link in dict.fromkeys(product_links):
+                self.__driver.execute_script(
+                    "window.open(arguments[0], '_blank');", product_link)
+                opened_handles = set(self.__driver.window_handles) - known_handles
+                known_handles.update(opened_handles)
+                tab_handles[product_link] = opened_handles.pop() if len(opened_handles) == 1 else None
+
+            for product_link, handle in tab_handles.items():
+                product_page_titles[product_link] = None
+                if handle is None:
+                    continue
+                self.__driver.switch_to.window(handle)
+                try:
+                    product_page_titles[product_link] = WebDriverWait(self.__driver, self.timeout).until(
+                        EC.visibility_of_element_located(
+                            (By.CSS_SELECTOR, "h1[itemprop='name']"))).text.strip()
+                except TimeoutException:
+                    pass
+        finally:
+            with allure.step("Закрытие открытых вкладок"):
+                for handle in set(self.__driver.window_handles) - initial_handles:
+                    self.__driver.switch_to.window(handle)
+                    self.__driver.close()
+                self.__driver.switch_to.window(original_handle)
+        return product_page_titles
+
+    def check_product_title(
+            self,
+            product_link: str,
+            product_title: str,
+            product_page_title: Optional[str]) -> None:
+        """
+        Сравнивает название товара из результатов поиска с названием на его странице.
+
+        :param product_link: str: Ссылка на страницу товара.
+        :param product_title: str: Название товара из результатов поиска.
+        :param product_page_title: str/None: Название товара на его странице.
+
+        Исключение:
+            Если названия не совпадают, выводится сообщение об ошибке с указанием несоответствующих названий и ссылкой на страницу товара.
+        """
+        try:
+            with allure.step("Сравнение названия товара из результатов поиска с названием на его странице"):
+                assert product_page_title is not None and self.clean_title(product_page_title.lower()) == self.clean_title(product_title.lower(
+                )), f"Ошибка: '{product_page_title}' не совпадает с '{product_title}'. Ссылка на страницу товара: {product_link}"
+
+        except AssertionError as e:
+            print(e)
 
     def clean_title(self, title) -> str:
         """
         Функция удаляет ненужные символы из названия товара, включая текст в скобках, пробелы перед скобками и числа с плюсом.
 
+        Регулярное выражение компилируется один раз (см. API.text_matching.clean_title).
+
         :param title: str: Название товара, которое может быть получено любым способом.
 
         :return: str: Название товара без лишних символов.
         """
-        title_pattern = r'\s*\(.*?\)|\s*\d+\+'
-        cleared_title = re.sub(title_pattern, '', title)
-        return cleared_title.strip()
+        return clean_title(title)
@@ -0,0 +1,202 @@
+"""
+Запись архива сайта для офлайн-прогонов UI-тестов (воспроизводится сервером testdata.SiteArchive).
+
+Открывает в браузере страницы, с которыми работают page-объекты: главную, модальное окно авторизации, результаты поиска
+по первым запросам корпуса, страницы найденных товаров, корзину и оформление заказа. Адреса документов и всех
+загруженных страницами ресурсов (скрипты, стили, изображения, ответы API) берутся из Resource Timing API
+и повторно загружаются по HTTP с cookies браузера и токеном из test_data.json.
+
+Записываются только хосты доменов "archive_domains": хосты сайта и API отображаются в корень сервера архива,
+остальные (CDN, изображения) — в подкаталоги /_/<хост>/. Запросы, которые страница выполняет методами
+POST, PUT и DELETE, не записываются: изменения корзины обрабатывает CartBackend.
+
+Запуск:
+    python -m UI.site_recorder
+    python -m UI.site_recorder --queries 5 --products 2
+"""
+import re
+import time
+import argparse
+import requests
+from typing import Iterable, List
+from urllib.parse import urljoin, urlsplit
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from configuration.ConfigProvider import ConfigProvider
+from testdata.DataProvider import DataProvider
+from testdata.SearchCorpus import SearchCorpus
+from testdata.SiteArchive import ORIGIN_PLACEHOLDER, SiteArchive, is_text
+from UI.search_page import SearchPage
+
+RESOURCES_SCRIPT = """
+const entries = performance.getEntriesByType('resource').map(entry => entry.name);
+performance.clearResourceTimings();
+performance.setResourceTimingBufferSize(10000);
+return [location.href].concat(entries);
+"""
+"""Скрипт, возвращающий адрес страницы и ресурсы, загруженные с момента предыдущего вызова."""
+
+LOGIN_BUTTON = (By.XPATH, "//*[text()='Войти']")
+"""Локатор кнопки, открывающей модальное окно авторизации (см. Authorization.login_with)."""
+
+
+class SiteRecorder:
+    """Класс записывает страницы сайта и их ресурсы в архив (см. SiteArchive)."""
+
+    def __init__(self, driver: WebDriver, archive: SiteArchive) -> None:
+        """
+        :param driver: WebDriver: Экземпляр веб-драйвера.
+        :param archive: SiteArchive: Архив, в который записываются ответы.
+        """
+        settings = ConfigProvider().settings
+        self.driver = driver
+        self.archive = archive
+        self.base_url = settings.ui.base_url
+        self.api_host = urlsplit(settings.api.cart_url).hostname
+        self.root_hosts = {
+            urlsplit(url).hostname
+            for url in (settings.ui.base_url, settings.api.cart_url, settings.search.search_url)}
+        self.domains = ConfigProvider().get_list("ui", "archive_domains")
+        self.host_pattern = re.compile(
+            rb"(?:https?:)?(?:\\?/){2}((?:[\w-]+\.)*(?:"
+            + b"|".join(re.escape(domain.encode()) for domain in self.domains)
+            + rb"))(?![\w.-])")
+        self.session = requests.Session()
+        self.recorded = set()
+
+    def is_archived(self, host: str) -> bool:
+        """Проверяет, записываются ли ответы указанного хоста."""
+        return host in self.root_hosts or any(
+            host == domain or host.endswith("." + domain) for domain in self.domains)
+
+    def local_path(self, host: str) -> str:
+        """Возвращает префикс пути, под которым ответы хоста доступны на сервере архива."""
+        return "" if host in self.root_hosts else f"/_/{host}"
+
+    def get_key(self, url: str) -> str:
+        """
+        Возвращает ключ архива для адреса.
+
+        :param url: str: Адрес ресурса.
+        :return: str: Путь на сервере архива со строкой запроса.
+        """
+        parts = urlsplit(url)
+        key = self.local_path(parts.hostname) + (parts.path or "/")
+        return f"{key}?{parts.query}" if parts.query else key
+
+    def rewrite(self, body: bytes) -> bytes:
+        """Заменяет в тексте ответа адреса записываемых хостов на адрес сервера архива."""
+        return self.host_pattern.sub(
+            lambda match: (ORIGIN_PLACEHOLDER + self.local_path(match.group(1).decode())).encode(), body)
+
+    def fetch(self, url: str) -> None:
+        """
+        Загружает ресурс по HTTP и добавляет ответ в архив.
+
+        Ошибки загрузки пропускаются: отсутствующий ресурс сервер архива отдаст с кодом 404.
+
+        :param url: str: Адрес ресурса.
+        """
+        parts = urlsplit(url)
+        key = self.get_key(url)
+        if parts.scheme not in ("http", "https") or not self.is_archived(parts.hostname) or key in self.recorded:
+            return
+        self.recorded.add(key)
+
+        headers = {}
+        if parts.hostname == self.api_host:
+            headers["Authorization"] = DataProvider().get_token()
+        cookies = {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+        try:
+            response = self.session.get(url, headers=headers, cookies=cookies, timeout=30)
+        except requests.RequestException:
+            return
+
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        body = self.rewrite(response.content) if is_text(content_type) else response.content
+        self.archive.add(key, response.status_code, content_type, body)
+
+    def capture(self, settle: float = 2) -> None:
+        """
+        Записывает текущую страницу и ресурсы, загруженные ею с предыдущей записи.
+
+        :param settle: float: Время ожидания фоновых запросов страницы, сек.
+        """
+        time.sleep(settle)
+        for url in self.driver.execute_script(RESOURCES_SCRIPT):
+            self.fetch(url)
+
+    def visit(self, path: str) -> None:
+        """Открывает страницу сайта по пути относительно "base_url" и записывает её."""
+        self.driver.get(urljoin(self.base_url, path))
+        self.capture()
+
+    def record(self, queries: Iterable[str], products: int) -> int:
+        """
+        Записывает страницы, с которыми работают page-объекты, и сохраняет индекс архива.
+
+        :param queries: Iterable[str]: Поисковые запросы.
+        :param products: int: Количество страниц товаров, записываемых для каждого запроса.
+        :return: int: Количество записанных ответов.
+        """
+        self.visit("")
+        self.session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent;")
+        try:
+            self.driver.find_element(*LOGIN_BUTTON).click()
+            self.capture()
+        except WebDriverException:
+            pass
+
+        search = SearchPage(self.driver)
+        for query in queries:
+            self.visit("")
+            search.search_products(query)
+            self.capture()
+            search.open_search_results(query)
+            self.capture()
+            for link, _ in search.get_search_product_links(products):
+                self.driver.get(link)
+                self.capture()
+
+        self.visit("cart")
+        self.visit("checkout")
+        self.archive.save_index()
+        return len(self.recorded)
+
+
+def main() -> None:
+    """Запись архива из командной строки."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from UI.driver_resolver import DriverResolver
+
+    settings = ConfigProvider().settings
+    parser = argparse.ArgumentParser(description="Запись архива сайта для офлайн-прогонов UI-тестов")
+    parser.add_argument("--queries", type=int, default=settings.search.corpus_sample,
+                        help="Количество запросов корпуса, результаты которых записываются")
+    parser.add_argument("--products", type=int, default=settings.ui.archive_products,
+                        help="Количество страниц товаров для каждого запроса")
+    args = parser.parse_args()
+
+    driver_path = DriverResolver(settings.ui.browser_name).resolve()
+    if settings.ui.browser_name == "Chrome":
+        driver = webdriver.Chrome(service=Service(driver_path))
+    else:
+        driver = webdriver.Firefox(service=FirefoxService(driver_path))
+    driver.implicitly_wait(settings.ui.timeout)
+
+    queries: List[str] = [
+        case.query for case in SearchCorpus(settings.search.corpus_path).head(args.queries)]
+    try:
+        count = SiteRecorder(driver, SiteArchive(settings.ui.archive_dir)).record(queries, args.products)
+        print(f"Записано ответов: {count}, архив: {settings.ui.archive_dir}")
+    except WebDriverException as error:
+        print(f"Ошибка браузера: {error.msg}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import allure
+from typing import Callable, List, Optional
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+CART_INDICATOR_SCRIPT = """
+const indicator = document.querySelector(
+    'div.chg-indicator.chg-indicator--bg-cherry.chg-indicator--mod-m-l.header-controls__indicator');
+return indicator ? parseInt(indicator.textContent, 10) || 0 : 0;
+"""
+
+LOGIN_LINK_SCRIPT = """
+return document.evaluate("//*[text()='Войти']", document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+"""
+
+AUTH_MODAL_SCRIPT = """
+const modal = document.querySelector('p.auth-modal-content__text');
+return modal !== null && modal.offsetParent !== null;
+"""
+
+
+class StateReset:
+    """
+    Класс для точечного сброса состояния браузера между тестами без полной перезагрузки страницы.
+
+    Очищает только изменённое состояние (cookies, localStorage/sessionStorage, модальные окна),
+    проверяет результат одним запросом JavaScript и перезагружает страницу лишь тогда,
+    когда на ней действительно осталось устаревшее состояние.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        """
+        Инициализирует объект с предоставленным веб-драйвером.
+
+        :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
+        """
+        self.__driver = driver
+
+    @allure.step("Очистка localStorage и sessionStorage")
+    def clear_storage(self) -> None:
+        """Очищает localStorage и sessionStorage текущего домена."""
+        self.__driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();")
+
+    @allure.step("Удаление cookies")
+    def delete_cookies(self, names: Optional[List[str]] = None) -> None:
+        """
+        Удаляет указанные cookies либо все cookies, если имена не переданы.
+
+        :param names: List[str]/None: Имена удаляемых cookies.
+        """
+        if names is None:
+            self.__driver.delete_all_cookies()
+        else:
+            for name in names:
+                self.__driver.delete_cookie(name)
+
+    def reload_if(self, is_stale: Callable[[], bool]) -> bool:
+        """
+        Перезагружает страницу, только если на ней осталось устаревшее состояние.
+
+        :param is_stale: Callable[[], bool]: Проверка, возвращающая True, если состояние страницы устарело.
+        :return: bool: True если страница была перезагружена, иначе False.
+        """
+        if not is_stale():
+            return False
+
+        with allure.step("Перезагрузка страницы с устаревшим состоянием"):
+            self.__driver.refresh()
+        return True
+
+    def get_cart_indicator(self) -> int:
+        """
+        Получает значение индикатора корзины одним запросом JavaScript, без неявного ожидания.
+
+        :return: int: Значение индикатора корзины или 0, если индикатор не отображается.
+        """
+        return self.__driver.execute_script(CART_INDICATOR_SCRIPT)
+
+    @allure.step("Синхронизация индикатора корзины со значением {expected}")
+    def sync_cart_indicator(self, expected: int) -> bool:
+        """
+        Приводит индикатор корзины в шапке к ожидаемому значению после изменения корзины через API.
+
+        :param expected: int: Ожидаемое количество товаров в корзине.
+        :return: bool: True если для синхронизации потребовалась перезагрузка страницы, иначе False.
+        """
+        reloaded = self.reload_if(
+            lambda: self.get_cart_indicator() != expected)
+
+        with allure.step("Проверка значения индикатора корзины"):
+            WebDriverWait(self.__driver, 10).until(
+                lambda driver: self.get_cart_indicator() == expected)
+        return reloaded
+
+    @allure.step("Сброс авторизации в браузере")
+    def reset_auth(self, reload_if_stale: bool = True) -> bool:
+        """
+        Удаляет cookies и хранилища браузера, чтобы пользователь стал неавторизованным.
+
+        :param reload_if_stale: bool: Перезагружать ли страницу, если она всё ещё отображает авторизованного
+                                пользователя. Можно отключить, если следующим шагом выполняется переход на другую страницу.
+        :return: bool: True если потребовалась перезагрузка страницы, иначе False.
+        """
+        self.delete_cookies()
+        self.clear_storage()
+        if not reload_if_stale:
+            return False
+
+        reloaded = self.reload_if(
+            lambda: not self.__driver.execute_script(LOGIN_LINK_SCRIPT))
+
+        with allure.step("Проверка отображения ссылки 'Войти'"):
+            WebDriverWait(self.__driver, 10).until(
+                lambda driver: driver.execute_script(LOGIN_LINK_SCRIPT))
+        return reloaded
+
+    @allure.step("Закрытие модального окна аутентификации")
+    def close_auth_modal(self) -> bool:
+        """
+        Закрывает модальное окно аутентификации клавишей Escape; перезагружает страницу, только если окно не закрылось.
+
+        :return: bool: True если потребовалась перезагрузка страницы, иначе False.
+        """
+        if not self.__driver.execute_script(AUTH_MODAL_SCRIPT):
+            return False
+
+        ActionChains(self.__driver).send_keys(Keys.ESCAPE).perform()
+        try:
+            WebDriverWait(self.__driver, 2).until(
+                lambda driver: not driver.execute_script(AUTH_MODAL_SCRIPT))
+            return False
+        except TimeoutException:
+            return self.reload_if(
+                lambda: self.__driver.execute_script(AUTH_MODAL_SCRIPT))
@@ -0,0 +1,215 @@
+import os
+import json
+import time
+import base64
+import allure
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+from configuration.ConfigProvider import ConfigProvider
+from testdata.DataProvider import DataProvider
+from testdata.WorkerResources import suffixed_path
+
+
+class StorageState:
+    """
+    Класс для сохранения и восстановления состояния авторизации браузера (cookies и localStorage).
+
+    Снимок состояния сохраняется в JSON-файл, путь к которому задаётся параметром "storage_state_path"
+    в секции "ui", и позволяет подготовить новый браузер без повторного входа по номеру телефона.
+    Снимок создаётся из токена test_data.json либо после входа по номеру телефона (тест test_login_with,
+    фикстура auth); сам класс вход не выполняет, так как для него нужен код из SMS.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        """
+        Инициализирует объект с предоставленным веб-драйвером.
+
+        :param driver: WebDriver: Экземпляр веб-драйвера для управления браузером.
+        """
+        self.__driver = driver
+        self.path = ConfigProvider().get("ui", "storage_state_path")
+        if len(DataProvider().get_tokens()) > 1:
+            self.path = suffixed_path(self.path, f"account{DataProvider().get_account_index()}")
+        self.ttl = ConfigProvider().get_int("ui", "storage_state_ttl")
+        self.base_url = ConfigProvider().get("ui", "base_url")
+
+    @allure.step("Сохранение состояния авторизации браузера")
+    def save(self) -> Dict:
+        """
+        Сохраняет cookies и содержимое localStorage текущей страницы в файл.
+
+        :return: Dict: Сохранённое состояние.
+        """
+        state = self.capture()
+        self.write(state)
+        return state
+
+    def capture(self) -> Dict:
+        """
+        Снимает cookies и содержимое localStorage текущей страницы без записи в файл.
+
+        :return: Dict: Состояние браузера.
+        """
+        return {
+            "saved_at": time.time(),
+            "cookies": self.__driver.get_cookies(),
+            "local_storage": self.__driver.execute_script(
+                "return Object.assign({}, window.localStorage);")
+        }
+
+    def write(self, state: Dict) -> None:
+        """
+        Записывает состояние в файл.
+
+        Файл заменяется атомарно, поэтому другие воркеры xdist никогда не читают его частично записанным.
+
+        :param state: Dict: Состояние авторизации.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+
+    def load(self) -> Optional[Dict]:
+        """
+        Загружает сохранённое состояние из файла.
+
+        :return: Dict/None: Состояние авторизации либо None, если файл отсутствует или повреждён.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def is_expired(self, state: Dict) -> bool:
+        """
+        Проверяет, истёк ли срок действия состояния авторизации.
+
+        Срок определяется по полю exp токена access-token, а если токен не удаётся разобрать —
+        по времени сохранения снимка и параметру "storage_state_ttl".
+
+        :param state: Dict: Состояние авторизации.
+        :return: bool: True если состояние устарело, иначе False.
+        """
+        now = time.time()
+        token = next(
+            (cookie.get("value") for cookie in state.get("cookies", [])
+             if cookie.get("name") == "access-token"), None)
+        if token is None:
+            return True
+
+        expires_at = self.get_token_expiry(token)
+        if expires_at is None:
+            expires_at = state.get("saved_at", 0) + self.ttl
+        return expires_at <= now
+
+    def get_token_expiry(self, token: str) -> Optional[float]:
+        """
+        Извлекает время истечения срока действия из JWT-токена.
+
+        :param token: str: Токен в формате "Bearer <jwt>" или "<jwt>".
+        :return: float/None: Время истечения срока действия (Unix time) либо None, если токен не удалось разобрать.
+        """
+        try:
+            payload = token.replace("Bearer", "").strip().split(".")[1]
+            payload += "=" * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+        except (IndexError, ValueError, KeyError, TypeError):
+            return None
+
+    def get_cookie_domain(self) -> str:
+        """Возвращает домен cookie авторизации по адресу сайта "base_url" (без префикса www)."""
+        host = urlsplit(self.base_url).hostname or ""
+        return host[4:] if host.startswith("www.") else host
+
+    def from_token(self) -> Dict:
+        """
+        Формирует состояние авторизации из токена, указанного в test_data.json.
+
+        :return: Dict: Состояние авторизации с единственной cookie access-token.
+        """
+        return {
+            "saved_at": time.time(),
+            "cookies": [{
+                "name": "access-token",
+                "value": DataProvider().get_token(),
+                "path": "/",
+                "domain": self.get_cookie_domain(),
+            }],
+            "local_storage": {}
+        }
+
+    @allure.step("Обновление устаревшего состояния авторизации из токена")
+    def refresh(self) -> Optional[Dict]:
+        """
+        Формирует новое состояние авторизации из токена test_data.json и сохраняет его.
+
+        :return: Dict/None: Новое состояние авторизации либо None, если срок действия токена тоже истёк.
+        """
+        state = self.from_token()
+        if self.is_expired(state):
+            return None
+        self.write(state)
+        return state
+
+    def get_valid_state(self) -> Optional[Dict]:
+        """
+        Возвращает актуальное состояние авторизации, при необходимости обновляя его.
+
+        :return: Dict/None: Состояние авторизации либо None, если его не удалось получить.
+        """
+        state = self.load()
+        if state is None or self.is_expired(state):
+            state = self.refresh()
+        return state
+
+    @allure.step("Подготовка браузера с сохранённым состоянием авторизации")
+    def prime(self) -> bool:
+        """
+        Восстанавливает состояние авторизации в браузере до первого перехода на страницы магазина.
+
+        Для установки cookies и localStorage открывается лёгкий ресурс того же домена (robots.txt),
+        поэтому первая загрузка страницы магазина сразу выполняется авторизованным пользователем.
+
+        :return: bool: True если состояние восстановлено, иначе False.
+        """
+        state = self.get_valid_state()
+        if state is None:
+            return False
+
+        self.restore(state)
+        return True
+
+    def restore(self, state: Dict) -> None:
+        """
+        Устанавливает состояние в браузер, открыв лёгкий ресурс того же домена (robots.txt).
+
+        :param state: Dict: Состояние браузера.
+        """
+        self.__driver.get(urljoin(self.base_url, "/robots.txt"))
+        self.apply(state)
+
+    @allure.step("Применение состояния авторизации к текущей странице")
+    def apply(self, state: Optional[Dict] = None) -> None:
+        """
+        Устанавливает cookies и localStorage из состояния авторизации на текущем домене.
+
+        :param state: Dict/None: Состояние авторизации; если не указано, используется актуальное сохранённое состояние.
+
+        raise RuntimeError: Если сохранённое состояние и токен test_data.json устарели.
+        """
+        state = state or self.get_valid_state()
+        if state is None:
+            raise RuntimeError(
+                f"Состояние авторизации {self.path} и токен test_data.json устарели: "
+                f"обновите токен или выполните вход по номеру телефона (pytest -k test_login_with)")
+        for cookie in state.get("cookies", []):
+            self.__driver.add_cookie(cookie)
+        for key, value in state.get("local_storage", {}).items():
+            self.__driver.execute_script(
+                "window.localStorage.setItem(arguments[0], arguments[1]);", key, value)
@@ -0,0 +1,211 @@
+import sys
+import json
+import time
+import allure_commons
+from typing import Dict, List, Optional, Tuple
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+TRACED_PROPERTIES = {
+    "text", "tag_name", "size", "location", "rect", "current_url", "title",
+    "page_source", "window_handles", "current_window_handle"
+}
+UNTRACED_METHODS = {"switch_to"}
+INFRASTRUCTURE_MODULES = {"UI.element_cache", "UI.browser_session", "UI.performance", "UI.state_reset"}
+"""Вспомогательные модули UI, через которые проходят команды page-объектов: их кадры при поиске метода пропускаются."""
+
+
+class CommandTracer:
+    """
+    Класс собирает сведения о командах WebDriver, выполненных page-объектами.
+
+    Каждая команда записывается вместе с длительностью, методом page-объекта, из которого она вызвана,
+    и активным шагом allure. По завершении сессии формируется отчёт о самых «разговорчивых» и медленных методах.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация трассировщика с пустым журналом команд."""
+        self.records = []
+        self.steps = []
+        self.enabled = False
+
+    def enable(self) -> None:
+        """Включает трассировку и подписывается на начало и завершение шагов allure."""
+        if not self.enabled:
+            allure_commons.plugin_manager.register(self)
+            self.enabled = True
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params) -> None:
+        self.steps.append((uuid, title))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb) -> None:
+        self.steps = [step for step in self.steps if step[0] != uuid]
+
+    def record(self, command: str, duration: float) -> None:
+        """
+        Записывает выполненную команду.
+
+        :param command: str: Название команды WebDriver (find_element, click, get и т.д.).
+        :param duration: float: Длительность выполнения команды в секундах.
+        """
+        page_object, method, in_wait = self.get_caller()
+        self.records.append({
+            "command": command,
+            "duration": duration,
+            "page_object": page_object,
+            "method": method,
+            "step": self.steps[-1][1] if self.steps else None,
+            "in_wait": in_wait
+        })
+
+    def get_caller(self) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Определяет метод page-объекта, из которого выполнена команда, и признак выполнения внутри ожидания.
+
+        Кадры вспомогательных модулей (кэш элементов, сессия браузера, сбор метрик) пропускаются,
+        поэтому команда засчитывается вызвавшему их методу page-объекта.
+
+        :return: Tuple: Имя класса page-объекта, имя метода и True, если команда выполнена внутри WebDriverWait.
+        """
+        page_object, method, in_wait = None, None, False
+        frame = sys._getframe(2)
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module == "selenium.webdriver.support.wait":
+                in_wait = True
+            elif page_object is None and module.startswith("UI.") and module != __name__ \
+                    and module not in INFRASTRUCTURE_MODULES and "self" in frame.f_locals:
+                page_object = type(frame.f_locals["self"]).__name__
+                method = frame.f_code.co_name
+            frame = frame.f_back
+        return page_object, method, in_wait
+
+    def get_summary(self) -> List[Dict]:
+        """
+        Агрегирует журнал команд по методам page-объектов.
+
+        :return: List[Dict]: Сводка по методам, отсортированная по суммарному времени выполнения команд.
+        """
+        summary = {}
+        for record in self.records:
+            key = f"{record['page_object']}.{record['method']}" if record["page_object"] else "<test>"
+            item = summary.setdefault(key, {
+                "method": key, "commands": 0, "in_wait": 0, "total_time": 0.0, "by_command": {}})
+            item["commands"] += 1
+            item["in_wait"] += record["in_wait"]
+            item["total_time"] += record["duration"]
+            item["by_command"][record["command"]] = item["by_command"].get(
+                record["command"], 0) + 1
+        return sorted(summary.values(), key=lambda item: item["total_time"], reverse=True)
+
+    def report(self, limit: int = 10) -> str:
+        """
+        Формирует текстовый отчёт о самых медленных и самых «разговорчивых» методах.
+
+        :param limit: int: Количество методов в каждом рейтинге.
+        :return: str: Текст отчёта.
+        """
+        summary = self.get_summary()
+        lines = [f"Команд WebDriver: {len(self.records)}, суммарное время: "
+                 f"{sum(record['duration'] for record in self.records):.2f} с"]
+
+        lines.append("Самые медленные методы:")
+        for item in summary[:limit]:
+            lines.append(
+                f"  {item['total_time']:8.2f} с  {item['commands']:6d} команд  {item['method']}")
+
+        lines.append("Самые «разговорчивые» методы:")
+        for item in sorted(summary, key=lambda item: item["commands"], reverse=True)[:limit]:
+            lines.append(
+                f"  {item['commands']:6d} команд ({item['in_wait']} в ожиданиях)  {item['method']}")
+
+        return "\n".join(lines)
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет журнал команд и сводку в JSON-файл.
+
+        :param path: str: Путь к файлу отчёта.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"summary": self.get_summary(), "records": self.records},
+                      file, ensure_ascii=False, indent=2)
+
+
+tracer = CommandTracer()
+
+
+def unwrap(value):
+    """Возвращает исходный объект Selenium для обёрток трассировки."""
+    if isinstance(value, (TracingWebDriver, TracingWebElement)):
+        return value._target
+    if isinstance(value, (list, tuple)):
+        return type(value)(unwrap(item) for item in value)
+    return value
+
+
+def wrap(value, command_tracer: CommandTracer):
+    """Оборачивает элементы, возвращённые командой WebDriver, для их дальнейшей трассировки."""
+    if isinstance(value, WebElement):
+        return TracingWebElement(value, command_tracer)
+    if isinstance(value, list) and value and all(
+            isinstance(item, WebElement) for item in value):
+        return [TracingWebElement(item, command_tracer) for item in value]
+    return value
+
+
+class TracingProxy:
+    """Базовая обёртка, замеряющая длительность обращений к объекту Selenium."""
+
+    def __init__(self, target, command_tracer: CommandTracer) -> None:
+        """
+        :param target: Оборачиваемый объект (WebDriver или WebElement).
+        :param command_tracer: CommandTracer: Трассировщик, в который записываются команды.
+        """
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_tracer", command_tracer)
+
+    def __getattr__(self, name):
+        start = time.perf_counter()
+        value = getattr(self._target, name)
+        if name in TRACED_PROPERTIES:
+            self._tracer.record(name, time.perf_counter() - start)
+            return wrap(value, self._tracer)
+        if not callable(value) or name.startswith("_") or name in UNTRACED_METHODS:
+            return value
+
+        def traced(*args, **kwargs):
+            call_start = time.perf_counter()
+            try:
+                return wrap(value(*unwrap(args), **{
+                    key: unwrap(item) for key, item in kwargs.items()}), self._tracer)
+            finally:
+                # Элементы из кэша (CachedElement) выполняют команды через WebDriver.execute:
+                # в журнал записывается сама команда WebDriver (clickElement, getElementText и т.д.).
+                command = args[0] if name == "execute" and args and isinstance(args[0], str) else name
+                self._tracer.record(command, time.perf_counter() - call_start)
+
+        return traced
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+    def __eq__(self, other):
+        return unwrap(self) == unwrap(other)
+
+    def __hash__(self):
+        return hash(self._target)
+
+
+class TracingWebDriver(TracingProxy):
+    """Обёртка над WebDriver, записывающая каждую команду в трассировщик."""
+
+    def __init__(self, driver: WebDriver,
+                 command_tracer: CommandTracer = tracer) -> None:
+        super().__init__(driver, command_tracer)
+
+
+class TracingWebElement(TracingProxy):
+    """Обёртка над WebElement, записывающая каждую команду в трассировщик."""
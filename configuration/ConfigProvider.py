@@ -1,15 +1,216 @@
+import os
 import configparser
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, List, Optional
 
-config = configparser.ConfigParser()
-config.read("./configuration/test_config.ini")
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""Корневой каталог проекта: относительные пути из конфигурации отсчитываются от него, а не от текущего каталога."""
+
+CONFIG_PATH = os.path.join(ROOT_DIR, "configuration", "test_config.ini")
+PROFILE_ENV = "CG_PROFILE"
+ENV_PREFIX = "CG_"
+DEFAULT_PROFILE = "live"
+
+
+@dataclass(frozen=True)
+class UiSettings:
+    """Настройки секции "ui"."""
+    base_url: str
+    browser_name: str
+    browsers: str
+    headless_browsers: str
+    background_launch: bool
+    chrome_driver_path: str
+    chrome_driver_version: str
+    firefox_driver_path: str
+    firefox_driver_version: str
+    driver_cache_dir: str
+    timeout: int
+    product_fetch_workers: int
+    product_fetch_timeout: int
+    storage_state_path: str
+    storage_state_ttl: int
+    prime_storage_state: bool
+    trace_commands: bool
+    trace_report_path: str
+    collect_performance: bool
+    performance_dir: str
+    recycle_after_tests: int
+    recycle_max_rss_mb: int
+    recycle_max_heap_mb: int
+    use_browser_daemon: bool
+    daemon_idle_timeout: int
+    daemon_state_path: str
+    snapshot_dir: str
+    locator_profile_repeats: int
+    locator_profile_path: str
+    archive_dir: str
+    archive_domains: str
+    archive_products: int
+    serve_archive: bool
+
+
+@dataclass(frozen=True)
+class ApiSettings:
+    """Настройки секции "api"."""
+    cart_url: str
+    request_delay: int
+    import_budget_ms: int
+    lock_dir: str
+    lock_timeout: int
+
+
+@dataclass(frozen=True)
+class SearchSettings:
+    """Настройки секции "search"."""
+    search_url: str
+    corpus_path: str
+    corpus_limit: int
+    corpus_sample: int
+    search_workers: int
+    search_page_size: int
+    min_pass_rate: float
+    match_threshold: float
+    result_batch_size: int
+    max_result_pages: int
+    result_scroll_timeout: int
+
+
+@dataclass(frozen=True)
+class RunSettings:
+    """Настройки секции "run"."""
+    durations_path: str
+    duration_smoothing: float
+    default_duration: float
+    order_by_duration: bool
+    collect_results: bool
+    results_db_path: str
+    results_db_url: str
+    results_batch_size: int
+    results_flush_interval: int
+    perf_gate: str
+    perf_baseline_path: str
+    perf_baseline_runs: int
+    perf_tolerance_p50: float
+    perf_tolerance_p95: float
+    perf_min_delta_ms: float
+    perf_report_limit: int
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Неизменяемый набор настроек выбранного профиля.
+
+    Объект сериализуется pickle, поэтому его можно без повторного чтения файла передавать в процессы-воркеры.
+    """
+    profile: str
+    ui: UiSettings
+    api: ApiSettings
+    search: SearchSettings
+    run: RunSettings
+
+
+SECTIONS = {"ui": UiSettings, "api": ApiSettings, "search": SearchSettings, "run": RunSettings}
+
+
+def convert(value: str, kind: type, name: str):
+    """
+    Приводит строковое значение из файла или переменной окружения к типу поля.
+
+    :param value: str: Исходное значение.
+    :param kind: type: Тип поля (str, int, float или bool).
+    :param name: str: Полное имя параметра для сообщения об ошибке.
+    :return: Значение нужного типа.
+    """
+    if kind is bool:
+        states = configparser.ConfigParser.BOOLEAN_STATES
+        if value.lower() not in states:
+            raise ValueError(f"Параметр {name}: ожидается логическое значение, получено {value!r}")
+        return states[value.lower()]
+    if kind is int:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"Параметр {name}: ожидается целое число, получено {value!r}") from None
+    if kind is float:
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"Параметр {name}: ожидается число, получено {value!r}") from None
+    if (name.endswith("_path") or name.endswith("_dir")) and value and not os.path.isabs(value):
+        return os.path.normpath(os.path.join(ROOT_DIR, value))
+    return value
+
+
+def get_profiles(parser: configparser.ConfigParser) -> set:
+    """Возвращает названия профилей, описанных в файле секциями вида [ui:<профиль>]."""
+    return {DEFAULT_PROFILE} | {
+        name.split(":", 1)[1] for name in parser.sections() if ":" in name}
+
+
+@lru_cache(maxsize=None)
+def load_settings(profile: str) -> Settings:
+    """
+    Загружает настройки профиля один раз за процесс.
+
+    Значения берутся из секций [ui], [api], [search] и [run], затем переопределяются секциями профиля ([ui:<профиль>] и т. д.)
+    и переменными окружения вида CG_<СЕКЦИЯ>_<ПАРАМЕТР> (например, CG_UI_TIMEOUT=10).
+
+    :param profile: str: Название профиля (live, local-fake, load-test).
+    :return: Settings: Настройки профиля.
+    """
+    parser = configparser.ConfigParser()
+    if not parser.read(CONFIG_PATH, encoding="utf-8"):
+        raise FileNotFoundError(f"Файл настроек не найден: {CONFIG_PATH}")
+    if profile not in get_profiles(parser):
+        raise ValueError(f"Неизвестный профиль настроек {profile!r}, доступны: {sorted(get_profiles(parser))}")
+
+    sections = {}
+    for section, section_class in SECTIONS.items():
+        values: Dict[str, str] = dict(parser[section])
+        if parser.has_section(f"{section}:{profile}"):
+            values.update(parser[f"{section}:{profile}"])
+
+        kinds = {item.name: item.type for item in fields(section_class)}
+        unknown = set(values) - set(kinds)
+        if unknown:
+            raise ValueError(f"Неизвестные параметры в секции [{section}]: {sorted(unknown)}")
+        for name in kinds:
+            env_value = os.environ.get(f"{ENV_PREFIX}{section}_{name}".upper())
+            if env_value is not None:
+                values[name] = env_value
+        missing = set(kinds) - set(values)
+        if missing:
+            raise ValueError(f"Не заданы параметры в секции [{section}]: {sorted(missing)}")
+
+        sections[section] = section_class(**{
+            name: convert(values[name], kind, f"{section}.{name}") for name, kind in kinds.items()})
+
+    return Settings(profile=profile, **sections)
+
+
+def get_settings(profile: Optional[str] = None) -> Settings:
+    """
+    Возвращает настройки профиля, указанного явно, в переменной окружения CG_PROFILE или профиля по умолчанию (live).
+
+    :param profile: str/None: Название профиля.
+    :return: Settings: Настройки профиля.
+    """
+    return load_settings(profile or os.environ.get(PROFILE_ENV, DEFAULT_PROFILE))
 
 
 class ConfigProvider:
     """Класс для управления конфигурациями из файла test_config.ini."""
 
-    def __init__(self) -> None:
-        """Инициализация класса, загрузка конфигураций из файла."""
-        self.config = config
+    def __init__(self, profile: Optional[str] = None) -> None:
+        """
+        Инициализация класса: получение настроек профиля (файл читается один раз за процесс).
+
+        :param profile: str/None: Название профиля; по умолчанию берётся из переменной окружения CG_PROFILE.
+        """
+        self.settings = get_settings(profile)
 
     def get(self, section, prop) -> str:
         """Получение значения свойства из указанного раздела как строку.
@@ -19,7 +220,7 @@ class ConfigProvider:
 
         :returns: str: Значение свойства.
         """
-        return self.config[section].get(prop)
+        return getattr(getattr(self.settings, section), prop)
 
     def get_int(self, section, prop) -> int:
         """Получение значения свойства из указанного раздела как целое число.
@@ -29,4 +230,41 @@ class ConfigProvider:
 
         :returns: str: Значение свойства.
         """
-        return self.config[section].getint(prop)
+        return getattr(getattr(self.settings, section), prop)
+
+    def get_float(self, section, prop) -> float:
+        """Получение значения свойства из указанного раздела как число с плавающей точкой.
+
+        :param section: str: Название раздела конфигурационного файла.
+        :param prop: str: Название свойства, значение которого нужно получить.
+
+        :returns: float: Значение свойства.
+        """
+        return getattr(getattr(self.settings, section), prop)
+
+    def get_bool(self, section, prop) -> bool:
+        """Получение значения свойства из указанного раздела как логическое значение.
+
+        :param section: str: Название раздела конфигурационного файла.
+        :param prop: str: Название свойства, значение которого нужно получить.
+
+        :returns: bool: Значение свойства.
+        """
+        return getattr(getattr(self.settings, section), prop)
+
+    def get_list(self, section, prop) -> List[str]:
+        """Получение значения свойства из указанного раздела как списка значений, разделённых запятыми.
+
+        :param section: str: Название раздела конфигурационного файла.
+        :param prop: str: Название свойства, значение которого нужно получить.
+
+        :returns: List[str]: Значения свойства (пустой список, если свойство не задано).
+        """
+        return [item.strip() for item in self.get(section, prop).split(",") if item.strip()]
+
+    def get_browsers(self) -> List[str]:
+        """Получение списка браузеров для прогона UI-тестов: "browsers" либо, если он пуст, "browser_name".
+
+        :returns: List[str]: Названия браузеров.
+        """
+        return self.get_list("ui", "browsers") or [self.get("ui", "browser_name")]
@@ -1,6 +1,16 @@
+import os
 import json
+from functools import lru_cache
+from typing import List
+from testdata.WorkerResources import get_worker_index
 
-data = json.load(open("./testdata/test_data.json", encoding="utf-8"))
+
+@lru_cache(maxsize=None)
+def load_data() -> dict:
+    """Читает файл test_data.json при первом обращении к данным, а не при импорте модуля."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data.json")
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
 
 
 class DataProvider:
@@ -8,7 +18,7 @@ class DataProvider:
 
     def __init__(self) -> None:
         """Инициализация класса и загрузка конфигурационных данных в атрибут config."""
-        self.config = data
+        self.config = load_data()
 
     def get(self, prop) -> str:
         """Получение значения свойства из конфигурационных данных.
@@ -18,3 +28,24 @@ class DataProvider:
         :return: Значение конкретного свойства или None, если свойство не найдено.
         """
         return self.config.get(prop)
+
+    def get_tokens(self) -> List[str]:
+        """Получение токенов всех тестовых аккаунтов: список "tokens", а если он не задан — единственный "token".
+
+        :return: List[str]: Токены аккаунтов.
+        """
+        return self.config.get("tokens") or [self.config.get("token")]
+
+    def get_account_index(self) -> int:
+        """Получение номера аккаунта текущего воркера xdist: воркеры распределяются по аккаунтам по кругу.
+
+        :return: int: Номер аккаунта в списке get_tokens().
+        """
+        return get_worker_index() % len(self.get_tokens())
+
+    def get_token(self) -> str:
+        """Получение токена аккаунта текущего воркера xdist (без xdist — первого аккаунта).
+
+        :return: str: Токен авторизации.
+        """
+        return self.get_tokens()[self.get_account_index()]
@@ -0,0 +1,325 @@
+"""
+История производительности прогонов в базе данных (SQLAlchemy).
+
+По умолчанию используется файл SQLite "results_db_path" из секции "run"; для PostgreSQL в параметре "results_db_url"
+указывается адрес вида postgresql+psycopg2://<пользователь>:<пароль>@<хост>/<база>.
+
+Сохраняются:
+    runs          — прогоны (профиль, хост, количество воркеров, итоги);
+    test_results  — длительность и результат каждого теста;
+    api_calls     — задержка каждого запроса CartApi по эндпоинтам;
+    page_timings  — метрики страниц UI-тестов (см. UI.performance).
+
+Запись выполняется пачками в фоновом потоке: тесты только помещают строки в очередь.
+"""
+import re
+import time
+import queue
+import threading
+import warnings
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from sqlalchemy import (
+    Column, DateTime, Float, Integer, MetaData, String, Table, create_engine, event, func, select)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from configuration.ConfigProvider import ConfigProvider
+
+metadata = MetaData()
+
+runs = Table(
+    "runs", metadata,
+    Column("id", String(32), primary_key=True),
+    Column("profile", String(64)),
+    Column("host", String(255)),
+    Column("workers", Integer),
+    Column("started_at", DateTime(timezone=True), index=True),
+    Column("finished_at", DateTime(timezone=True)),
+    Column("passed", Integer),
+    Column("failed", Integer),
+    Column("skipped", Integer))
+
+test_results = Table(
+    "test_results", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), index=True),
+    Column("nodeid", String(512), index=True),
+    Column("outcome", String(16)),
+    Column("duration", Float),
+    Column("recorded_at", DateTime(timezone=True), index=True))
+
+api_calls = Table(
+    "api_calls", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), index=True),
+    Column("endpoint", String(255), index=True),
+    Column("status", Integer),
+    Column("latency_ms", Float),
+    Column("recorded_at", DateTime(timezone=True), index=True))
+
+page_timings = Table(
+    "page_timings", metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(32), index=True),
+    Column("nodeid", String(512), index=True),
+    Column("label", String(255), index=True),
+    Column("url", String(2048)),
+    Column("metric", String(64)),
+    Column("value_ms", Float),
+    Column("recorded_at", DateTime(timezone=True), index=True))
+
+PAGE_METRICS = ("ttfb", "dom_content_loaded", "load")
+"""Метрики Navigation Timing, сохраняемые вместе с Paint Timing (first-paint, first-contentful-paint)."""
+
+ID_PATTERN = re.compile(r"/\d+(?=/|$)")
+"""Числовые сегменты пути, заменяемые на {id}, чтобы запросы к одному эндпоинту группировались вместе."""
+
+STOP = object()
+"""Метка остановки фонового потока записи."""
+
+
+def get_database_url() -> str:
+    """Возвращает адрес базы: "results_db_url" либо файл SQLite "results_db_path"."""
+    settings = ConfigProvider().settings.run
+    return settings.results_db_url or f"sqlite:///{settings.results_db_path}"
+
+
+def create_store_engine(url: str) -> Engine:
+    """
+    Создаёт подключение к базе и при необходимости создаёт таблицы.
+
+    Для SQLite включается журнал WAL и ожидание блокировки, так как в базу одновременно пишут воркеры pytest-xdist.
+
+    :param url: str: Адрес базы в формате SQLAlchemy.
+    :return: Engine: Подключение.
+    """
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"timeout": 30})
+
+        @event.listens_for(engine, "connect")
+        def set_sqlite_pragma(connection, record):
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+    else:
+        engine = create_engine(url, pool_pre_ping=True)
+    metadata.create_all(engine)
+    return engine
+
+
+def now() -> datetime:
+    """Возвращает текущее время в UTC."""
+    return datetime.now(timezone.utc)
+
+
+class ResultsStore:
+    """Класс записывает результаты прогона в базу пачками в фоновом потоке."""
+
+    def __init__(self, run_id: str, url: Optional[str] = None) -> None:
+        """
+        :param run_id: str: Идентификатор прогона (общий для управляющего процесса и воркеров xdist).
+        :param url: str/None: Адрес базы; по умолчанию — из секции "run".
+        """
+        settings = ConfigProvider().settings.run
+        self.run_id = run_id
+        self.engine = create_store_engine(url or get_database_url())
+        self.batch_size = settings.results_batch_size
+        self.flush_interval = settings.results_flush_interval
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def write_loop(self) -> None:
+        """
+        Собирает строки из очереди и записывает их пачками: по "results_batch_size" строк
+        либо через "results_flush_interval" секунд после первой строки пачки.
+        """
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            if batch:
+                self.write(batch)
+
+    def write(self, batch: List[tuple]) -> None:
+        """
+        Записывает пачку строк одной транзакцией.
+
+        Ошибки базы не прерывают прогон: пачка отбрасывается с предупреждением.
+
+        :param batch: List[tuple]: Пары "таблица – строка".
+        """
+        rows_by_table: Dict[Table, List[Dict]] = {}
+        for table, row in batch:
+            rows_by_table.setdefault(table, []).append(row)
+        try:
+            with self.engine.begin() as connection:
+                for table, rows in rows_by_table.items():
+                    connection.execute(table.insert(), rows)
+        except SQLAlchemyError as error:
+            warnings.warn(f"Результаты прогона не записаны в базу ({len(batch)} строк): {error}", RuntimeWarning)
+
+    def put(self, table: Table, **row) -> None:
+        """Помещает строку в очередь записи."""
+        self.queue.put((table, dict(row, run_id=self.run_id, recorded_at=now())))
+
+    def start_run(self, profile: str, host: str, workers: int) -> None:
+        """Записывает сведения о начале прогона (выполняется сразу, без очереди)."""
+        with self.engine.begin() as connection:
+            connection.execute(runs.insert(), {
+                "id": self.run_id, "profile": profile, "host": host,
+                "workers": workers, "started_at": now()})
+
+    def finish_run(self, passed: int, failed: int, skipped: int) -> None:
+        """Записывает итоги прогона."""
+        with self.engine.begin() as connection:
+            connection.execute(runs.update().where(runs.c.id == self.run_id).values(
+                finished_at=now(), passed=passed, failed=failed, skipped=skipped))
+
+    def record_test(self, nodeid: str, outcome: str, duration: float) -> None:
+        """
+        Сохраняет результат теста.
+
+        :param nodeid: str: Идентификатор теста.
+        :param outcome: str: Результат (passed, failed, skipped).
+        :param duration: float: Длительность, сек.
+        """
+        self.put(test_results, nodeid=nodeid, outcome=outcome, duration=duration)
+
+    def record_response(self, response, *args, **kwargs) -> None:
+        """
+        Сохраняет задержку запроса; используется как обработчик "response" HTTP-сессии requests.
+
+        :param response: requests.Response: Ответ.
+        """
+        path = ID_PATTERN.sub("/{id}", response.request.path_url.split("?", 1)[0])
+        self.put(api_calls,
+                 endpoint=f"{response.request.method} {path}",
+                 status=response.status_code,
+                 latency_ms=response.elapsed.total_seconds() * 1000)
+
+    def record_page_timings(self, nodeid: str, records: List[Dict]) -> None:
+        """
+        Сохраняет метрики страниц, собранные за время теста (см. PerformanceRecorder).
+
+        Учитываются только полные загрузки страниц: при переходах внутри одностраничного приложения
+        Navigation и Paint Timing относятся к первой загрузке и не отражают длительность перехода.
+
+        :param nodeid: str: Идентификатор теста.
+        :param records: List[Dict]: Записи метрик.
+        """
+        for record in records:
+            navigation = record.get("navigation")
+            if not record.get("full_load") or not navigation:
+                continue
+            values = dict(record.get("paint") or {})
+            values.update({metric: navigation[metric] for metric in PAGE_METRICS})
+            for metric, value in values.items():
+                self.put(page_timings, nodeid=nodeid, label=record["label"],
+                         url=record["url"], metric=metric, value_ms=value)
+
+    def close(self) -> None:
+        """Записывает оставшиеся строки и останавливает фоновый поток."""
+        self.queue.put(STOP)
+        self.thread.join()
+        self.engine.dispose()
+
+
+def get_trend(engine: Engine, table: Table, value, key, name: Optional[str] = None, days: int = 30) -> List[Dict]:
+    """
+    Возвращает дневную динамику значения: количество, среднее, минимум и максимум по дням.
+
+    :param engine: Engine: Подключение к базе.
+    :param table: Table: Таблица.
+    :param value: Column: Столбец значения.
+    :param key: Column: Столбец группировки (тест, эндпоинт, метрика страницы).
+    :param name: str/None: Отбор по значению столбца группировки.
+    :param days: int: Глубина истории, дней.
+    :return: List[Dict]: Строки day, name, count, mean, min, max в порядке дат.
+    """
+    day = func.date(table.c.recorded_at).label("day")
+    query = (
+        select(day, key.label("name"), func.count().label("count"), func.avg(value).label("mean"),
+               func.min(value).label("min"), func.max(value).label("max"))
+        .where(table.c.recorded_at >= now() - timedelta(days=days))
+        .group_by(day, key)
+        .order_by(day, key))
+    if name is not None:
+        query = query.where(key == name)
+    with engine.connect() as connection:
+        return [dict(row._mapping) for row in connection.execute(query)]
+
+
+def duration_trend(engine: Engine, nodeid: Optional[str] = None, days: int = 30) -> List[Dict]:
+    """Дневная динамика длительности тестов, сек (пропущенные тесты не учитываются)."""
+    passed = test_results.select().where(test_results.c.outcome != "skipped").subquery()
+    return get_trend(engine, passed, passed.c.duration, passed.c.nodeid, nodeid, days)
+
+
+def endpoint_trend(engine: Engine, endpoint: Optional[str] = None, days: int = 30) -> List[Dict]:
+    """Дневная динамика задержки эндпоинтов API корзины, мс (например, endpoint="GET /api/v1/cart")."""
+    return get_trend(engine, api_calls, api_calls.c.latency_ms, api_calls.c.endpoint, endpoint, days)
+
+
+def page_trend(engine: Engine, metric: str = "load", label: Optional[str] = None, days: int = 30) -> List[Dict]:
+    """Дневная динамика метрики страниц по шагам UI-тестов (например, label="go_section:cart"), мс."""
+    timings = page_timings.select().where(page_timings.c.metric == metric).subquery()
+    return get_trend(engine, timings, timings.c.value_ms, timings.c.label, label, days)
+
+
+def get_recent_runs(engine: Engine, profile: str, limit: int, exclude: Optional[str] = None) -> List[str]:
+    """
+    Возвращает идентификаторы последних завершённых прогонов профиля.
+
+    :param engine: Engine: Подключение к базе.
+    :param profile: str: Профиль настроек.
+    :param limit: int: Количество прогонов.
+    :param exclude: str/None: Идентификатор прогона, который не учитывается (обычно текущий).
+    :return: List[str]: Идентификаторы прогонов от новых к старым.
+    """
+    query = (
+        select(runs.c.id)
+        .where(runs.c.profile == profile, runs.c.finished_at.is_not(None))
+        .order_by(runs.c.started_at.desc())
+        .limit(limit))
+    if exclude is not None:
+        query = query.where(runs.c.id != exclude)
+    with engine.connect() as connection:
+        return list(connection.execute(query).scalars())
+
+
+def get_latencies(engine: Engine, run_ids: List[str]) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Возвращает исходные значения задержек прогонов, мс: длительности успешных тестов, задержки эндпоинтов
+    и время полной загрузки страниц по шагам UI-тестов.
+
+    :param engine: Engine: Подключение к базе.
+    :param run_ids: List[str]: Идентификаторы прогонов.
+    :return: Dict[str, Dict[str, List[float]]]: Значения по видам ("tests", "endpoints", "pages") и названиям.
+    """
+    sources = {
+        "tests": select(test_results.c.nodeid, test_results.c.duration * 1000)
+        .where(test_results.c.run_id.in_(run_ids), test_results.c.outcome == "passed"),
+        "endpoints": select(api_calls.c.endpoint, api_calls.c.latency_ms)
+        .where(api_calls.c.run_id.in_(run_ids)),
+        "pages": select(page_timings.c.label, page_timings.c.value_ms)
+        .where(page_timings.c.run_id.in_(run_ids), page_timings.c.metric == "load")}
+    latencies = {}
+    with engine.connect() as connection:
+        for kind, query in sources.items():
+            values = latencies[kind] = {}
+            for name, value in connection.execute(query):
+                values.setdefault(name, []).append(value)
+    return latencies
@@ -0,0 +1,88 @@
+import csv
+import json
+from itertools import islice
+from typing import Iterator, List, NamedTuple, Optional
+
+
+class SearchCase(NamedTuple):
+    """Поисковый запрос и варианты названий, хотя бы один из которых должен встретиться в результатах."""
+    query: str
+    variants: List[str]
+
+
+class SearchCorpus:
+    """
+    Класс предназначен для потокового чтения корпуса поисковых запросов из файла в каталоге testdata.
+
+    Поддерживаются форматы:
+        - JSONL: одна запись на строку, {"query": "...", "variants": ["...", "..."]};
+        - CSV: столбцы query и variants, варианты разделяются символом "|".
+
+    Файл читается построчно, поэтому корпус из десятков тысяч запросов не загружается в память целиком.
+    """
+
+    def __init__(self, path: str, limit: int = 0) -> None:
+        """
+        :param path: str: Путь к файлу корпуса (.jsonl или .csv).
+        :param limit: int: Максимальное количество запросов (0 — без ограничения).
+        """
+        self.path = path
+        self.limit = limit
+
+    def __iter__(self) -> Iterator[SearchCase]:
+        cases = self.read_csv() if self.path.endswith(".csv") else self.read_jsonl()
+        if self.limit:
+            cases = islice(cases, self.limit)
+        return iter(cases)
+
+    def read_jsonl(self) -> Iterator[SearchCase]:
+        """Построчно читает запросы из JSONL-файла, пропуская пустые строки."""
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield self.make_case(json.loads(line))
+
+    def read_csv(self) -> Iterator[SearchCase]:
+        """Построчно читает запросы из CSV-файла с заголовком."""
+        with open(self.path, encoding="utf-8", newline="") as file:
+            for row in csv.DictReader(file):
+                yield self.make_case({
+                    "query": row["query"],
+                    "variants": [variant for variant in row.get("variants", "").split("|") if variant]
+                })
+
+    def make_case(self, record: dict) -> SearchCase:
+        """
+        Формирует поисковый запрос из записи корпуса.
+
+        Если варианты названий не указаны, ожидается, что в результатах встретится сам запрос.
+
+        :param record: dict: Запись с ключами query и variants.
+        :return: SearchCase: Поисковый запрос.
+        """
+        query = record["query"].strip()
+        variants = [variant.strip() for variant in record.get("variants") or []]
+        return SearchCase(query, variants or [query])
+
+    def batches(self, size: int) -> Iterator[List[SearchCase]]:
+        """
+        Возвращает запросы пачками заданного размера.
+
+        :param size: int: Размер пачки.
+        :return: Iterator[List[SearchCase]]: Генератор пачек запросов.
+        """
+        cases = iter(self)
+        while True:
+            batch = list(islice(cases, size))
+            if not batch:
+                return
+            yield batch
+
+    def head(self, count: Optional[int] = None) -> List[SearchCase]:
+        """
+        Возвращает первые запросы корпуса.
+
+        :param count: int/None: Количество запросов.
+        :return: List[SearchCase]: Список запросов.
+        """
+        return list(islice(self, count))
@@ -0,0 +1,534 @@
+"""
+Локальный архив страниц сайта и сервер, воспроизводящий его без доступа к сети.
+
+Архив записывается командой python -m UI.site_recorder (см. SiteRecorder) и хранится в каталоге "archive_dir":
+файлы лежат в подкаталоге objects по SHA-256 содержимого, а index.json сопоставляет с ними пути и параметры запросов.
+Адреса сайта и API в текстовых ответах заменены на ORIGIN_PLACEHOLDER, который сервер подставляет при отдаче,
+поэтому архив не зависит от адреса и порта сервера.
+
+Изменения корзины обрабатывает небольшой сценарный бэкенд (CartBackend), повторяющий ответы API корзины.
+
+Запуск вручную: CG_PROFILE=local-fake python -m testdata.SiteArchive
+Обычно сервер запускается автоматически при старте прогона, если в секции "ui" включён параметр "serve_archive".
+"""
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+import itertools
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from configuration.ConfigProvider import ConfigProvider
+
+ORIGIN_PLACEHOLDER = "{{archive-origin}}"
+"""Метка, которой при записи архива заменяются адреса сайта и API, а при воспроизведении — адрес сервера."""
+
+TEXT_TYPES = ("text/", "javascript", "json", "xml")
+"""Признаки текстовых типов содержимого, в которых подставляется адрес сервера."""
+
+DEFAULT_PRICE = 500
+"""Цена товара в каталоге бэкенда, если она не найдена в записанных ответах API."""
+
+
+def is_text(content_type: str) -> bool:
+    """Проверяет, относится ли тип содержимого к текстовым."""
+    return any(marker in content_type for marker in TEXT_TYPES)
+
+
+class ArchiveRequest(NamedTuple):
+    """Запрос к серверу архива."""
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self):
+        """Возвращает тело запроса, разобранное как JSON (None, если тело пустое или некорректное)."""
+        try:
+            return json.loads(self.body or b"null")
+        except ValueError:
+            return None
+
+    def param(self, name: str, default: str = "") -> str:
+        """Возвращает первое значение параметра строки запроса."""
+        return self.query.get(name, [default])[0]
+
+
+class ArchiveResponse(NamedTuple):
+    """Ответ сервера архива."""
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+
+
+def json_response(status: int, payload=None) -> ArchiveResponse:
+    """
+    Формирует JSON-ответ.
+
+    :param status: int: Статус-код.
+    :param payload: Тело ответа; при None ответ отдаётся с пустым телом.
+    :return: ArchiveResponse: Ответ.
+    """
+    if payload is None:
+        return ArchiveResponse(status)
+    return ArchiveResponse(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+class SiteArchive:
+    """Хранилище записанных ответов сайта: индекс и файлы по SHA-256 содержимого."""
+
+    def __init__(self, archive_dir: str) -> None:
+        """
+        :param archive_dir: str: Каталог архива.
+        """
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, "index.json")
+        self.entries: Dict[str, Dict] = self.load_index()
+        self.paths: Dict[str, str] = {}
+        for key in self.entries:
+            self.paths[key.split("?", 1)[0]] = key
+
+    def load_index(self) -> Dict:
+        """Читает индекс архива; отсутствующий или повреждённый индекс считается пустым."""
+        try:
+            with open(self.index_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self) -> None:
+        """Сохраняет индекс архива."""
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, ensure_ascii=False, indent=2, sort_keys=True)
+
+    def add(self, key: str, status: int, content_type: str, body: bytes) -> None:
+        """
+        Добавляет ответ в архив.
+
+        :param key: str: Путь и строка запроса ("/search?phrase=...").
+        :param status: int: Статус-код ответа.
+        :param content_type: str: Тип содержимого.
+        :param body: bytes: Тело ответа.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        path = os.path.join(self.archive_dir, "objects", digest[:2], digest)
+        if not os.path.isfile(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(body)
+        self.entries[key] = {"sha256": digest, "status": status, "content_type": content_type}
+        self.paths[key.split("?", 1)[0]] = key
+
+    def get(self, key: str) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Возвращает запись архива и тело ответа.
+
+        :param key: str: Путь и строка запроса.
+        :return: Tuple[Dict, bytes]/None: Запись индекса и тело либо None, если записи нет или файл утерян.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        digest = entry["sha256"]
+        try:
+            with open(os.path.join(self.archive_dir, "objects", digest[:2], digest), "rb") as file:
+                return entry, file.read()
+        except OSError:
+            return None
+
+    def lookup(self, path: str, query: str, exact: bool = False) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Ищет ответ по пути и строке запроса, а если его нет — только по пути
+        (параметры вроде меток времени и версий ресурсов при повторе отличаются).
+
+        :param path: str: Путь запроса.
+        :param query: str: Строка запроса.
+        :param exact: bool: Искать только по пути и строке запроса.
+        :return: Tuple[Dict, bytes]/None: Запись индекса и тело ответа.
+        """
+        found = self.get(f"{path}?{query}" if query else path)
+        if found is None and not exact and path in self.paths:
+            found = self.get(self.paths[path])
+        return found
+
+    def iter_json(self, prefix: str) -> Iterator:
+        """
+        Перебирает разобранные JSON-ответы, путь которых начинается с указанного префикса.
+
+        :param prefix: str: Префикс пути (например, "/api/v2/products-top").
+        :return: Iterator: Тела ответов.
+        """
+        for key, entry in self.entries.items():
+            if not key.startswith(prefix) or "json" not in entry["content_type"]:
+                continue
+            found = self.get(key)
+            if found is None:
+                continue
+            try:
+                yield json.loads(found[1].decode("utf-8").replace(ORIGIN_PLACEHOLDER, ""))
+            except ValueError:
+                continue
+
+    def get_products(self) -> Dict[int, Dict]:
+        """
+        Собирает каталог товаров из записанных ответов API топа и поиска.
+
+        :return: Dict[int, Dict]: Товары по id с названием и ценой.
+        """
+        products = {}
+        for prefix in ("/api/v2/products-top", "/api/v2/search/product"):
+            for body in self.iter_json(prefix):
+                if not isinstance(body, dict):
+                    continue
+                data = body.get("data")
+                records = (data if isinstance(data, list) else []) + [
+                    item for item in body.get("included", []) if item.get("type") == "product"]
+                for record in records:
+                    attributes = record.get("attributes", {})
+                    if isinstance(attributes.get("id"), int):
+                        products[attributes["id"]] = {
+                            "title": attributes.get("title") or f"Товар {attributes['id']}",
+                            "price": attributes.get("price") or DEFAULT_PRICE}
+        return products
+
+
+class Route(NamedTuple):
+    """Сценарный обработчик запросов к серверу архива."""
+    method: str
+    pattern: re.Pattern
+    handler: Callable[..., ArchiveResponse]
+    fallback: bool
+
+
+class CartBackend:
+    """
+    Сценарный бэкенд корзины, повторяющий ответы API корзины и топа товаров.
+
+    Корзины хранятся в памяти отдельно для каждого значения заголовка Authorization.
+    Сценарии тестов могут заранее наполнить корзину (seed), внести задержку ответов (latency)
+    и подменить ответ на следующие запросы (fail_next).
+    """
+
+    def __init__(self, catalog: Dict[int, Dict]) -> None:
+        """
+        :param catalog: Dict[int, Dict]: Товары по id с названием и ценой; если пусто, создаётся 200 условных товаров.
+        """
+        self.catalog = catalog or {
+            product_id: {"title": f"Товар {product_id}", "price": DEFAULT_PRICE}
+            for product_id in range(1, 201)}
+        self.carts: Dict[str, Dict[int, Dict]] = {}
+        self.cart_ids = itertools.count(1)
+        self.top_calls = itertools.count()
+        self.faults: Dict[Tuple[str, str], List[ArchiveResponse]] = {}
+        self.latency = 0.0
+        self.lock = threading.Lock()
+
+    def register(self, server: "SnapshotServer") -> None:
+        """Регистрирует обработчики API корзины и топа товаров на сервере архива."""
+        server.route("GET", r"/api/v1/cart", self.guarded(self.view_cart))
+        server.route("DELETE", r"/api/v1/cart", self.guarded(self.clear_cart))
+        server.route("PUT", r"/api/v1/cart", self.guarded(self.update_quantity))
+        server.route("POST", r"/api/v1/cart/product", self.guarded(self.add_product))
+        server.route("DELETE", r"/api/v1/cart/product/(\d+)", self.guarded(self.delete_product))
+        server.route("GET", r"/api/v2/products-top", self.products_top, fallback=True)
+
+    def guarded(self, handler: Callable[..., ArchiveResponse]) -> Callable[..., ArchiveResponse]:
+        """
+        Оборачивает обработчик API корзины: задержка, подменённые ответы и проверка заголовка Authorization.
+
+        :param handler: Callable: Обработчик, получающий корзину и параметры пути.
+        :return: Callable: Обработчик запроса сервера архива.
+        """
+        def handle(request: ArchiveRequest, *groups: str) -> ArchiveResponse:
+            if self.latency:
+                time.sleep(self.latency)
+            with self.lock:
+                queued = self.faults.get((request.method, request.path))
+                if queued:
+                    return queued.pop(0)
+                token = request.headers.get("Authorization", "")
+                if not token:
+                    return self.error(401, "Authorization обязательное поле")
+                return handler(request, self.carts.setdefault(token, {}), *groups)
+        return handle
+
+    def error(self, status: int, message: str) -> ArchiveResponse:
+        """Формирует ответ об ошибке в формате API корзины."""
+        return json_response(status, {"message": message, "requestId": uuid.uuid4().hex})
+
+    def seed(self, token: str, product_ids: List[int]) -> None:
+        """
+        Наполняет корзину пользователя товарами до начала сценария.
+
+        :param token: str: Значение заголовка Authorization.
+        :param product_ids: List[int]: id товаров из каталога.
+        """
+        with self.lock:
+            cart = self.carts.setdefault(token, {})
+            for product_id in product_ids:
+                cart[next(self.cart_ids)] = {"goodsId": product_id, "quantity": 1}
+
+    def fail_next(self, method: str, path: str, status: int, payload=None, times: int = 1) -> None:
+        """
+        Подменяет ответ на следующие запросы к API корзины.
+
+        :param method: str: HTTP-метод.
+        :param path: str: Путь запроса (например, "/api/v1/cart").
+        :param status: int: Статус-код подменённого ответа.
+        :param payload: Тело ответа; по умолчанию — сообщение об ошибке.
+        :param times: int: Количество подменяемых запросов.
+        """
+        response = json_response(status, payload) if payload is not None else self.error(status, f"{status} - error")
+        with self.lock:
+            self.faults.setdefault((method, path), []).extend([response] * times)
+
+    def reset(self) -> None:
+        """Очищает корзины, подменённые ответы и задержку."""
+        with self.lock:
+            self.carts.clear()
+            self.faults.clear()
+            self.latency = 0.0
+
+    def view_cart(self, request: ArchiveRequest, cart: Dict[int, Dict]) -> ArchiveResponse:
+        """GET /api/v1/cart: содержимое корзины."""
+        products = []
+        for cart_id, item in cart.items():
+            product = self.catalog.get(item["goodsId"], {"title": "", "price": DEFAULT_PRICE})
+            products.append({
+                "id": cart_id,
+                "goodsId": item["goodsId"],
+                "quantity": item["quantity"],
+                "title": product["title"],
+                "price": product["price"],
+                "cost": product["price"] * item["quantity"]})
+        cost = sum(product["cost"] for product in products)
+        return json_response(200, {
+            "addBonuses": 0,
+            "cost": cost,
+            "costGiftWrap": 0,
+            "costWithBonuses": cost,
+            "costWithSale": cost,
+            "disabledProducts": [],
+            "discount": 0,
+            "gifts": [],
+            "preorderProducts": [],
+            "products": products,
+            "promoCode": None,
+            "weight": 0})
+
+    def add_product(self, request: ArchiveRequest, cart: Dict[int, Dict]) -> ArchiveResponse:
+        """POST /api/v1/cart/product: добавление товара; для товара не из каталога — ошибка 422."""
+        product_id = (request.json() or {}).get("id")
+        if product_id not in self.catalog:
+            return json_response(422, {"errors": [{
+                "code": "invalid",
+                "source": {"pointer": "id"},
+                "status": "422",
+                "title": "Значение недопустимо."}]})
+        for item in cart.values():
+            if item["goodsId"] == product_id:
+                item["quantity"] += 1
+                return json_response(200)
+        cart[next(self.cart_ids)] = {"goodsId": product_id, "quantity": 1}
+        return json_response(200)
+
+    def delete_product(self, request: ArchiveRequest, cart: Dict[int, Dict], cart_id: str) -> ArchiveResponse:
+        """DELETE /api/v1/cart/product/<id>: удаление товара; для отсутствующего товара — ошибка 404."""
+        if cart.pop(int(cart_id), None) is None:
+            return self.error(404, "товар в корзине не найден")
+        return json_response(204)
+
+    def clear_cart(self, request: ArchiveRequest, cart: Dict[int, Dict]) -> ArchiveResponse:
+        """DELETE /api/v1/cart: очистка корзины."""
+        cart.clear()
+        return json_response(204)
+
+    def update_quantity(self, request: ArchiveRequest, cart: Dict[int, Dict]) -> ArchiveResponse:
+        """PUT /api/v1/cart: изменение количества; для количества меньше 1 или неизвестного товара — ошибка 422."""
+        changes = request.json()
+        if not isinstance(changes, list) or any(
+                change.get("id") not in cart or not isinstance(change.get("quantity"), int)
+                or change["quantity"] < 1 for change in changes):
+            return self.error(422, "422 - error")
+        for change in changes:
+            cart[change["id"]]["quantity"] = change["quantity"]
+        return json_response(200)
+
+    def products_top(self, request: ArchiveRequest) -> ArchiveResponse:
+        """GET /api/v2/products-top: товары каталога по кругу, чтобы последовательные запросы получали разные id."""
+        count = int(request.param("resultCount", "1"))
+        top = list(self.catalog)[:int(request.param("topCount", "200"))]
+        offset = next(self.top_calls) * count
+        ids = [top[(offset + index) % len(top)] for index in range(min(count, len(top)))]
+        return json_response(200, {"data": [
+            {"type": "product", "id": str(product_id),
+             "attributes": {"id": product_id, **self.catalog[product_id]}}
+            for product_id in ids]})
+
+
+class ArchiveRequestHandler(BaseHTTPRequestHandler):
+    """Обработчик HTTP-запросов сервера архива."""
+
+    protocol_version = "HTTP/1.1"
+    server: "SnapshotServer"
+
+    def do_GET(self) -> None:
+        self.respond("GET")
+
+    def do_HEAD(self) -> None:
+        self.respond("HEAD")
+
+    def do_POST(self) -> None:
+        self.respond("POST")
+
+    def do_PUT(self) -> None:
+        self.respond("PUT")
+
+    def do_DELETE(self) -> None:
+        self.respond("DELETE")
+
+    def do_OPTIONS(self) -> None:
+        self.respond("OPTIONS")
+
+    def respond(self, method: str) -> None:
+        """Разбирает запрос, передаёт его серверу и отправляет ответ."""
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = ArchiveRequest(
+            method=method,
+            path=url.path,
+            query=parse_qs(url.query),
+            headers=dict(self.headers.items()),
+            body=self.rfile.read(length) if length else b"")
+        response = self.server.dispatch(request, url.query)
+
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, POST, PUT, DELETE, OPTIONS")
+        self.end_headers()
+        if method != "HEAD":
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Журнал запросов не ведётся, чтобы не засорять вывод pytest."""
+
+
+class SnapshotServer(ThreadingHTTPServer):
+    """
+    Сервер, воспроизводящий архив сайта.
+
+    Порядок обработки запроса:
+        1. Сценарные обработчики (route), например, API корзины CartBackend.
+        2. Ответ из архива с тем же путём и строкой запроса.
+        3. Резервные обработчики (route(..., fallback=True)) для запросов, отсутствующих в архиве.
+        4. Ответ из архива с тем же путём и другой строкой запроса.
+        5. Для переходов между страницами (Accept: text/html) — главная страница: клиентский роутер сайта
+           отрисует нужную страницу сам.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, archive: SiteArchive, host: str = "127.0.0.1", port: int = 8000) -> None:
+        """
+        :param archive: SiteArchive: Архив сайта.
+        :param host: str: Адрес, на котором принимаются запросы.
+        :param port: int: Порт.
+        """
+        super().__init__((host, port), ArchiveRequestHandler)
+        self.archive = archive
+        self.origin = f"http://{host}:{self.server_address[1]}"
+        self.routes: List[Route] = []
+        self.backend = CartBackend(archive.get_products())
+        self.backend.register(self)
+        self.thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls) -> "SnapshotServer":
+        """Создаёт сервер для архива "archive_dir" по адресу и порту из "base_url" секции "ui"."""
+        settings = ConfigProvider().settings.ui
+        url = urlsplit(settings.base_url)
+        return cls(SiteArchive(settings.archive_dir), url.hostname or "127.0.0.1", url.port or 80)
+
+    def route(self, method: str, pattern: str,
+              handler: Callable[..., ArchiveResponse], fallback: bool = False) -> None:
+        """
+        Регистрирует сценарный обработчик запросов.
+
+        :param method: str: HTTP-метод.
+        :param pattern: str: Регулярное выражение для пути; группы передаются обработчику аргументами.
+        :param handler: Callable: Функция, получающая ArchiveRequest и группы и возвращающая ArchiveResponse.
+        :param fallback: bool: Использовать обработчик только для запросов, отсутствующих в архиве.
+        """
+        self.routes.insert(0, Route(method, re.compile(pattern), handler, fallback))
+
+    def match_route(self, request: ArchiveRequest, fallback: bool) -> Optional[ArchiveResponse]:
+        """Вызывает первый подходящий сценарный обработчик (основной или резервный)."""
+        for route in self.routes:
+            if route.fallback != fallback or route.method != request.method:
+                continue
+            match = route.pattern.fullmatch(request.path)
+            if match:
+                return route.handler(request, *match.groups())
+        return None
+
+    def dispatch(self, request: ArchiveRequest, query: str) -> ArchiveResponse:
+        """
+        Формирует ответ на запрос.
+
+        :param request: ArchiveRequest: Запрос.
+        :param query: str: Исходная строка запроса (для поиска в архиве).
+        :return: ArchiveResponse: Ответ.
+        """
+        if request.method == "OPTIONS":
+            return ArchiveResponse(204)
+
+        response = self.match_route(request, fallback=False)
+        if response is not None:
+            return response
+
+        method = "GET" if request.method == "HEAD" else request.method
+        found = self.archive.lookup(request.path, query, exact=True) if method == "GET" else None
+        if found is None:
+            response = self.match_route(request._replace(method=method), fallback=True)
+            if response is not None:
+                return response
+        if found is None and method == "GET":
+            found = self.archive.lookup(request.path, query)
+        if found is None and method == "GET" and "text/html" in request.headers.get("Accept", ""):
+            found = self.archive.get("/")
+        if found is None:
+            return json_response(404, {"message": "Нет в архиве", "path": request.path})
+
+        entry, body = found
+        if is_text(entry["content_type"]):
+            body = body.replace(ORIGIN_PLACEHOLDER.encode(), self.origin.encode())
+        return ArchiveResponse(entry["status"], body, entry["content_type"])
+
+    def start(self) -> "SnapshotServer":
+        """Запускает сервер в фоновом потоке."""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Останавливает сервер и освобождает порт."""
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    server = SnapshotServer.from_config()
+    print(f"Архив {server.archive.archive_dir}: {len(server.archive.entries)} ответов, {server.origin}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,135 @@
+"""
+Распределение ресурсов между воркерами pytest-xdist и межпроцессные блокировки общего внешнего состояния.
+
+pytest-xdist сообщает воркеру его номер переменными окружения PYTEST_XDIST_WORKER ("gw0", "gw1", ...)
+и PYTEST_XDIST_WORKER_COUNT; без xdist процесс считается единственным воркером "master" с номером 0.
+"""
+import os
+import time
+from typing import Optional
+from configuration.ConfigProvider import ConfigProvider
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+WORKER_COUNT_ENV = "PYTEST_XDIST_WORKER_COUNT"
+MASTER = "master"
+
+
+def get_worker_id() -> str:
+    """Возвращает идентификатор воркера xdist ("gw0", "gw1", ...) либо "master" при запуске без xdist."""
+    return os.environ.get(WORKER_ENV, MASTER)
+
+
+def get_worker_index() -> int:
+    """Возвращает номер воркера xdist (0 при запуске без xdist)."""
+    worker_id = get_worker_id()
+    return int(worker_id[2:]) if worker_id.startswith("gw") else 0
+
+
+def get_worker_count() -> int:
+    """Возвращает количество воркеров xdist (1 при запуске без xdist)."""
+    return int(os.environ.get(WORKER_COUNT_ENV, 1))
+
+
+def is_worker() -> bool:
+    """Проверяет, выполняется ли код в воркере xdist (а не в управляющем процессе или обычном прогоне)."""
+    return WORKER_ENV in os.environ
+
+
+def suffixed_path(path: str, suffix: str) -> str:
+    """
+    Добавляет суффикс к имени файла перед расширением ("browser.json" -> "browser.gw1.json").
+
+    :param path: str: Путь к файлу.
+    :param suffix: str: Суффикс.
+    :return: str: Путь с суффиксом.
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root}.{suffix}{extension}"
+
+
+def worker_path(path: str) -> str:
+    """
+    Возвращает отдельный путь к файлу для каждого воркера xdist; без xdist путь не меняется.
+
+    :param path: str: Путь из конфигурации.
+    :return: str: Путь к файлу воркера.
+    """
+    return suffixed_path(path, get_worker_id()) if is_worker() else path
+
+
+class CrossProcessLock:
+    """
+    Межпроцессная блокировка на основе блокировки файла в каталоге "lock_dir" секции "api".
+
+    Блокировка снимается операционной системой при завершении процесса, поэтому аварийно завершившийся воркер
+    не оставляет «зависших» блокировок. Используется как контекстный менеджер.
+    """
+
+    def __init__(self, name: str, timeout: Optional[int] = None, poll: float = 0.1) -> None:
+        """
+        :param name: str: Название блокировки (общее для всех процессов).
+        :param timeout: int/None: Максимальное время ожидания, сек; по умолчанию — "lock_timeout" секции "api".
+        :param poll: float: Интервал повторных попыток, сек.
+        """
+        lock_dir = ConfigProvider().get("api", "lock_dir")
+        self.name = name
+        self.path = os.path.join(lock_dir, f"{name}.lock")
+        self.timeout = ConfigProvider().get_int("api", "lock_timeout") if timeout is None else timeout
+        self.poll = poll
+        self.file = None
+        os.makedirs(lock_dir, exist_ok=True)
+
+    def try_lock(self) -> bool:
+        """Пытается захватить блокировку без ожидания."""
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self) -> float:
+        """
+        Захватывает блокировку, ожидая её освобождения другими процессами.
+
+        :return: float: Время ожидания, сек.
+
+        raise TimeoutError: Если блокировку не удалось захватить за "timeout" секунд.
+        """
+        started = time.monotonic()
+        self.file = open(self.path, "a+")
+        while not self.try_lock():
+            if time.monotonic() - started > self.timeout:
+                self.file.close()
+                self.file = None
+                raise TimeoutError(f"Блокировка {self.name!r} не освободилась за {self.timeout} с")
+            time.sleep(self.poll)
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        """Освобождает блокировку."""
+        if self.file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+        self.file = None
+
+    def __enter__(self) -> "CrossProcessLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
@@ -1,39 +1,231 @@
+import sys
 import pytest
 import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.firefox import GeckoDriverManager
+import threading
+from contextlib import ExitStack
+from functools import partial
+from typing import TYPE_CHECKING, Dict
 from configuration.ConfigProvider import ConfigProvider
-from UI.authorization import Authorization
-from UI.cart_page import CartPage
-from UI.search_page import SearchPage
-from UI.navigation import Navigation
 from API.cart_api import CartApi
+from API.search_api import SearchApi
 from testdata.DataProvider import DataProvider
+from testdata.SearchCorpus import SearchCorpus
+from testdata.WorkerResources import CrossProcessLock, is_worker
+from tests_.scheduling import DurationScheduler
+
+if TYPE_CHECKING:
+    from UI.authorization import Authorization
+    from UI.cart_page import CartPage
+    from UI.search_page import SearchPage
+    from UI.navigation import Navigation
+    from UI.storage_state import StorageState
+    from UI.state_reset import StateReset
+    from UI.browser_session import BrowserSession
+
+# Selenium, webdriver-manager и page-объекты импортируются внутри UI-фикстур,
+# поэтому прогоны только API-тестов их не загружают (см. tests_import_time.py).
+
+browser_launches: Dict[str, "BrowserSession"] = {}
+"""Сессии браузеров, запущенные в фоне при старте прогона, по названию браузера (см. pytest_collection_finish)."""
+
+archive_server = None
+"""Сервер архива сайта, запущенный на время прогона (см. pytest_sessionstart)."""
+
+
+def pytest_addoption(parser):
+    """Добавляет параметры сравнения задержек прогона с базовыми значениями (см. PerformanceGate)."""
+    group = parser.getgroup("performance", "сравнение производительности с базовыми значениями")
+    group.addoption(
+        "--perf-gate", choices=("off", "warn", "fail"), default=None,
+        help="Режим сравнения с базовыми значениями (по умолчанию — параметр \"perf_gate\" секции \"run\")")
+    group.addoption(
+        "--perf-baseline", default=None, metavar="PATH",
+        help="Файл базовых значений (по умолчанию — параметр \"perf_baseline_path\" секции \"run\")")
+    group.addoption(
+        "--perf-update-baseline", action="store_true", default=False,
+        help="Сохранить значения прогона как базовые для текущего профиля")
+
+
+def pytest_configure(config):
+    """
+    Регистрирует плагин, упорядочивающий тесты по длительности предыдущих прогонов (см. DurationScheduler),
+    и, если в секции "run" включён параметр "collect_results", плагин записи результатов в базу (см. ResultsPlugin).
+    Сравнение задержек с базовыми значениями (см. PerformanceGate) включает запись результатов независимо от него.
+    """
+    config.pluginmanager.register(DurationScheduler(config), "duration_scheduler")
+    if config.option.collectonly:
+        return
+
+    settings = ConfigProvider().settings.run
+    gate_enabled = (config.getoption("perf_gate") or settings.perf_gate) != "off" \
+        or config.getoption("perf_update_baseline")
+    if settings.collect_results or gate_enabled:
+        from tests_.results import ResultsPlugin
+
+        config.pluginmanager.register(ResultsPlugin(config), "results_store")
+    if gate_enabled:
+        from tests_.perf_gate import PerformanceGate
+
+        config.pluginmanager.register(PerformanceGate(config), "perf_gate")
+
+
+def pytest_sessionstart(session):
+    """
+    Запускает в фоне сервер, воспроизводящий записанный архив сайта и API корзины,
+    если в секции "ui" включён параметр "serve_archive" (профиль local-fake).
+
+    При запуске через pytest-xdist сервер запускается один раз в управляющем процессе и общий для всех воркеров.
+    """
+    global archive_server
+    if session.config.option.collectonly or is_worker() or not ConfigProvider().get_bool("ui", "serve_archive"):
+        return
+
+    from testdata.SiteArchive import SnapshotServer
+    archive_server = SnapshotServer.from_config().start()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Параметризует UI-тесты списком браузеров из параметра "browsers" секции "ui" (см. ConfigProvider.get_browsers).
+
+    Параметр имеет область видимости сессии, поэтому pytest группирует тесты по браузерам
+    и держит открытым не больше одного браузера одновременно.
+    """
+    if "browser_name" in metafunc.fixturenames:
+        browsers = ConfigProvider().get_browsers()
+        metafunc.parametrize("browser_name", browsers, indirect=True, scope="session", ids=browsers)
+
+
+def pytest_collection_finish(session):
+    """
+    После сбора тестов запускает в фоне браузеры (если среди тестов есть UI-тесты)
+    и прогрев соединений с API (если есть тесты, использующие CartApi).
+
+    Все запуски независимы и выполняются параллельно со сбором фикстур и первыми API-тестами.
+    """
+    if session.config.option.collectonly:
+        return
+
+    fixture_names = set()
+    for item in session.items:
+        fixture_names.update(getattr(item, "fixturenames", ()))
+
+    if "cart_api" in fixture_names:
+        threading.Thread(target=CartApi().warm_up, daemon=True).start()
+
+    if "browser" in fixture_names and ConfigProvider().get_bool(
+            "ui", "background_launch"):
+        from UI.browser_session import BrowserSession
+        for browser_name in ConfigProvider().get_browsers():
+            browser_launches[browser_name] = BrowserSession(
+                partial(create_driver, browser_name), background=True)
+
+
+def pytest_sessionfinish(session):
+    """Закрывает браузеры, запущенные в фоне, если ни один тест так и не использовал их, и останавливает сервер архива."""
+    global archive_server
+    while browser_launches:
+        browser_launches.popitem()[1].quit()
+    if archive_server is not None:
+        archive_server.stop()
+        archive_server = None
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Выводит отчёт о командах WebDriver по методам page-объектов, если трассировка была включена,
+    и статистику кэша элементов, если UI-тесты выполнялись.
+    """
+    tracing = sys.modules.get("UI.tracing")
+    if tracing is not None and tracing.tracer.enabled:
+        tracer = tracing.tracer
+        terminalreporter.section("WebDriver: команды по методам page-объектов")
+        terminalreporter.write_line(tracer.report())
+        tracer.save(ConfigProvider().get("ui", "trace_report_path"))
+
+    element_cache = sys.modules.get("UI.element_cache")
+    if element_cache is not None and element_cache.stats:
+        terminalreporter.section("WebDriver: кэш элементов (попадания / промахи / устаревшие)")
+        terminalreporter.write_line(element_cache.report())
+
+
+def get_lock_name(resource: str) -> str:
+    """
+    Возвращает название межпроцессной блокировки ресурса.
+
+    Корзина и аккаунт принадлежат аккаунту воркера (см. DataProvider.get_token), поэтому воркеры
+    с разными аккаунтами не блокируют друг друга.
+    """
+    if resource in ("cart", "account"):
+        return f"{resource}-account{DataProvider().get_account_index()}"
+    return resource
+
+
+@pytest.fixture(scope="function", autouse=True)
+def serial_lock(request):
+    """
+    Фикстура, не допускающая одновременного выполнения тестов, отмеченных @pytest.mark.serial, в разных процессах.
+
+    @pytest.mark.serial("cart") — тест не выполняется одновременно с другими тестами, изменяющими корзину того же
+    аккаунта; @pytest.mark.serial без аргументов — с другими тестами с такой же отметкой.
+    Блокировки захватываются до остальных фикстур теста и в алфавитном порядке, чтобы исключить взаимоблокировки.
+    """
+    marker = request.node.get_closest_marker("serial")
+    if marker is None:
+        yield
+        return
+
+    with ExitStack() as locks:
+        for name in sorted({get_lock_name(resource) for resource in marker.args} or {"serial"}):
+            locks.enter_context(CrossProcessLock(name))
+        yield
 
 
 @pytest.fixture(scope="session")
-def browser():
+def browser_name(request) -> str:
+    """
+    Фикстура, возвращающая название браузера, в котором выполняется тест.
+
+    Параметризуется списком браузеров в pytest_generate_tests.
+    """
+    return request.param
+
+
+@pytest.fixture(scope="function", autouse=True)
+def browser_label(request):
+    """Фикстура, отмечающая UI-тесты в отчёте Allure тегом и меткой браузера, в котором они выполняются."""
+    if "browser_name" in request.fixturenames:
+        browser_name = request.getfixturevalue("browser_name")
+        allure.dynamic.tag(browser_name)
+        allure.dynamic.label("browser", browser_name)
+    yield
+
+
+@pytest.fixture(scope="session")
+def browser(browser_name):
     """
     **Фикстура для инициализации и завершения работы веб-браузера.**
 
-    Запускает браузер (Chrome или Firefox), настраивает его и открывает указанный URL.
+    Запускает браузер (Chrome или Firefox, см. browser_name), настраивает его и открывает указанный URL.
     Устанавливает имплицитное ожидание и максимизирует окно браузера. По завершении всех тестов браузер закрывается.
 
        Браузер, URL сайта и имплицитное ожидание определяются с помощью класса ConfigProvider.
+
+    Если в конфигурации включён параметр "prime_storage_state", до первой загрузки страницы магазина
+    в браузер восстанавливается сохранённое состояние авторизации (см. StorageState).
+
+    Если включён параметр "trace_commands", браузер оборачивается в TracingWebDriver,
+    и все команды WebDriver, выполненные page-объектами, записываются в трассировщик.
+
+    Браузер предоставляется через BrowserSession, что позволяет перезапускать его между тестами.
+    Если включён параметр "background_launch", используется браузер, запуск которого начат в фоне
+    сразу после сбора тестов.
     """
-    with allure.step("Открытие и настройка браузера"):
-        if ConfigProvider().get("ui", "browser_name") == "Chrome":
-            driver = webdriver.Chrome(service=Service(
-                ChromeDriverManager().install()))
-        else:
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()))
-        driver.get(ConfigProvider().get("ui", "base_url"))
-        driver.implicitly_wait(ConfigProvider().get_int("ui", "timeout"))
-        driver.maximize_window()
+    from UI.browser_session import BrowserSession
+
+    with allure.step(f"Открытие и настройка браузера {browser_name}"):
+        driver = browser_launches.pop(browser_name, None) or BrowserSession(
+            partial(create_driver, browser_name))
 
         yield driver
 
@@ -41,57 +233,169 @@ def browser():
         driver.quit()
 
 
+def create_driver(browser_name: str = None):
+    """
+    Запускает и настраивает новый экземпляр веб-браузера.
+
+    Используется фикстурой browser при старте сессии и при перезапуске браузера (см. BrowserSession).
+    Путь к веб-драйверу определяется локально через DriverResolver; сеть используется только при промахе кэша.
+    Браузеры из параметра "headless_browsers" запускаются без окна.
+    Если включён параметр "use_browser_daemon", вместо запуска нового браузера "browser_name" выполняется подключение
+    к «тёплому» браузеру демона (см. BrowserDaemon).
+
+    :param browser_name: str: Название браузера; по умолчанию — "browser_name" из секции "ui".
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from UI.browser_daemon import get_options
+    from UI.driver_resolver import DriverResolver
+
+    settings = ConfigProvider().settings.ui
+    browser_name = browser_name or settings.browser_name
+    driver = None
+    if settings.use_browser_daemon and browser_name == settings.browser_name:
+        from UI.browser_daemon import BrowserDaemon
+        driver = BrowserDaemon().attach()
+    if driver is None:
+        options = get_options(
+            browser_name, browser_name in ConfigProvider().get_list("ui", "headless_browsers"))
+        driver_path = DriverResolver(browser_name).resolve()
+        if browser_name == "Chrome":
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+        else:
+            driver = webdriver.Firefox(service=FirefoxService(driver_path), options=options)
+    if settings.trace_commands:
+        from UI.tracing import TracingWebDriver, tracer
+        tracer.enable()
+        driver = TracingWebDriver(driver, tracer)
+    if settings.prime_storage_state:
+        from UI.storage_state import StorageState
+        StorageState(driver).prime()
+    driver.get(settings.base_url)
+    driver.implicitly_wait(settings.timeout)
+    driver.maximize_window()
+    return driver
+
+
+@pytest.fixture(scope="function", autouse=True)
+def browser_recycling(request):
+    """
+    Фикстура, перезапускающая браузер между UI-тестами при превышении порогов по числу тестов или памяти.
+
+    Состояние авторизации и открытая страница восстанавливаются, поэтому page-объекты продолжают работать.
+    Для тестов, не использующих браузер, фикстура ничего не делает.
+    """
+    yield
+    if "browser" not in request.fixturenames:
+        return
+
+    session = request.getfixturevalue("browser")
+    session.tests_since_start += 1
+    session.recycle_if_needed()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def performance_metrics(request):
+    """
+    Фикстура, собирающая метрики производительности страниц в UI-тестах.
+
+    Метрики снимаются после каждой навигации и поиска (см. measure_performance), сохраняются
+    в JSON-файл теста в каталоге "performance_dir", прикладываются к отчёту Allure и записываются в базу результатов.
+    Для тестов, не использующих браузер, фикстура ничего не делает.
+    """
+    if "browser" not in request.fixturenames or not ConfigProvider().get_bool(
+            "ui", "collect_performance"):
+        yield
+        return
+
+    from UI.performance import recorder
+
+    recorder.start(request.getfixturevalue("browser"), request.node.nodeid)
+    yield
+    records = recorder.finish(ConfigProvider().get("ui", "performance_dir"))
+    results = request.config.pluginmanager.get_plugin("results_store")
+    if results is not None:
+        results.store.record_page_timings(request.node.nodeid, records)
+
+
 @pytest.fixture(scope="session")
 def auth(browser) -> None:
     """
     Фикстура для авторизации на сайте.
 
     Использует объект Authorization для выполнения процесса входа.
+    После успешного входа сохраняет состояние авторизации для последующих сессий.
     """
+    from UI.authorization import Authorization
+    from UI.storage_state import StorageState
+
     base_page = Authorization(browser)
-    base_page.login_with()
+    with CrossProcessLock(get_lock_name("account")):
+        if base_page.login_with():
+            StorageState(browser).save()
 
 
 @pytest.fixture(scope="session")
-def authorization(browser) -> Authorization:
+def authorization(browser) -> "Authorization":
     """Фикстура для предоставления объекта Authorization."""
+    from UI.authorization import Authorization
     return Authorization(browser)
 
 
 @pytest.fixture(scope="session")
-def navigation(browser) -> Navigation:
+def navigation(browser) -> "Navigation":
     """Фикстура для предоставления объекта Navigation."""
+    from UI.navigation import Navigation
     return Navigation(browser)
 
 
 @pytest.fixture(scope="session")
-def cart(browser) -> CartPage:
+def cart(browser) -> "CartPage":
     """Фикстура для предоставления объекта CartPage."""
+    from UI.cart_page import CartPage
     return CartPage(browser)
 
 
 @pytest.fixture(scope="session")
-def search(browser) -> SearchPage:
+def search(browser) -> "SearchPage":
     """Фикстура для предоставления объекта SearchPage."""
+    from UI.search_page import SearchPage
     return SearchPage(browser)
 
 
 @pytest.fixture(scope="session")
-def product_dictionary() -> dict:
+def search_corpus() -> SearchCorpus:
+    """
+    Фикстура, предоставляющая корпус поисковых запросов.
+
+    Файл корпуса и ограничение количества запросов задаются параметрами "corpus_path" и "corpus_limit" в секции "search".
+    """
+    return SearchCorpus(
+        ConfigProvider().get("search", "corpus_path"),
+        ConfigProvider().get_int("search", "corpus_limit"))
+
+
+@pytest.fixture(scope="session")
+def product_dictionary(search_corpus) -> dict:
     """
     Фикстура, возвращающая словарь с названиями товаров и их эквивалентами на другом языке.
 
+    Из первых "corpus_sample" запросов корпуса (см. search_corpus) берутся только те, у которых последний вариант
+    названия записан другим алфавитом, чем запрос ("Harry Potter" – "Гарри Поттер").
+
     :return: dict: Словарь для тестирования поиска товаров с ключами на одном языке и значениями на другом.
     """
-    product_dict = {
-        "Harry Potter": "Гарри Поттер",
-        "Властелин Колец": "The Lord of The Ring",
-        "Diablo": "Диабло",
-        "Ведьмак": "Witcher",
-        "Warcraft": "Варкрафт",
-        "Игра престолов": "Game of Thrones"
+    return {
+        case.query: case.variants[-1]
+        for case in search_corpus.head(ConfigProvider().get_int("search", "corpus_sample"))
+        if is_cyrillic(case.query) != is_cyrillic(case.variants[-1])
     }
-    return product_dict
+
+
+def is_cyrillic(text: str) -> bool:
+    """Возвращает True, если в тексте есть буквы кириллицы."""
+    return any("а" <= char <= "я" or char == "ё" for char in text.lower())
 
 
 @pytest.fixture(scope="session")
@@ -100,14 +404,29 @@ def cart_api() -> CartApi:
     return CartApi()
 
 
+@pytest.fixture(scope="session")
+def search_api() -> SearchApi:
+    """Фикстура для предоставления объекта SearchApi."""
+    return SearchApi()
+
+
+@pytest.fixture(scope="session")
+def state_reset(browser) -> "StateReset":
+    """Фикстура для предоставления объекта StateReset."""
+    from UI.state_reset import StateReset
+    return StateReset(browser)
+
+
 @pytest.fixture(scope="function")
-def api_clear_cart(browser, cart_api):
+def api_clear_cart(state_reset, cart_api):
     """Фикстура, очищающая корзину через API.
 
+    Индикатор корзины в браузере синхронизируется без перезагрузки страницы, если он уже показывает пустую корзину.
+
     :param cart_api: объект CartApi для взаимодействия с корзиной.
     """
     cart_api.clear_cart()
-    browser.refresh()
+    state_reset.sync_cart_indicator(0)
 
 
 @pytest.fixture(scope="function")
@@ -131,10 +450,36 @@ def cart_item(cart_api):
 
 
 @pytest.fixture(scope="session")
-def add_cookies(browser):
-    browser.add_cookie({
-        "name": "access-token",
-        "value": DataProvider().get("token"),
-        'path': '/',
-        'domain': 'chitai-gorod.ru',
-    })
+def storage_state(browser) -> "StorageState":
+    """Фикстура для предоставления объекта StorageState."""
+    from UI.storage_state import StorageState
+    return StorageState(browser)
+
+
+@pytest.fixture(scope="session")
+def add_cookies(storage_state):
+    """
+    Фикстура, устанавливающая в браузер состояние авторизации (cookies и localStorage).
+
+    Использует сохранённый снимок состояния, а при его отсутствии или устаревании — токен из test_data.json.
+    Если устарели и снимок, и токен, подготовка теста завершается ошибкой (вход по SMS-коду не выполняется).
+    """
+    storage_state.apply()
+
+
+@pytest.fixture(scope="function")
+def cart_with_products(browser, cart_api, add_cookies):
+    """Фикстура, открывающая в браузере корзину, наполненную товарами через API.
+
+    :param cart_api: объект CartApi для взаимодействия с корзиной.
+
+    :return:
+    Функция, принимающая количество товаров и возвращающая список их id.
+
+    После завершения теста очищает корзину через API.
+    """
+    from UI.cart_state import CartState
+
+    yield CartState(browser, cart_api).open_cart_with_products
+
+    cart_api.clear_cart()
@@ -0,0 +1,199 @@
+"""
+Плагин pytest, сравнивающий задержки прогона с базовыми значениями (см. testdata.ResultsStore).
+
+Сравниваются медиана (p50) и 95-й процентиль (p95) длительностей тестов, задержек эндпоинтов API корзины
+и времени полной загрузки страниц UI-тестов. Значение считается регрессией, если оно выросло больше чем на
+"perf_tolerance_p50"/"perf_tolerance_p95" (доля от базового) и одновременно больше чем на "perf_min_delta_ms" мс.
+
+Базовые значения берутся из файла "perf_baseline_path" (отдельно для каждого профиля настроек) либо, если задан
+"perf_baseline_runs", вычисляются по последним прогонам того же профиля в базе результатов.
+
+Запуск:
+    pytest --perf-gate=warn                 # вывести регрессии
+    pytest --perf-gate=fail                 # завершить прогон с ошибкой при регрессиях
+    pytest --perf-update-baseline           # сохранить значения прогона как базовые
+"""
+import os
+import json
+import math
+import pytest
+from typing import Dict, List
+from configuration.ConfigProvider import ConfigProvider
+from testdata.ResultsStore import get_latencies, get_recent_runs
+from testdata.WorkerResources import CrossProcessLock, is_worker
+
+MODES = ("off", "warn", "fail")
+STATS = {"p50": 0.5, "p95": 0.95}
+KIND_TITLES = {"tests": "тест", "endpoints": "эндпоинт", "pages": "страница"}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Вычисляет процентиль с линейной интерполяцией между соседними значениями.
+
+    :param values: List[float]: Значения (не пустой список).
+    :param fraction: float: Доля, например 0.95.
+    :return: float: Значение процентиля.
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: Dict[str, Dict[str, List[float]]]) -> Dict[str, Dict[str, Dict]]:
+    """
+    Вычисляет p50, p95 и количество значений для каждого теста, эндпоинта и страницы.
+
+    :param latencies: Dict: Исходные значения, мс (см. get_latencies).
+    :return: Dict: Сводка по видам и названиям.
+    """
+    summary = {}
+    for kind, groups in latencies.items():
+        summary[kind] = {
+            name: dict({stat: round(percentile(values, fraction), 1) for stat, fraction in STATS.items()},
+                       count=len(values))
+            for name, values in groups.items()}
+    return summary
+
+
+class PerformanceGate:
+    """Плагин pytest: сравнение задержек прогона с базовыми значениями и обновление базовых значений."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        :param config: pytest.Config: Конфигурация pytest.
+        """
+        settings = ConfigProvider().settings.run
+        self.config = config
+        self.profile = ConfigProvider().settings.profile
+        self.mode = config.getoption("perf_gate") or settings.perf_gate
+        if self.mode not in MODES:
+            raise pytest.UsageError(f"Параметр run.perf_gate: ожидается одно из {MODES}, получено {self.mode!r}")
+        self.update = config.getoption("perf_update_baseline")
+        self.path = config.getoption("perf_baseline") or settings.perf_baseline_path
+        self.baseline_runs = settings.perf_baseline_runs
+        self.tolerances = {"p50": settings.perf_tolerance_p50, "p95": settings.perf_tolerance_p95}
+        self.min_delta = settings.perf_min_delta_ms
+        self.report_limit = settings.perf_report_limit
+        self.rows: List[Dict] = []
+        self.baseline_source = None
+
+    def load(self) -> Dict[str, Dict]:
+        """Читает файл базовых значений; отсутствующий или повреждённый файл считается пустым."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, summary: Dict[str, Dict]) -> None:
+        """
+        Сохраняет значения прогона как базовые для текущего профиля.
+
+        Записи тестов, эндпоинтов и страниц, не выполнявшихся в этом прогоне, сохраняются без изменений.
+
+        :param summary: Dict: Сводка прогона (см. summarize).
+        """
+        with CrossProcessLock("perf-baseline"):
+            baselines = self.load()
+            baseline = baselines.setdefault(self.profile, {})
+            for kind, entries in summary.items():
+                baseline.setdefault(kind, {}).update(entries)
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(baselines, file, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def get_baseline(self, engine, run_id: str) -> Dict[str, Dict]:
+        """
+        Возвращает базовые значения: из базы результатов по последним "perf_baseline_runs" прогонам профиля
+        либо из файла "perf_baseline_path".
+        """
+        if self.baseline_runs > 0:
+            run_ids = get_recent_runs(engine, self.profile, self.baseline_runs, exclude=run_id)
+            self.baseline_source = f"последние прогоны в базе результатов ({len(run_ids)})"
+            return summarize(get_latencies(engine, run_ids)) if run_ids else {}
+        self.baseline_source = self.path
+        return self.load().get(self.profile, {})
+
+    def compare(self, current: Dict[str, Dict], baseline: Dict[str, Dict]) -> List[Dict]:
+        """
+        Сравнивает сводку прогона с базовой.
+
+        :param current: Dict: Сводка прогона.
+        :param baseline: Dict: Базовая сводка.
+        :return: List[Dict]: Отличия по убыванию относительного роста; регрессии отмечены полем "regression".
+        """
+        rows = []
+        for kind, entries in current.items():
+            for name, entry in entries.items():
+                base = baseline.get(kind, {}).get(name)
+                if base is None:
+                    continue
+                for stat, tolerance in self.tolerances.items():
+                    if not base[stat]:
+                        continue
+                    change = entry[stat] / base[stat] - 1
+                    rows.append({
+                        "kind": kind, "name": name, "stat": stat,
+                        "baseline": base[stat], "current": entry[stat], "change": change,
+                        "regression": change > tolerance and entry[stat] - base[stat] > self.min_delta})
+        return sorted(rows, key=lambda row: (row["regression"], row["change"]), reverse=True)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """
+        Сравнивает прогон с базовыми значениями (или обновляет их) после записи результатов в базу
+        и в режиме "fail" при регрессиях завершает прогон с ошибкой. Выполняется в управляющем процессе.
+        """
+        results = session.config.pluginmanager.get_plugin("results_store")
+        if is_worker() or results is None:
+            return
+
+        engine, run_id = results.store.engine, results.run_id
+        current = summarize(get_latencies(engine, [run_id]))
+        if self.update:
+            self.save(current)
+            return
+        if self.mode == "off":
+            return
+
+        self.rows = self.compare(current, self.get_baseline(engine, run_id))
+        if self.mode == "fail" and any(row["regression"] for row in self.rows) \
+                and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """Выводит отличия от базовых значений: сначала регрессии, затем остальные по убыванию роста."""
+        if is_worker():
+            return
+        if self.update:
+            terminalreporter.write_sep("-", "базовые значения производительности")
+            terminalreporter.write_line(f"Значения прогона сохранены для профиля {self.profile!r}: {self.path}")
+            return
+        if self.mode == "off" or self.baseline_source is None:
+            return
+
+        regressions = [row for row in self.rows if row["regression"]]
+        terminalreporter.write_sep("-", "сравнение с базовыми значениями производительности")
+        terminalreporter.write_line(f"Базовые значения: {self.baseline_source}")
+        if not self.rows:
+            terminalreporter.write_line("Нет значений для сравнения")
+            return
+        for row in self.rows[:max(self.report_limit, len(regressions))]:
+            terminalreporter.write_line(
+                f"{'РЕГРЕССИЯ' if row['regression'] else '':10} {row['change']:+8.0%} "
+                f"{row['stat']} {row['baseline']:9.1f} -> {row['current']:9.1f} мс  "
+                f"{KIND_TITLES[row['kind']]} {row['name']}",
+                red=row["regression"])
+        terminalreporter.write_line(
+            f"Регрессий: {len(regressions)} из {len(self.rows)} сравнений "
+            f"(допуск p50 +{self.tolerances['p50']:.0%}, p95 +{self.tolerances['p95']:.0%}, "
+            f"не менее {self.min_delta:.0f} мс)",
+            red=bool(regressions))
@@ -0,0 +1,67 @@
+"""
+Плагин pytest, записывающий результаты прогона в базу истории производительности (см. testdata.ResultsStore).
+
+Включается параметром "collect_results" секции "run" (по умолчанию выключен) или параметрами --perf-gate
+и --perf-update-baseline (см. PerformanceGate). Длительности тестов записывает управляющий процесс
+(при запуске через pytest-xdist — по отчётам воркеров), задержки запросов CartApi и метрики страниц —
+процесс, в котором выполняется тест. Все процессы прогона записывают строки с общим идентификатором прогона.
+"""
+import uuid
+import platform
+import pytest
+from typing import Dict
+from API import cart_api
+from configuration.ConfigProvider import ConfigProvider
+from testdata.ResultsStore import ResultsStore
+from testdata.WorkerResources import is_worker
+
+OUTCOME_ORDER = ("passed", "skipped", "failed")
+"""Результаты этапов теста по возрастанию важности: итог теста — самый важный из результатов его этапов."""
+
+
+class ResultsPlugin:
+    """Плагин pytest: запись прогона, длительностей тестов и задержек API корзины в базу."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        :param config: pytest.Config: Конфигурация pytest.
+        """
+        workerinput = getattr(config, "workerinput", None)
+        self.run_id = workerinput["results_run_id"] if workerinput else uuid.uuid4().hex
+        self.store = ResultsStore(self.run_id)
+        self.durations: Dict[str, float] = {}
+        self.outcomes: Dict[str, str] = {}
+        if not is_worker() and not config.option.collectonly:
+            workers = getattr(config.option, "numprocesses", None)
+            self.store.start_run(
+                ConfigProvider().settings.profile, platform.node(),
+                workers if isinstance(workers, int) and workers > 0 else 1)
+        cart_api.session.hooks["response"].append(self.store.record_response)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node) -> None:
+        """Передаёт воркеру xdist идентификатор прогона."""
+        node.workerinput["results_run_id"] = self.run_id
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Суммирует длительности этапов теста и записывает тест после завершения последнего этапа."""
+        if is_worker():
+            return
+        nodeid = report.nodeid
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        outcome = self.outcomes.get(nodeid, "passed")
+        if OUTCOME_ORDER.index(report.outcome) > OUTCOME_ORDER.index(outcome):
+            outcome = report.outcome
+        self.outcomes[nodeid] = outcome
+        if report.when == "teardown":
+            self.store.record_test(nodeid, outcome, self.durations.pop(nodeid))
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Записывает итоги прогона и дожидается записи оставшихся строк."""
+        hooks = cart_api.session.hooks["response"]
+        if self.store.record_response in hooks:
+            hooks.remove(self.store.record_response)
+        if not is_worker() and not session.config.option.collectonly:
+            totals = {outcome: list(self.outcomes.values()).count(outcome) for outcome in OUTCOME_ORDER}
+            self.store.finish_run(totals["passed"], totals["failed"], totals["skipped"])
+        self.store.close()
@@ -0,0 +1,157 @@
+"""
+Плагин pytest, упорядочивающий тесты по длительности предыдущих прогонов.
+
+Длительность каждого теста (подготовка, выполнение и завершение) сохраняется в файле "durations_path" секции "run"
+как экспоненциальное скользящее среднее с коэффициентом "duration_smoothing". Если включён параметр "order_by_duration"
+(по умолчанию выключен), перед прогоном тесты упорядочиваются от самых долгих к самым коротким: при распределении тестов
+по воркерам pytest-xdist долгие тесты стартуют первыми и не остаются «хвостом» в конце прогона.
+
+Тесты переставляются только внутри групп с общими фикстурами — браузера (параметр browser_name) и класса или модуля;
+сами группы упорядочиваются по суммарной длительности. Поэтому перестановка не приводит к повторному запуску браузера
+и фикстур классов. Перед прогоном выводится оценка его общей длительности.
+"""
+import os
+import json
+import heapq
+import pytest
+from typing import Dict, Iterable, List
+from configuration.ConfigProvider import ConfigProvider
+from testdata.WorkerResources import CrossProcessLock, is_worker
+
+
+def estimate_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Оценивает длительность прогона на нескольких воркерах: каждый следующий тест достаётся наименее загруженному воркеру.
+
+    :param durations: Iterable[float]: Длительности тестов в порядке запуска, сек.
+    :param workers: int: Количество воркеров.
+    :return: float: Оценка длительности прогона, сек.
+    """
+    loads = [0.0] * max(workers, 1)
+    for duration in durations:
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+class DurationScheduler:
+    """Плагин pytest: сохранение длительностей тестов, упорядочивание тестов и оценка длительности прогона."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        """
+        :param config: pytest.Config: Конфигурация pytest.
+        """
+        settings = ConfigProvider().settings.run
+        self.config = config
+        self.path = settings.durations_path
+        self.smoothing = settings.duration_smoothing
+        self.default_duration = settings.default_duration
+        self.order_by_duration = settings.order_by_duration
+        self.history = self.load()
+        self.current: Dict[str, float] = {}
+        self.skipped = set()
+        self.estimated = False
+
+    def load(self) -> Dict[str, Dict]:
+        """Читает сохранённые длительности; отсутствующий или повреждённый файл считается пустым."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def get_duration(self, nodeid: str) -> float:
+        """Возвращает ожидаемую длительность теста либо "default_duration" для теста без истории, сек."""
+        entry = self.history.get(nodeid)
+        return entry["mean"] if entry else self.default_duration
+
+    def get_group(self, item: pytest.Item) -> tuple:
+        """Возвращает группу теста: браузер (если тест параметризован им) и класс или модуль."""
+        callspec = getattr(item, "callspec", None)
+        browser_name = callspec.params.get("browser_name") if callspec else None
+        scope = item.getparent(pytest.Class) or item.getparent(pytest.Module)
+        return browser_name, scope.nodeid if scope else ""
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: List[pytest.Item]) -> None:
+        """Упорядочивает тесты от долгих к коротким внутри групп, а группы — по суммарной длительности."""
+        if not self.order_by_duration:
+            return
+
+        browsers: Dict[object, Dict[str, List[pytest.Item]]] = {}
+        for item in items:
+            browser_name, scope = self.get_group(item)
+            browsers.setdefault(browser_name, {}).setdefault(scope, []).append(item)
+
+        ordered = []
+        for groups in browsers.values():
+            for group in sorted(
+                    groups.values(),
+                    key=lambda tests: sum(self.get_duration(test.nodeid) for test in tests),
+                    reverse=True):
+                ordered.extend(sorted(group, key=lambda test: self.get_duration(test.nodeid), reverse=True))
+        items[:] = ordered
+
+    def report_estimate(self, nodeids: List[str]) -> None:
+        """
+        Выводит оценку длительности прогона до его начала.
+
+        :param nodeids: List[str]: Идентификаторы тестов в порядке запуска.
+        """
+        workers = getattr(self.config.option, "numprocesses", None)
+        workers = workers if isinstance(workers, int) and workers > 0 else 1
+        durations = [self.get_duration(nodeid) for nodeid in nodeids]
+        known = sum(nodeid in self.history for nodeid in nodeids)
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None and nodeids:
+            reporter.write_line(
+                f"Оценка длительности: {len(nodeids)} тестов (с историей: {known}), "
+                f"последовательно {sum(durations):.0f} с, воркеров {workers}: "
+                f"~{estimate_makespan(durations, workers):.0f} с")
+
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        if not is_worker():
+            self.report_estimate([item.nodeid for item in session.items])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids: List[str]) -> None:
+        """В управляющем процессе pytest-xdist оценивает длительность по тестам, собранным первым воркером."""
+        if not self.estimated:
+            self.estimated = True
+            self.report_estimate(ids)
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Суммирует длительности этапов теста (в управляющем процессе xdist — по отчётам воркеров)."""
+        self.current[report.nodeid] = self.current.get(report.nodeid, 0.0) + report.duration
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """
+        Обновляет скользящие средние длительностей и сохраняет их.
+
+        Файл перечитывается под межпроцессной блокировкой, чтобы одновременные прогоны
+        (например, разных браузеров, см. UI.browser_matrix) не затирали результаты друг друга.
+        Пропущенные тесты не учитываются; воркеры xdist файл не записывают.
+        """
+        if is_worker() or session.config.option.collectonly or not self.current:
+            return
+
+        with CrossProcessLock("durations"):
+            history = self.load()
+            for nodeid, duration in self.current.items():
+                if nodeid in self.skipped:
+                    continue
+                entry = history.get(nodeid)
+                if entry is None:
+                    history[nodeid] = {"mean": duration, "runs": 1}
+                else:
+                    entry["mean"] += self.smoothing * (duration - entry["mean"])
+                    entry["runs"] += 1
+
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(history, file, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
@@ -15,6 +15,7 @@ def delay_between_tests():
     time.sleep(ConfigProvider().get_int("api", "request_delay"))
 
 
+@pytest.mark.serial("cart")
 @pytest.mark.positive
 @allure.epic("Интернет-магазин «Читай-город»")
 @allure.feature("Тестовые сценарии API")
@@ -140,6 +141,7 @@ class TestCartPositive():
             assert get_quant_after_dec == dec_quant
 
 
+@pytest.mark.serial("cart")
 @pytest.mark.negative
 @allure.epic("Интернет-магазин «Читай-город»")
 @allure.feature("Тестовые сценарии API")
@@ -299,3 +301,41 @@ class TestCartNegative():
 
         with allure.step("Проверка статус-кода 401 Unauthorized"):
             assert delete_product.status_code == 401
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Тестовые сценарии API")
+@allure.severity("NORMAL")
+@allure.suite("API: Качество поиска")
+class TestSearchCorpus():
+    """
+    Тест-кейс проверяет качество поиска на корпусе реальных поисковых запросов из testdata.
+    """
+    @pytest.fixture(autouse=True)
+    def setup_class(self, search_api, search_corpus) -> None:
+        """
+        Инициализирует API клиента поиска и корпус запросов.
+
+        :param search_api: Объект SearchApi для выполнения поисковых запросов.
+        :param search_corpus: Объект SearchCorpus, предоставляющий поисковые запросы.
+        """
+        self.search_api = search_api
+        self.search_corpus = search_corpus
+
+    @allure.story("Функциональность поиска товаров")
+    @allure.title("Проверка доли успешных поисковых запросов корпуса")
+    def test_search_corpus_pass_rate(self):
+        """
+        Тест выполняет все запросы корпуса и проверяет, что доля запросов, в результатах которых найден
+        ожидаемый товар, не ниже "min_pass_rate" из секции "search".
+        """
+        summary = self.search_api.run_corpus(self.search_corpus)
+        min_pass_rate = ConfigProvider().get_float("search", "min_pass_rate")
+
+        with allure.step("Проверка, что корпус не пуст"):
+            assert summary["total"] > 0, "Корпус поисковых запросов пуст"
+
+        with allure.step(f"Проверка, что доля успешных запросов не ниже {min_pass_rate:.0%}"):
+            assert summary["pass_rate"] >= min_pass_rate, \
+                f"Доля успешных запросов {summary['pass_rate']:.1%}, неуспешные: {summary['failures'][:10]}"
@@ -0,0 +1,75 @@
+import os
+import pytest
+import allure
+from configuration import ConfigProvider
+
+# load_settings кэширует настройки на весь процесс: тесты читают файл заново через исходную функцию.
+load_settings = ConfigProvider.load_settings.__wrapped__
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Настройки профилей")
+class TestConfigProvider():
+    """
+    Тест-кейс проверяет чтение настроек: профили, переопределение переменными окружения и приведение типов.
+    """
+
+    @allure.story("Профили настроек")
+    @allure.title("Проверка, что секция профиля переопределяет только свои параметры")
+    def test_profile_overrides_base_section(self):
+        live = load_settings("live")
+        local_fake = load_settings("local-fake")
+
+        with allure.step("Параметры из секции [ui:local-fake] переопределены"):
+            assert local_fake.ui.base_url == "http://127.0.0.1:8000/"
+            assert local_fake.ui.serve_archive is True
+            assert local_fake.api.request_delay == 0
+
+        with allure.step("Остальные параметры взяты из общих секций"):
+            assert local_fake.ui.timeout == live.ui.timeout
+            assert local_fake.search.corpus_path == live.search.corpus_path
+            assert local_fake.profile == "local-fake"
+
+    @allure.story("Профили настроек")
+    @allure.title("Проверка ошибки для неизвестного профиля")
+    def test_unknown_profile(self):
+        with allure.step("Загрузка несуществующего профиля"):
+            with pytest.raises(ValueError, match="Неизвестный профиль"):
+                load_settings("no-such-profile")
+
+    @allure.story("Переменные окружения")
+    @allure.title("Проверка переопределения параметров переменными окружения CG_<СЕКЦИЯ>_<ПАРАМЕТР>")
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("CG_UI_TIMEOUT", "17")
+        monkeypatch.setenv("CG_RUN_COLLECT_RESULTS", "yes")
+
+        settings = load_settings("local-fake")
+
+        with allure.step("Значения из окружения приведены к типам полей"):
+            assert settings.ui.timeout == 17
+            assert settings.run.collect_results is True
+
+    @allure.story("Переменные окружения")
+    @allure.title("Проверка сообщения об ошибке для значения неверного типа")
+    def test_env_override_invalid_value(self, monkeypatch):
+        monkeypatch.setenv("CG_UI_BACKGROUND_LAUNCH", "maybe")
+
+        with allure.step("Загрузка настроек с некорректным логическим значением"):
+            with pytest.raises(ValueError, match="ui.background_launch"):
+                load_settings("live")
+
+    @allure.story("Пути в настройках")
+    @allure.title("Проверка, что относительные пути отсчитываются от корня проекта")
+    def test_relative_paths_resolved_from_root(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CG_RUN_RESULTS_DB_PATH", "./history/results.db")
+
+        settings = load_settings("live")
+
+        with allure.step("Путь из окружения и путь из файла отсчитаны от ROOT_DIR"):
+            assert settings.run.results_db_path == os.path.join(ConfigProvider.ROOT_DIR, "history", "results.db")
+            assert settings.search.corpus_path == os.path.join(
+                ConfigProvider.ROOT_DIR, "testdata", "search_corpus.jsonl")
@@ -0,0 +1,83 @@
+import os
+import json
+import pytest
+import allure
+from UI.driver_resolver import DriverResolver
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Кэш веб-драйверов")
+class TestDriverResolver():
+    """
+    Тест-кейс проверяет поиск веб-драйвера в локальном кэше по индексу и проверку хеша SHA-256 без обращения к сети.
+    """
+
+    @allure.story("Кэш драйверов")
+    @allure.title("Проверка добавления драйвера в кэш и поиска по индексу")
+    def test_cache_index(self, tmp_path):
+        source = tmp_path / "downloads" / "chromedriver"
+        source.parent.mkdir()
+        source.write_bytes(b"chromedriver 126")
+        resolver = DriverResolver("Chrome")
+        resolver.driver_path, resolver.driver_version = "", "126.0.6478.126"
+        resolver.cache_dir = str(tmp_path / "cache")
+        resolver.index_path = str(tmp_path / "cache" / "index.json")
+        key = resolver.get_cache_key()
+
+        with allure.step("Ключ кэша содержит закреплённую версию драйвера"):
+            assert key.startswith("chrome-driver-126.0.6478.126-")
+
+        with allure.step("Драйвер копируется в каталог, названный по хешу содержимого"):
+            path = resolver.add_to_cache(key, str(source))
+            digest = DriverResolver.get_digest(str(source))
+            assert path == os.path.join(resolver.cache_dir, "objects", digest, "chromedriver")
+            assert os.access(path, os.X_OK)
+
+        with allure.step("Индекс сопоставляет ключ с хешем, именем и размером файла"):
+            with open(resolver.index_path, encoding="utf-8") as file:
+                assert json.load(file) == {key: {"sha256": digest, "file_name": "chromedriver", "size": 16}}
+            assert resolver.find_in_cache(key) == path
+            assert resolver.find_in_cache("firefox-126-linux64") is None
+            assert not [name for name in os.listdir(resolver.cache_dir) if name.endswith(".tmp")]
+
+    @allure.story("Кэш драйверов")
+    @allure.title("Проверка, что повреждённый драйвер загружается заново")
+    def test_corrupted_driver_downloaded_again(self, tmp_path, monkeypatch):
+        source = tmp_path / "geckodriver"
+        source.write_bytes(b"geckodriver 0.34")
+        resolver = DriverResolver("Firefox")
+        resolver.driver_path, resolver.driver_version = "", "0.34.0"
+        resolver.cache_dir = str(tmp_path / "cache")
+        resolver.index_path = str(tmp_path / "cache" / "index.json")
+        downloads = []
+        monkeypatch.setattr(resolver, "download", lambda: downloads.append(1) or str(source))
+
+        with allure.step("Первое обращение загружает драйвер, второе берёт его из кэша"):
+            path = resolver.resolve()
+            assert resolver.resolve() == path
+            assert len(downloads) == 1
+
+        with allure.step("Файл того же размера с другим содержимым не проходит проверку хеша"):
+            with open(path, "wb") as file:
+                file.write(b"geckodriver 0.99")
+            assert resolver.find_in_cache(resolver.get_cache_key()) is None
+
+        with allure.step("Драйвер загружается и восстанавливается в кэше"):
+            assert resolver.resolve() == path
+            assert len(downloads) == 2
+            with open(path, "rb") as file:
+                assert file.read() == b"geckodriver 0.34"
+
+    @allure.story("Закреплённый путь")
+    @allure.title("Проверка, что закреплённый путь к драйверу используется без обращения к кэшу")
+    def test_pinned_path(self, tmp_path):
+        resolver = DriverResolver("Chrome")
+        resolver.driver_path = str(tmp_path / "chromedriver")
+        resolver.cache_dir = str(tmp_path / "missing")
+
+        with allure.step("Путь возвращается как есть"):
+            assert resolver.resolve() == resolver.driver_path
+            assert not os.path.exists(resolver.cache_dir)
@@ -0,0 +1,108 @@
+import pytest
+import allure
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException
+from UI import element_cache
+from UI.element_cache import ElementCache
+
+BUTTON = (By.CSS_SELECTOR, "button.cart")
+MISSING = (By.CSS_SELECTOR, "div.missing")
+
+
+class FakeDriver:
+    """Веб-драйвер без браузера: каждый поиск возвращает новый элемент, устаревшие элементы задаются тестом."""
+
+    def __init__(self) -> None:
+        self.document = ["http://127.0.0.1:8000/", 1.0]
+        self.found = 0
+        self.stale = set()
+
+    def execute_script(self, script, *args):
+        return list(self.document)
+
+    def find_element(self, by, value):
+        self.found += 1
+        return WebElement(self, f"element-{self.found}")
+
+    def find_elements(self, by, value):
+        return [self.find_element(by, value)] if (by, value) != MISSING else []
+
+    def execute(self, command, params=None):
+        if params["id"] in self.stale:
+            raise StaleElementReferenceException(f"{params['id']} is stale")
+        return {"value": params["id"]}
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Тестовые сценарии UI")
+@allure.severity("NORMAL")
+@allure.suite("UI: Кэш элементов страницы")
+class TestElementCache():
+    """
+    Тест-кейс проверяет повторное использование найденных элементов, повторный поиск устаревших элементов
+    и очистку кэша при смене страницы.
+    """
+
+    @allure.story("Повторное использование элементов")
+    @allure.title("Проверка, что повторный поиск по локатору не обращается к WebDriver")
+    def test_hit(self, monkeypatch):
+        monkeypatch.setattr(element_cache, "stats", {})
+        driver = FakeDriver()
+        cache = ElementCache(driver)
+
+        with allure.step("Два поиска по одному локатору"):
+            element = cache.find(BUTTON)
+            assert cache.find(BUTTON) is element
+
+        with allure.step("Элемент найден один раз, попадание и промах учтены"):
+            assert driver.found == 1
+            assert element_cache.stats[BUTTON] == {"hits": 1, "misses": 1, "stale": 0}
+
+        with allure.step("Отсутствие элемента не кэшируется"):
+            assert cache.find_optional(MISSING) is None
+            assert MISSING not in cache.elements
+
+    @allure.story("Устаревшие элементы")
+    @allure.title("Проверка повторного поиска устаревшего элемента и повтора команды")
+    def test_stale_refind(self, monkeypatch):
+        monkeypatch.setattr(element_cache, "stats", {})
+        driver = FakeDriver()
+        cache = ElementCache(driver)
+        element = cache.find(BUTTON)
+
+        with allure.step("Элемент устаревает после перерисовки страницы"):
+            driver.stale.add(element.id)
+
+        with allure.step("Команда выполняется для найденного заново элемента"):
+            assert element.text == "element-2"
+            assert element.id == "element-2"
+            assert element_cache.stats[BUTTON]["stale"] == 1
+
+        with allure.step("Кэш содержит найденный заново элемент"):
+            assert cache.find(BUTTON).id == "element-2"
+            assert driver.found == 2
+
+    @allure.story("Смена страницы")
+    @allure.title("Проверка очистки кэша после клика, сменившего документ")
+    def test_navigation_clears_cache(self, monkeypatch):
+        monkeypatch.setattr(element_cache, "stats", {})
+        driver = FakeDriver()
+        cache = ElementCache(driver)
+        element = cache.find(BUTTON)
+
+        with allure.step("Клик без смены документа сохраняет кэш"):
+            element.click()
+            assert cache.find(BUTTON) is element
+
+        with allure.step("Клик, после которого загрузилась другая страница, очищает кэш"):
+            element.click()
+            driver.document = ["http://127.0.0.1:8000/cart", 2.0]
+            assert cache.find(BUTTON) is not element
+            assert driver.found == 2
+
+        with allure.step("invalidate очищает кэш после перехода по адресу"):
+            cache.invalidate()
+            cache.find(BUTTON)
+            assert driver.found == 3
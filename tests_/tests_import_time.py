@@ -0,0 +1,53 @@
+import sys
+import json
+import pytest
+import allure
+import subprocess
+from configuration.ConfigProvider import ConfigProvider
+
+IMPORT_SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+import tests_.conftest
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    "elapsed_ms": elapsed,
+    "modules": [name for name in ("selenium", "webdriver_manager", "UI") if name in sys.modules]
+}))
+"""
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Тестовые сценарии API")
+@allure.severity("NORMAL")
+@allure.suite("API: Время запуска тестов")
+class TestApiImportTime():
+    """
+    Тест-кейс проверяет, что запуск API-тестов не загружает Selenium, webdriver-manager и page-объекты
+    и укладывается в бюджет времени импорта.
+    """
+
+    @allure.story("Время запуска")
+    @allure.title("Проверка импорта conftest без UI-зависимостей")
+    def test_api_conftest_import(self):
+        """
+        Тест импортирует conftest в отдельном процессе и проверяет загруженные модули и время импорта.
+
+        Бюджет времени задаётся параметром "import_budget_ms" в секции "api".
+        """
+        with allure.step("Импорт conftest в отдельном процессе"):
+            output = subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                capture_output=True, text=True, check=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            allure.attach(output, name="Время импорта",
+                          attachment_type=allure.attachment_type.JSON)
+
+        with allure.step("Проверка, что UI-зависимости не загружены"):
+            assert result["modules"] == [], f"Загружены модули: {result['modules']}"
+
+        with allure.step("Проверка времени импорта"):
+            budget = ConfigProvider().get_int("api", "import_budget_ms")
+            assert result["elapsed_ms"] <= budget, \
+                f"Импорт занял {result['elapsed_ms']:.0f} мс при бюджете {budget} мс"
@@ -0,0 +1,96 @@
+import json
+import pytest
+import allure
+from types import SimpleNamespace
+from tests_.perf_gate import PerformanceGate, percentile, summarize
+
+
+def make_gate(**options) -> PerformanceGate:
+    """Создаёт PerformanceGate с параметрами командной строки из options (остальные не заданы)."""
+    return PerformanceGate(SimpleNamespace(getoption=lambda name: options.get(name)))
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Сравнение с базовыми значениями производительности")
+class TestPerformanceGate():
+    """
+    Тест-кейс проверяет вычисление процентилей и сравнение задержек прогона с базовыми значениями.
+    """
+
+    @allure.story("Процентили")
+    @allure.title("Проверка процентилей с линейной интерполяцией")
+    def test_percentile(self):
+        with allure.step("Медиана и 95-й процентиль упорядочиваемых значений"):
+            assert percentile([40.0, 10.0, 30.0, 20.0], 0.5) == 25.0
+            assert percentile([10.0, 20.0, 30.0, 40.0, 50.0], 0.95) == pytest.approx(48.0)
+
+        with allure.step("Процентиль одного значения равен ему самому"):
+            assert percentile([7.0], 0.95) == 7.0
+
+        with allure.step("Сводка содержит p50, p95 и количество значений"):
+            assert summarize({"endpoints": {"GET /api/v1/cart": [100.0, 200.0]}}) == {
+                "endpoints": {"GET /api/v1/cart": {"p50": 150.0, "p95": 195.0, "count": 2}}}
+
+    @allure.story("Сравнение с базовыми значениями")
+    @allure.title("Проверка, что регрессия требует и относительного, и абсолютного роста")
+    def test_compare(self):
+        gate = make_gate()
+        gate.tolerances, gate.min_delta = {"p50": 0.2, "p95": 0.5}, 50
+
+        baseline = {"tests": {
+            "slow": {"p50": 1000.0, "p95": 2000.0},
+            "fast": {"p50": 10.0, "p95": 20.0},
+            "zero": {"p50": 0.0, "p95": 0.0}}}
+        current = {"tests": {
+            "slow": {"p50": 1300.0, "p95": 2100.0},
+            "fast": {"p50": 30.0, "p95": 40.0},
+            "zero": {"p50": 5.0, "p95": 5.0},
+            "new": {"p50": 1.0, "p95": 1.0}}}
+
+        with allure.step("Сравнение сводок"):
+            rows = gate.compare(current, baseline)
+
+        with allure.step("Регрессия только у p50 долгого теста: рост +30% и на 300 мс"):
+            assert [(row["name"], row["stat"]) for row in rows if row["regression"]] == [("slow", "p50")]
+            assert rows[0]["change"] == pytest.approx(0.3)
+
+        with allure.step("Быстрый тест вырос втрое, но меньше чем на perf_min_delta_ms"):
+            assert {row["stat"] for row in rows if row["name"] == "fast" and not row["regression"]} == {"p50", "p95"}
+
+        with allure.step("Новые тесты и нулевые базовые значения не сравниваются"):
+            assert {row["name"] for row in rows} == {"slow", "fast"}
+
+    @allure.story("Файл базовых значений")
+    @allure.title("Проверка, что сохранение обновляет только выполненные записи своего профиля")
+    def test_save_merges_profiles(self, tmp_path):
+        path = tmp_path / "baseline" / "perf_baseline.json"
+        gate = make_gate(perf_baseline=str(path))
+        gate.profile = "local-fake"
+
+        with allure.step("Повреждённый файл считается пустым"):
+            path.parent.mkdir()
+            path.write_text("{", encoding="utf-8")
+            assert gate.load() == {}
+
+        with allure.step("Сохранение значений двух прогонов и другого профиля"):
+            path.write_text(json.dumps({"live": {"tests": {"a": {"p50": 1.0, "p95": 2.0, "count": 1}}}}),
+                            encoding="utf-8")
+            gate.save({"tests": {"a": {"p50": 5.0, "p95": 6.0, "count": 1}}, "pages": {}})
+            gate.save({"tests": {"b": {"p50": 7.0, "p95": 8.0, "count": 1}}})
+
+        with allure.step("Записи других профилей и прошлых прогонов сохранены"):
+            baselines = json.loads(path.read_text(encoding="utf-8"))
+            assert baselines["live"]["tests"]["a"]["p50"] == 1.0
+            assert set(baselines["local-fake"]["tests"]) == {"a", "b"}
+            assert gate.get_baseline(None, "run-1") == baselines["local-fake"]
+            assert list(tmp_path.rglob("*.tmp")) == []
+
+    @allure.story("Параметры")
+    @allure.title("Проверка ошибки для неизвестного режима сравнения")
+    def test_unknown_mode(self):
+        with allure.step("Создание плагина с режимом, которого нет среди off, warn и fail"):
+            with pytest.raises(pytest.UsageError, match="perf_gate"):
+                make_gate(perf_gate="strict")
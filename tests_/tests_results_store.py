@@ -0,0 +1,113 @@
+import time
+import pytest
+import allure
+from datetime import timedelta
+from types import SimpleNamespace
+from testdata.ResultsStore import (
+    ResultsStore, duration_trend, endpoint_trend, get_latencies, get_recent_runs, page_trend)
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: История производительности")
+class TestResultsStore():
+    """
+    Тест-кейс проверяет запись результатов прогона пачками и запросы истории к базе SQLite во временном каталоге.
+    """
+
+    @allure.story("Запись пачками")
+    @allure.title("Проверка, что строки записываются пачками не больше results_batch_size")
+    def test_batches(self, tmp_path):
+        store = ResultsStore("run-1", f"sqlite:///{tmp_path / 'results.db'}")
+        store.batch_size, store.flush_interval = 2, 5
+        batches = []
+        write = store.write
+        store.write = lambda batch: batches.append(len(batch)) or write(batch)
+
+        with allure.step("Запись пяти результатов и остановка потока записи"):
+            for index in range(5):
+                store.record_test(f"tests_api.py::test_{index}", "passed", 0.1)
+            store.close()
+
+        with allure.step("Оставшиеся строки записаны при остановке"):
+            assert batches == [2, 2, 1]
+            assert len(duration_trend(store.engine)) == 5
+
+    @allure.story("Запись пачками")
+    @allure.title("Проверка записи неполной пачки по истечении results_flush_interval")
+    def test_flush_interval(self, tmp_path):
+        store = ResultsStore("run-1", f"sqlite:///{tmp_path / 'results.db'}")
+        store.batch_size, store.flush_interval = 100, 0.1
+
+        with allure.step("Строка записывается, не дожидаясь заполнения пачки"):
+            store.record_test("tests_api.py::test_cart", "passed", 0.5)
+            deadline = time.monotonic() + 5
+            while not duration_trend(store.engine) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert duration_trend(store.engine)[0]["count"] == 1
+        store.close()
+
+    @allure.story("Запросы истории")
+    @allure.title("Проверка группировки эндпоинтов, метрик страниц и выборки задержек прогона")
+    def test_trends_and_latencies(self, tmp_path):
+        store = ResultsStore("run-1", f"sqlite:///{tmp_path / 'results.db'}")
+
+        with allure.step("Запись результатов тестов, запросов API и метрик страниц"):
+            store.record_test("tests_api.py::test_add", "passed", 0.25)
+            store.record_test("tests_api.py::test_skip", "skipped", 0.0)
+            store.record_test("tests_api.py::test_fail", "failed", 1.0)
+            for product_id, latency in [(101, 100), (202, 300)]:
+                store.record_response(SimpleNamespace(
+                    request=SimpleNamespace(method="DELETE", path_url=f"/api/v1/cart/product/{product_id}?x=1"),
+                    status_code=204, elapsed=timedelta(milliseconds=latency)))
+            store.record_page_timings("tests_ui.py::test_cart", [
+                {"label": "go_section:cart", "url": "/cart", "full_load": True,
+                 "paint": {"first-paint": 50.0}, "navigation": {"ttfb": 10.0, "dom_content_loaded": 80.0, "load": 120.0}},
+                {"label": "go_section:cart", "url": "/cart", "full_load": False,
+                 "navigation": {"ttfb": 1.0, "dom_content_loaded": 1.0, "load": 1.0}}])
+            store.close()
+
+        with allure.step("Запросы к товарам с разными id сгруппированы в один эндпоинт"):
+            trend = endpoint_trend(store.engine)
+            assert [(row["name"], row["count"], row["mean"]) for row in trend] == [
+                ("DELETE /api/v1/cart/product/{id}", 2, 200.0)]
+
+        with allure.step("Переходы без полной загрузки страницы не записаны"):
+            assert [(row["name"], row["count"], row["max"]) for row in page_trend(store.engine)] == [
+                ("go_section:cart", 1, 120.0)]
+
+        with allure.step("Пропущенные тесты не учитываются в динамике длительности"):
+            assert {row["name"] for row in duration_trend(store.engine)} == {
+                "tests_api.py::test_add", "tests_api.py::test_fail"}
+
+        with allure.step("Задержки прогона: только успешные тесты, в миллисекундах"):
+            assert get_latencies(store.engine, ["run-1"]) == {
+                "tests": {"tests_api.py::test_add": [250.0]},
+                "endpoints": {"DELETE /api/v1/cart/product/{id}": [100.0, 300.0]},
+                "pages": {"go_section:cart": [120.0]}}
+            assert get_latencies(store.engine, ["run-2"]) == {"tests": {}, "endpoints": {}, "pages": {}}
+
+    @allure.story("Запросы истории")
+    @allure.title("Проверка выбора последних завершённых прогонов профиля")
+    def test_recent_runs(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'results.db'}"
+
+        with allure.step("Запись прогонов разных профилей; последний прогон не завершён"):
+            for run_id, profile, finished in [
+                    ("old", "live", True), ("other", "local-fake", True),
+                    ("new", "live", True), ("running", "live", False)]:
+                store = ResultsStore(run_id, url)
+                store.start_run(profile, "host", 1)
+                if finished:
+                    store.finish_run(1, 0, 0)
+                store.close()
+                time.sleep(0.01)
+
+        with allure.step("Прогоны возвращаются от новых к старым без незавершённых и исключённых"):
+            store = ResultsStore("check", url)
+            assert get_recent_runs(store.engine, "live", 5) == ["new", "old"]
+            assert get_recent_runs(store.engine, "live", 5, exclude="new") == ["old"]
+            assert get_recent_runs(store.engine, "live", 1) == ["new"]
+            store.close()
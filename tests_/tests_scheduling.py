@@ -0,0 +1,79 @@
+import json
+import pytest
+import allure
+from types import SimpleNamespace
+from tests_.scheduling import DurationScheduler, estimate_makespan
+
+
+class FakeItem:
+    """Тест без сбора pytest: идентификатор, класс и (необязательно) параметр browser_name."""
+
+    def __init__(self, nodeid: str, browser_name: str = None) -> None:
+        self.nodeid = nodeid
+        self.scope = SimpleNamespace(nodeid=nodeid.rsplit("::", 1)[0])
+        self.callspec = SimpleNamespace(params={"browser_name": browser_name}) if browser_name else None
+
+    def getparent(self, cls):
+        return self.scope if cls is pytest.Class else None
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Порядок тестов по длительности")
+class TestDurationScheduler():
+    """
+    Тест-кейс проверяет сохранение скользящих средних длительностей тестов и упорядочивание тестов по ним.
+    """
+
+    @allure.story("Скользящее среднее")
+    @allure.title("Проверка обновления скользящего среднего и пропуска пропущенных тестов")
+    def test_moving_average(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"a.py::test_old": {"mean": 10.0, "runs": 3}}), encoding="utf-8")
+        config = SimpleNamespace(option=SimpleNamespace(collectonly=False))
+        scheduler = DurationScheduler(config)
+        scheduler.path, scheduler.smoothing = str(path), 0.5
+
+        with allure.step("Длительности этапов теста суммируются"):
+            for nodeid, duration, skipped in [
+                    ("a.py::test_old", 1.0, False), ("a.py::test_old", 3.0, False),
+                    ("a.py::test_new", 2.0, False), ("a.py::test_skipped", 0.1, True)]:
+                scheduler.pytest_runtest_logreport(SimpleNamespace(nodeid=nodeid, duration=duration, skipped=skipped))
+            scheduler.pytest_sessionfinish(SimpleNamespace(config=config))
+
+        with allure.step("Среднее сдвинуто к новой длительности на долю duration_smoothing"):
+            history = json.loads(path.read_text(encoding="utf-8"))
+            assert history["a.py::test_old"] == {"mean": 7.0, "runs": 4}
+            assert history["a.py::test_new"] == {"mean": 2.0, "runs": 1}
+            assert "a.py::test_skipped" not in history
+
+    @allure.story("Порядок тестов")
+    @allure.title("Проверка, что тесты переставляются только внутри групп с общими фикстурами")
+    def test_order_within_groups(self):
+        scheduler = DurationScheduler(SimpleNamespace(option=SimpleNamespace()))
+        scheduler.order_by_duration, scheduler.default_duration = True, 5.0
+        scheduler.history = {nodeid: {"mean": mean, "runs": 1} for nodeid, mean in [
+            ("a.py::A::test_short", 1.0), ("a.py::A::test_long", 9.0),
+            ("b.py::B::test_1", 8.0), ("b.py::B::test_2", 8.0)]}
+        items = [
+            FakeItem("a.py::A::test_short", "chrome"), FakeItem("a.py::A::test_long", "chrome"),
+            FakeItem("b.py::B::test_1", "chrome"), FakeItem("b.py::B::test_2", "chrome"),
+            FakeItem("a.py::A::test_short", "firefox"), FakeItem("c.py::C::test_unknown", "firefox")]
+
+        with allure.step("Упорядочивание тестов"):
+            scheduler.pytest_collection_modifyitems(items)
+
+        with allure.step("Браузеры не перемешаны, группы упорядочены по суммарной длительности"):
+            assert [(item.callspec.params["browser_name"], item.nodeid) for item in items] == [
+                ("chrome", "b.py::B::test_1"), ("chrome", "b.py::B::test_2"),
+                ("chrome", "a.py::A::test_long"), ("chrome", "a.py::A::test_short"),
+                ("firefox", "c.py::C::test_unknown"), ("firefox", "a.py::A::test_short")]
+
+    @allure.story("Оценка длительности")
+    @allure.title("Проверка оценки длительности прогона на нескольких воркерах")
+    def test_estimate_makespan(self):
+        with allure.step("Каждый тест достаётся наименее загруженному воркеру"):
+            assert estimate_makespan([5.0, 3.0, 2.0, 2.0], 2) == 7.0
+            assert estimate_makespan([5.0, 3.0], 0) == 8.0
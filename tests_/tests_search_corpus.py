@@ -0,0 +1,59 @@
+import pytest
+import allure
+from testdata.SearchCorpus import SearchCase, SearchCorpus
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Корпус поисковых запросов")
+class TestSearchCorpus():
+    """
+    Тест-кейс проверяет потоковое чтение корпуса поисковых запросов из файлов JSONL и CSV.
+    """
+
+    @allure.story("Потоковое чтение")
+    @allure.title("Проверка, что первые запросы читаются без разбора остальной части файла")
+    def test_head_reads_lazily(self, tmp_path):
+        path = tmp_path / "corpus.jsonl"
+        path.write_text(
+            '{"query": "Дюна", "variants": ["Дюна", "Dune"]}\n'
+            '\n'
+            '{"query": " Хоббит ", "variants": []}\n'
+            'не JSON: до этой строки чтение доходить не должно\n',
+            encoding="utf-8")
+        corpus = SearchCorpus(str(path))
+
+        with allure.step("Чтение двух первых запросов"):
+            cases = corpus.head(2)
+
+        with allure.step("Пустая строка пропущена, пустой список вариантов заменён самим запросом"):
+            assert cases == [SearchCase("Дюна", ["Дюна", "Dune"]), SearchCase("Хоббит", ["Хоббит"])]
+
+        with allure.step("Полное чтение доходит до повреждённой строки"):
+            with pytest.raises(ValueError):
+                list(corpus)
+
+    @allure.story("Потоковое чтение")
+    @allure.title("Проверка ограничения количества запросов и разбиения на пачки")
+    def test_limit_and_batches(self, tmp_path):
+        path = tmp_path / "corpus.csv"
+        path.write_text(
+            "query,variants\n"
+            "Ведьмак,Ведьмак|Witcher\n"
+            "Метро 2033,\n"
+            "Дюна,Дюна|Dune\n"
+            "Sapiens,Sapiens\n",
+            encoding="utf-8")
+
+        with allure.step("Варианты из CSV разделены символом |"):
+            assert SearchCorpus(str(path)).head(1) == [SearchCase("Ведьмак", ["Ведьмак", "Witcher"])]
+
+        with allure.step("Параметр limit ограничивает количество запросов"):
+            queries = [case.query for case in SearchCorpus(str(path), limit=3)]
+            assert queries == ["Ведьмак", "Метро 2033", "Дюна"]
+
+        with allure.step("Последняя пачка содержит оставшиеся запросы"):
+            sizes = [len(batch) for batch in SearchCorpus(str(path)).batches(3)]
+            assert sizes == [3, 1]
@@ -0,0 +1,99 @@
+import json
+import time
+import base64
+import pytest
+import allure
+from testdata.DataProvider import DataProvider
+from UI.storage_state import StorageState
+
+
+class FakeDriver:
+    """Веб-драйвер без браузера: запоминает открытые адреса и установленные cookies."""
+
+    def __init__(self) -> None:
+        self.urls = []
+        self.cookies = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        return None
+
+
+def make_jwt(expires_at: float) -> str:
+    """Формирует JWT-токен с указанным временем истечения срока действия (подпись не проверяется)."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode().rstrip("=")
+    return f"Bearer eyJhbGciOiJIUzI1NiJ9.{payload}.signature"
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Инфраструктура тестов")
+@allure.severity("NORMAL")
+@allure.suite("Инфраструктура: Состояние авторизации браузера")
+class TestStorageState():
+    """
+    Тест-кейс проверяет срок действия сохранённого состояния авторизации и его формирование из токена test_data.json.
+    """
+
+    @allure.story("Срок действия")
+    @allure.title("Проверка срока действия по полю exp токена и по storage_state_ttl")
+    def test_is_expired(self, monkeypatch):
+        monkeypatch.setattr(DataProvider, "get_tokens", lambda self: ["token"])
+        storage = StorageState(FakeDriver())
+        storage.ttl = 3600
+
+        with allure.step("Срок определяется по полю exp токена, а не по времени сохранения"):
+            assert not storage.is_expired(
+                {"saved_at": 0, "cookies": [{"name": "access-token", "value": make_jwt(time.time() + 60)}]})
+            assert storage.is_expired(
+                {"saved_at": time.time(), "cookies": [{"name": "access-token", "value": make_jwt(time.time() - 60)}]})
+
+        with allure.step("Для токена, который не удалось разобрать, используется storage_state_ttl"):
+            assert not storage.is_expired(
+                {"saved_at": time.time() - 60, "cookies": [{"name": "access-token", "value": "opaque"}]})
+            assert storage.is_expired(
+                {"saved_at": time.time() - 7200, "cookies": [{"name": "access-token", "value": "opaque"}]})
+
+        with allure.step("Состояние без cookie access-token считается устаревшим"):
+            assert storage.is_expired({"saved_at": time.time(), "cookies": [{"name": "other", "value": "1"}]})
+
+    @allure.story("Состояние из токена")
+    @allure.title("Проверка формирования состояния из токена для домена base_url")
+    def test_from_token(self, monkeypatch, tmp_path):
+        token = make_jwt(time.time() + 3600)
+        monkeypatch.setattr(DataProvider, "get_tokens", lambda self: [token])
+        driver = FakeDriver()
+        storage = StorageState(driver)
+        storage.path = str(tmp_path / "auth" / "storage_state.json")
+        storage.base_url = "https://www.chitai-gorod.ru/catalog/"
+
+        with allure.step("Cookie access-token выставляется на домен сайта без префикса www"):
+            state = storage.from_token()
+            assert state["cookies"] == [
+                {"name": "access-token", "value": token, "path": "/", "domain": "chitai-gorod.ru"}]
+
+        with allure.step("Актуальное состояние сохраняется в файл и устанавливается в браузер с корня сайта"):
+            assert storage.prime()
+            assert storage.load()["cookies"] == state["cookies"]
+            assert driver.urls == ["https://www.chitai-gorod.ru/robots.txt"]
+            assert driver.cookies == state["cookies"]
+
+    @allure.story("Состояние из токена")
+    @allure.title("Проверка, что устаревший токен не сохраняется и не применяется")
+    def test_expired_token(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(DataProvider, "get_tokens", lambda self: [make_jwt(time.time() - 60)])
+        storage = StorageState(FakeDriver())
+        storage.path = str(tmp_path / "storage_state.json")
+
+        with allure.step("Обновление из устаревшего токена не создаёт файл"):
+            assert storage.refresh() is None
+            assert not (tmp_path / "storage_state.json").exists()
+
+        with allure.step("Применение состояния завершается ошибкой с подсказкой"):
+            with pytest.raises(RuntimeError, match="test_login_with"):
+                storage.apply()
@@ -0,0 +1,35 @@
+import pytest
+import allure
+from API.text_matching import MATCH_EXACT, MATCH_PHONETIC, classify_match, match_key, match_variants
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Тестовые сценарии API")
+@allure.severity("NORMAL")
+@allure.suite("API: Сопоставление названий товаров")
+class TestTextMatching():
+    """
+    Тест-кейс проверяет сопоставление названий товаров, используемое проверками поиска в UI- и API-тестах.
+    """
+
+    @allure.story("Ключ сопоставления")
+    @allure.title("Проверка, что сочетание \"th\" не превращается в \"tg\"")
+    def test_match_key_th(self):
+        with allure.step("Проверка ключа английского названия с \"th\""):
+            assert match_key("The Hobbit") == "te gobit"
+
+        with allure.step("Проверка совпадения написаний на латинице и кириллице"):
+            assert match_key("Thomas") == match_key("Томас")
+
+    @allure.story("Строгая проверка")
+    @allure.title("Проверка, что транслитерация не засчитывается строгой проверкой")
+    def test_phonetic_match_is_reported_separately(self):
+        titles = ["Harry Potter and the Philosopher's Stone"]
+
+        with allure.step("Строгая проверка не находит название на другом алфавите"):
+            assert not match_variants(titles, ["Гарри Поттер"])
+
+        with allure.step("Совпадение по транслитерации определяется отдельно"):
+            assert classify_match(titles, ["Гарри Поттер"]) == MATCH_PHONETIC
+            assert classify_match(titles, ["harry potter"]) == MATCH_EXACT
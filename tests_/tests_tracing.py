@@ -0,0 +1,50 @@
+import pytest
+import allure
+from selenium.webdriver.remote.webelement import WebElement
+from UI import element_cache
+from UI.cart_page import CART_INDICATOR, CartPage
+from UI.tracing import CommandTracer, TracingWebDriver
+
+
+class FakeDriver:
+    """Веб-драйвер без браузера: одна страница с индикатором корзины, показывающим 3."""
+
+    def execute_script(self, script, *args):
+        return ["http://127.0.0.1:8000/", 1.0]
+
+    def find_elements(self, by, value):
+        return [WebElement(self, "indicator")] if (by, value) == CART_INDICATOR else []
+
+    def execute(self, command, params=None):
+        return {"value": "3"}
+
+
+@pytest.mark.positive
+@allure.epic("Интернет-магазин «Читай-город»")
+@allure.feature("Тестовые сценарии UI")
+@allure.severity("NORMAL")
+@allure.suite("UI: Трассировка команд WebDriver")
+class TestCommandTracing():
+    """
+    Тест-кейс проверяет, что команды элементов из кэша засчитываются методу page-объекта
+    и записываются под названиями команд WebDriver.
+    """
+
+    @allure.story("Трассировка команд")
+    @allure.title("Проверка метода page-объекта и названий команд при работе через ElementCache")
+    def test_cached_element_commands_credited_to_page_object(self, monkeypatch):
+        monkeypatch.setattr(element_cache, "stats", {})
+        command_tracer = CommandTracer()
+        cart = CartPage(TracingWebDriver(FakeDriver(), command_tracer))
+
+        with allure.step("Чтение индикатора корзины через кэш элементов"):
+            assert cart.get_indicator_value() == 3
+
+        with allure.step("Проверка, что все команды засчитаны CartPage.get_indicator_value"):
+            methods = {f"{record['page_object']}.{record['method']}" for record in command_tracer.records}
+            assert methods == {"CartPage.get_indicator_value"}
+
+        with allure.step("Проверка, что записаны команды WebDriver, а не execute"):
+            commands = [record["command"] for record in command_tracer.records]
+            assert "execute" not in commands
+            assert "getElementText" in commands
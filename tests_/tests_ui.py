@@ -46,14 +46,17 @@ class TestPositive:
         self.cart = cart
         self.product_dictionary = product_dictionary
 
+    @pytest.mark.serial("account")
     @allure.story("Функциональность авторизации")
     @allure.title("Проверка авторизации пользователя")
-    def test_login_with(self):
+    def test_login_with(self, storage_state):
         autorizarition = self.authorization.login_with()
 
         with allure.step("Проверка корректного отображения имени пользователя"):
             assert autorizarition, "Ожидаемое имя пользователя не отобразилось"
 
+        storage_state.save()
+
     @allure.story("Функциональность навигации")
     @allure.title("Проверка перехода в личный профиль")
     def test_go_profile(self, add_cookies):
@@ -91,14 +94,9 @@ class TestPositive:
     def test_go_main(self, add_cookies):
         urls = []
 
-        self.navigation.go_profile()
-        urls.append(self.navigation.go_main())
-        self.navigation.go_orders()
-        urls.append(self.navigation.go_main())
-        self.navigation.go_bookmarks()
-        urls.append(self.navigation.go_main())
-        self.navigation.go_cart()
-        urls.append(self.navigation.go_main())
+        for section in ("profile", "orders", "bookmarks", "cart"):
+            self.navigation.open_section(section)
+            urls.append(self.navigation.go_main())
 
         with allure.step("Проверка корректности URL главной страницы"):
             assert all(
@@ -113,26 +111,27 @@ class TestPositive:
         self.search.search_products(title_1)
         self.search.validate_search_results([title_1, title_2])
 
-        self.browser.refresh()
-
     @allure.story("Верификация данных о товарах")
     @allure.title("Сравнение названий товаров из результатов поиска с названиями на их страницах")
     def test_compare_search(self):
         title_1, _ = random.choice(list(self.product_dictionary.items()))
 
-        self.search.search_products(title_1)
+        self.search.open_search_results(title_1)
         self.search.compare_search_and_product_titles(5)
 
-        self.browser.get(base_url)
+    @allure.story("Верификация данных о товарах")
+    @allure.title("Параллельное сравнение названий товаров из результатов поиска с названиями на их страницах")
+    def test_compare_search_concurrently(self):
+        title_1, _ = random.choice(list(self.product_dictionary.items()))
 
+        self.search.open_search_results(title_1)
+        self.search.compare_search_and_product_titles_concurrently(50)
+
+    @pytest.mark.serial("cart")
     @allure.story("Функциональность корзины")
     @allure.title("Проверка очистки корзины")
-    def test_clear_cart(self):
-        title_1, _ = random.choice(list(self.product_dictionary.items()))
-        count = 5
-        self.search.search_products(title_1)
-        self.cart.add_products_to_cart(count)
-        self.navigation.go_cart()
+    def test_clear_cart(self, cart_with_products):
+        cart_with_products(5)
         self.cart.clear_cart()
         self.browser.refresh()
 
@@ -141,13 +140,14 @@ class TestPositive:
         with allure.step("Проверка значения индикатора после очистки"):
             assert self.cart.get_indicator_value() == 0
 
+    @pytest.mark.serial("cart")
     @allure.story("Функциональность корзины")
     @allure.title("Проверка добавления товаров в корзину из результатов поиска")
     def test_add_products_to_cart(self, api_clear_cart):
         title_1, _ = random.choice(list(self.product_dictionary.items()))
         count = 5
 
-        self.search.search_products(title_1)
+        self.search.open_search_results(title_1)
         self.cart.add_products_to_cart(count)
         self.navigation.go_cart()
 
@@ -158,14 +158,11 @@ class TestPositive:
 
         self.cart.clear_cart()
 
+    @pytest.mark.serial("cart")
     @allure.story("Функциональность корзины")
     @allure.title("Проверка соответствия итоговой суммы в корзине и на этапе заказа")
-    def test_total_amount(self, add_cookies):
-        title_1, _ = random.choice(list(self.product_dictionary.items()))
-
-        self.search.search_products(title_1)
-        self.cart.add_products_to_cart(5)
-        self.navigation.go_cart()
+    def test_total_amount(self, cart_with_products):
+        cart_with_products(5)
         amount_cart = self.cart.total_amount_cart()
         self.cart.go_checkout()
         amount_order = self.cart.total_amount_order()
@@ -196,6 +193,7 @@ class TestNegative:
             navigation,
             search,
             cart,
+            state_reset,
             product_dictionary):
         """
         Инициализирует объекты для тестирования.
@@ -204,25 +202,26 @@ class TestNegative:
         :param navigation: Объект для навигации.
         :param search: Объект страницы поиска.
         :param cart: Объект страницы корзины.
+        :param state_reset: Объект для сброса состояния браузера.
         :param product_dictionary: Данные для проверки поиска
         """
         self.browser = browser
         self.navigation = navigation
         self.search = search
         self.cart = cart
+        self.state_reset = state_reset
         self.product_dictionary = product_dictionary
 
     @allure.story("Функциональность навигации")
     @allure.title("Проверка перехода неавторизованного пользователя в разделы, которые требуют авторизации")
     def test_go_section_unauth(self):
-        self.browser.delete_all_cookies()
-        self.browser.refresh()
+        self.state_reset.reset_auth()
         go_profile = self.navigation.go_section_unauth("profile")
-        self.browser.refresh()
+        self.state_reset.close_auth_modal()
         go_orders = self.navigation.go_section_unauth("orders")
-        self.browser.refresh()
+        self.state_reset.close_auth_modal()
         go_bookmarks = self.navigation.go_section_unauth("bookmarks")
-        self.browser.refresh()
+        self.state_reset.close_auth_modal()
 
         with allure.step("Проверка отображения модального окна аутентификации при переходе в профиль"):
             assert go_profile, "Модальное окно аутентификации не отобразилось."
@@ -236,11 +235,10 @@ class TestNegative:
     @allure.story("Функциональность корзины")
     @allure.title("Проверка перехода неавторизованного пользователя к процессу оформления заказа")
     def test_go_checkout_unauth(self):
-        self.browser.delete_all_cookies()
-        self.browser.refresh()
+        self.state_reset.reset_auth(reload_if_stale=False)
         title_1, _ = random.choice(list(self.product_dictionary.items()))
 
-        self.search.search_products(title_1)
+        self.search.open_search_results(title_1)
         self.cart.add_products_to_cart(5)
         self.navigation.go_cart()
 